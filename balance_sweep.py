@@ -0,0 +1,170 @@
+"""
+COMP 163 - Project 3: Quest Chronicles
+Balance Sweep Module
+
+This module sweeps every character class, level and enemy type through
+the battle simulator and collects win rates. The grid is split into
+shards and run across a multiprocessing pool.
+
+Every grid cell gets its own random seed built from the sweep seed and
+the cell's class, level and enemy, so results are the same no matter how
+many workers or shards are used.
+"""
+
+import os
+import csv
+import multiprocessing
+
+from character_manager import create_character_at_level
+from battle_simulator import ENEMY_ROSTER, run_battles, special_policy
+from rng import GameRNG
+
+CHARACTER_CLASSES = ["Warrior", "Mage", "Rogue", "Cleric"]
+MAX_LEVEL = 50
+
+# Columns written to the results table
+RESULT_COLUMNS = [
+    "class", "level", "enemy", "battles", "wins", "losses",
+    "escapes", "timeouts", "win_rate", "mean_turns"
+]
+
+# ============================================================================
+# GRID AND SHARDS
+# ============================================================================
+
+def build_grid(classes=None, levels=None, enemies=None): # every (class, level, enemy) combination
+    """
+    Build the list of grid cells to sweep
+
+    Defaults: all four classes, levels 1..MAX_LEVEL, the goblin/orc/dragon roster
+
+    Returns: List of (class_name, level, enemy_type) tuples in a fixed order
+    """
+    if classes is None:
+        classes = CHARACTER_CLASSES
+    if levels is None:
+        levels = range(1, MAX_LEVEL + 1)
+    if enemies is None:
+        enemies = ENEMY_ROSTER
+    return [
+        (class_name, level, enemy_type)
+        for class_name in classes
+        for level in levels
+        for enemy_type in enemies
+    ]
+
+def split_shards(grid, shard_size): # splits the grid into equal chunks
+    """
+    Split grid cells into shards of at most shard_size cells
+
+    Returns: List of lists of grid cells
+    """
+    if shard_size < 1:
+        raise ValueError("shard_size must be at least 1")
+    return [grid[start:start + shard_size] for start in range(0, len(grid), shard_size)]
+
+def cell_seed(seed, class_name, level, enemy_type): # seed for one grid cell
+    """
+    Build the random seed for one grid cell
+
+    String seeds are hashed the same way in every process, so a cell always
+    gets the same random numbers no matter which worker runs it.
+    """
+    return f"{seed}:{class_name}:{level}:{enemy_type}"
+
+# ============================================================================
+# WORKERS
+# ============================================================================
+
+def run_shard(task): # runs every cell in one shard (called inside a worker)
+    """
+    Run all battles for one shard
+
+    Args:
+        task: Tuple (cells, battles, policy, seed)
+
+    Returns: List of result row dictionaries, one per cell
+    """
+    cells, battles, policy, seed = task
+    rows = []
+    for class_name, level, enemy_type in cells:
+        rng = GameRNG(cell_seed(seed, class_name, level, enemy_type))
+        character = create_character_at_level(class_name, class_name, level)
+        stats = run_battles(character, enemy_type, battles, policy, rng)
+        total_turns = sum(turns * count for turns, count in stats['turns_histogram'].items())
+        rows.append({
+            "class": class_name,
+            "level": level,
+            "enemy": enemy_type,
+            "battles": stats['battles'],
+            "wins": stats['wins'],
+            "losses": stats['losses'],
+            "escapes": stats['escapes'],
+            "timeouts": stats['timeouts'],
+            "win_rate": round(stats['win_rate'], 4),
+            "mean_turns": round(total_turns / stats['battles'], 2) if stats['battles'] else 0.0
+        })
+    return rows
+
+def run_sweep(battles=1000, policy=special_policy, seed=0, workers=None,
+              shard_size=10, classes=None, levels=None, enemies=None): # runs the whole grid
+    """
+    Run a balance sweep over classes x levels x enemies
+
+    Args:
+        battles: Battles per grid cell
+        policy: Module-level action policy (must be picklable)
+        seed: Sweep seed; the same seed always gives the same table
+        workers: Number of worker processes (None = one per CPU,
+                 1 = run in this process without a pool)
+        shard_size: Grid cells handed to a worker at a time
+        classes, levels, enemies: Optional subsets of the grid
+
+    Returns: List of result row dictionaries in grid order
+    """
+    grid = build_grid(classes, levels, enemies)
+    tasks = [(cells, battles, policy, seed) for cells in split_shards(grid, shard_size)]
+    if workers is None:
+        workers = os.cpu_count() or 1
+
+    if workers == 1:
+        shard_results = [run_shard(task) for task in tasks]
+    else:
+        with multiprocessing.Pool(workers) as pool:
+            shard_results = pool.map(run_shard, tasks, chunksize=1)
+    return [row for shard in shard_results for row in shard]
+
+# ============================================================================
+# RESULTS TABLE
+# ============================================================================
+
+def write_results(rows, filename="data/balance_sweep.csv"): # writes the results table
+    """
+    Write sweep results as a CSV table
+
+    Returns: True if successful
+    Raises: PermissionError, IOError (let them propagate)
+    """
+    directory = os.path.dirname(filename)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    with open(filename, "w", newline="") as file:
+        writer = csv.DictWriter(file, fieldnames=RESULT_COLUMNS)
+        writer.writeheader()
+        writer.writerows(rows)
+    return True
+
+# ============================================================================
+# TESTING
+# ============================================================================
+
+if __name__ == "__main__":
+    print("=== BALANCE SWEEP TEST ===")
+
+    import time
+
+    start = time.perf_counter()
+    results = run_sweep(battles=1000, seed=163)
+    elapsed = time.perf_counter() - start
+    write_results(results)
+    print(f"Swept {len(results)} cells in {elapsed:.2f}s, wrote data/balance_sweep.csv")
@@ -0,0 +1,188 @@
+"""
+COMP 163 - Project 3: Quest Chronicles
+Battle Log Module
+
+This module turns battle actions into structured BattleEvents and sends
+them to a sink: printed for the player (PrintSink), kept in memory
+(RingBufferSink), written to a JSON-lines file (JsonLinesSink), or
+dropped (NullSink). Battles given a NullSink don't build events at all, so
+simulations pay nothing for logging.
+
+Every sink has emit(event), flush() and close(), and an enabled flag
+(False only for NullSink).
+"""
+
+import json
+from collections import deque, namedtuple
+
+# One battle action.
+#   turn: Turn number
+#   actor: 'player' or 'enemy'
+#   action: 'attack', 'special', 'escape', 'escape_failed' or 'invalid'
+#   damage: Health the action took from the target (0 if none)
+#   hp_after: Target's health after the action (the actor's own health
+#             for actions without a target, like escaping)
+#   message: Text shown to the player
+BattleEvent = namedtuple("BattleEvent", ["turn", "actor", "action", "damage", "hp_after", "message"])
+
+# ============================================================================
+# SINKS
+# ============================================================================
+
+class NullSink: # drops every event
+    """Sink that ignores events; battles skip building events for it"""
+
+    enabled = False
+
+    def emit(self, event):
+        """Ignore event"""
+
+    def flush(self):
+        """Nothing to flush"""
+
+    def close(self):
+        """Nothing to close"""
+
+class PrintSink: # shows events to the player
+    """
+    Sink that shows each event's message as it happens
+
+    display is the function that shows a message (combat_system passes
+    display_battle_log; default print).
+    """
+
+    enabled = True
+
+    def __init__(self, display=print):
+        self.display = display
+
+    def emit(self, event):
+        """Show the event's message"""
+        self.display(event.message)
+
+    def flush(self):
+        """Nothing to flush"""
+
+    def close(self):
+        """Nothing to close"""
+
+class RingBufferSink: # keeps the most recent events in memory
+    """
+    Sink that keeps the last capacity events in memory (older events are
+    dropped as new ones arrive)
+    """
+
+    enabled = True
+
+    def __init__(self, capacity=1000):
+        self.buffer = deque(maxlen=capacity)
+        self.emit = self.buffer.append # one C call per event
+
+    def events(self): # events in the buffer, oldest first
+        """Return the buffered events, oldest first"""
+        return list(self.buffer)
+
+    def clear(self):
+        """Drop every buffered event"""
+        self.buffer.clear()
+
+    def flush(self):
+        """Nothing to flush"""
+
+    def close(self):
+        """Nothing to close"""
+
+class JsonLinesSink: # buffered JSON-lines file writer
+    """
+    Sink that writes events to a file, one JSON object per line
+
+    Events are kept in a buffer and written buffer_size at a time, so a
+    battle doesn't do a file write per action. Call close() (or use the
+    sink in a with block) to write what is left.
+
+    Raises: OSError if the file can't be opened or written
+    """
+
+    enabled = True
+
+    def __init__(self, filename, buffer_size=1000, mode="a"):
+        self.filename = filename
+        self.buffer_size = buffer_size
+        self.buffer = []
+        self.file = open(filename, mode, encoding="utf-8")
+
+    def emit(self, event):
+        """Buffer event, writing the buffer when it is full"""
+        self.buffer.append(event)
+        if len(self.buffer) >= self.buffer_size:
+            self.flush()
+
+    def flush(self):
+        """Write every buffered event to the file"""
+        if self.buffer:
+            fields = BattleEvent._fields
+            self.file.write("".join(
+                json.dumps(dict(zip(fields, event))) + "\n" for event in self.buffer
+            ))
+            self.buffer.clear()
+        self.file.flush()
+
+    def close(self):
+        """Write what is left and close the file"""
+        if not self.file.closed:
+            self.flush()
+            self.file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+class FanOutSink: # sends events to several sinks
+    """Sink that passes every event to each of several sinks"""
+
+    def __init__(self, *sinks):
+        self.sinks = [sink for sink in sinks if sink.enabled]
+        self.enabled = bool(self.sinks)
+
+    def emit(self, event):
+        """Send event to every sink"""
+        for sink in self.sinks:
+            sink.emit(event)
+
+    def flush(self):
+        """Flush every sink"""
+        for sink in self.sinks:
+            sink.flush()
+
+    def close(self):
+        """Close every sink"""
+        for sink in self.sinks:
+            sink.close()
+
+def read_events(filename): # loads a JSON-lines battle log
+    """
+    Read the events written by a JsonLinesSink
+
+    Returns: List of BattleEvents in the order they were written
+    """
+    with open(filename, "r", encoding="utf-8") as file:
+        return [BattleEvent(**json.loads(line)) for line in file if line.strip()]
+
+# Shared sink for battles that don't log
+NULL_SINK = NullSink()
+
+# ============================================================================
+# TESTING
+# ============================================================================
+
+if __name__ == "__main__":
+    print("=== BATTLE LOG TEST ===")
+
+    ring = RingBufferSink(capacity=2)
+    sink = FanOutSink(ring, PrintSink())
+    for turn in range(1, 4):
+        sink.emit(BattleEvent(turn, "player", "attack", 10, 50 - 10 * turn,
+                              f"Turn {turn}: you hit for 10"))
+    print(f"Ring buffer kept: {[event.turn for event in ring.events()]}")
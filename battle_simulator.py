@@ -0,0 +1,323 @@
+"""
+COMP 163 - Project 3: Quest Chronicles
+Battle Simulator Module
+
+This module runs battles without any input() or print() calls so that
+thousands of fights can be simulated for balance testing.
+"""
+
+from custom_exceptions import (
+    CombatNotActiveError,
+    CharacterDeadError,
+    AbilityOnCooldownError
+)
+from combat_system import (
+    SimpleBattle,
+    create_enemy,
+    use_special_ability
+)
+from battle_log import NULL_SINK
+
+# Actions a policy can choose on the player's turn
+ATTACK = "attack"
+SPECIAL = "special"
+RUN = "run"
+
+# Enemy types every simulation roster covers
+ENEMY_ROSTER = ["goblin", "orc", "dragon"]
+
+# Safety limit so a battle where nobody can win still ends
+MAX_TURNS = 1000
+
+# ============================================================================
+# ACTION POLICIES
+# ============================================================================
+
+def attack_policy(battle): # always uses a basic attack
+    """Policy that always chooses a basic attack"""
+    return ATTACK
+
+def special_policy(battle): # always uses the class special ability
+    """Policy that always chooses the class special ability"""
+    return SPECIAL
+
+def cautious_policy(battle): # attacks, but tries to run when health is low
+    """
+    Policy that attacks until health drops below 25% of max_health,
+    then tries to run away
+    """
+    character = battle.character
+    if character['health'] * 4 < character['max_health']:
+        return RUN
+    return ATTACK
+
+def is_deterministic(character, policy): # checks if a battle can never vary
+    """
+    Check if battles with this character and policy always play out the same
+
+    Basic attacks never use randomness, and special abilities only do for
+    the Rogue's Critical Strike. Custom policies are assumed to be random.
+
+    Returns: True if every battle will have the same result
+    """
+    if policy is attack_policy:
+        return True
+    if policy is special_policy:
+        return str(character.get('class', '')).lower() != 'rogue'
+    return False
+
+# ============================================================================
+# HEADLESS BATTLE
+# ============================================================================
+
+class HeadlessBattle(SimpleBattle): # non-interactive version of SimpleBattle
+    """
+    Non-interactive battle driven by an action policy
+
+    Reuses SimpleBattle's calculate_damage, apply_damage and
+    check_battle_end, but never reads input or prints.
+    A policy is any function that takes the battle and returns
+    ATTACK, SPECIAL or RUN.
+
+    Battle events are dropped (NULL_SINK) unless a sink is passed in, so
+    simulations only pay for logging when they ask for it.
+    """
+
+    def __init__(self, character, enemy, policy=attack_policy, rng=None, sink=None):
+        """Initialize battle with character, enemy, action policy, GameRNG and event sink"""
+        super().__init__(character, enemy, rng, NULL_SINK if sink is None else sink)
+        self.policy = policy
+        self.escaped = False
+        self.damage_dealt = 0
+        self.damage_taken = 0
+        # Stats do not change during a fight, so basic attack damage
+        # only needs to be calculated once per battle
+        self.player_damage = self.calculate_damage(character, enemy)
+        self.enemy_damage = self.calculate_damage(enemy, character)
+
+    def reset(self, character_health, enemy_health): # reuse this battle for another fight
+        """
+        Restore both fighters' health so the battle can be run again
+        without allocating new objects
+        """
+        self.character['health'] = character_health
+        self.enemy['health'] = enemy_health
+        self.combat_active = True
+        self.turn_counter = 1
+        self.escaped = False
+        self.damage_dealt = 0
+        self.damage_taken = 0
+        # Pick up equipment or level changes made between fights
+        self.player_damage = self.calculate_damage(self.character, self.enemy)
+        self.enemy_damage = self.calculate_damage(self.enemy, self.character)
+
+    def player_turn(self): # runs the policy's chosen action
+        """
+        Handle player's turn using the policy instead of input()
+
+        Raises: CombatNotActiveError if called outside of battle
+        """
+        if not self.combat_active:
+            raise CombatNotActiveError()
+        enemy = self.enemy
+        health_before = enemy['health']
+        action = self.policy(self)
+        message = None
+        if action == ATTACK:
+            self.apply_damage(enemy, self.player_damage)
+        elif action == SPECIAL:
+            try:
+                message = use_special_ability(self.character, enemy, self.rng)
+            except AbilityOnCooldownError as error:
+                message = str(error)
+        elif action == RUN:
+            if self.attempt_escape():
+                self.escaped = True
+                self.combat_active = False
+        damage = health_before - enemy['health']
+        self.damage_dealt += damage
+        if self.emit is not None:
+            self.log_player_action(action, damage, message)
+
+    def enemy_turn(self): # enemy always attacks, silently
+        """
+        Handle enemy's turn without printing
+
+        Raises: CombatNotActiveError if called outside of battle
+        """
+        if not self.combat_active:
+            raise CombatNotActiveError()
+        if not self.check_battle_end():
+            character = self.character
+            health_before = character['health']
+            self.apply_damage(character, self.enemy_damage)
+            self.damage_taken += health_before - character['health']
+            if self.emit is not None:
+                self.log_event("enemy", "attack", self.enemy_damage, character,
+                               f"The {self.enemy['name']} attacks you for {self.enemy_damage} damage!")
+
+    def log_player_action(self, action, damage, message): # event for a policy's action
+        """Send the event for the player's action this turn (same as SimpleBattle's)"""
+        if action == ATTACK:
+            self.log_event("player", "attack", damage, self.enemy,
+                           f"You attack the {self.enemy['name']} for {damage} damage!")
+        elif action == SPECIAL:
+            self.log_event("player", "special", damage, self.enemy, message)
+        elif action == RUN and self.escaped:
+            self.log_event("player", "escape", 0, self.character,
+                           "You successfully escaped the battle!")
+        elif action == RUN:
+            self.log_event("player", "escape_failed", 0, self.character,
+                           "Escape failed! The battle continues.")
+        else:
+            self.log_event("player", "invalid", 0, self.character,
+                           "Invalid choice! You lose your turn.")
+
+    def run(self): # plays the battle to the end
+        """
+        Run the battle until someone wins, the player escapes,
+        or MAX_TURNS is reached
+
+        Returns: Dictionary with battle results:
+                {'winner': 'player'|'enemy'|'escaped'|None, 'turns': int,
+                 'damage_dealt': int, 'damage_taken': int, 'seed': rng seed}
+
+        Raises: CharacterDeadError if character is already dead
+        """
+        winner = self.play()
+        return {
+            'winner': winner,
+            'turns': self.turn_counter,
+            'damage_dealt': self.damage_dealt,
+            'damage_taken': self.damage_taken,
+            'seed': self.seed
+        }
+
+    def play(self): # plays the battle and returns only the winner
+        """
+        Run the battle to the end without building a result dictionary
+
+        Returns: 'player', 'enemy', 'escaped', or None if MAX_TURNS was reached
+        Raises: CharacterDeadError if character is already dead
+        """
+        if int(self.character['health']) <= 0:
+            raise CharacterDeadError()
+        player_turn = self.player_turn
+        enemy_turn = self.enemy_turn
+        check_battle_end = self.check_battle_end
+        winner = None
+        while True:
+            player_turn()
+            if self.escaped:
+                winner = 'escaped'
+                break
+            enemy_turn()
+            winner = check_battle_end()
+            if winner or self.turn_counter >= MAX_TURNS:
+                break
+            self.turn_counter += 1
+        self.combat_active = False
+        return winner
+
+# ============================================================================
+# BATCH SIMULATION
+# ============================================================================
+
+def run_battles(character, enemy, count, policy=attack_policy, rng=None, sink=None): # runs many independent battles
+    """
+    Run many independent battles between copies of a character and enemy
+
+    Args:
+        character: Character dictionary (not modified)
+        enemy: Enemy dictionary or enemy type name (e.g. "goblin")
+        count: Number of battles to run
+        policy: Function choosing the player's action each turn
+        rng: GameRNG shared by the battles, one after another (default: a
+             new one); the same seed always gives the same results
+        sink: Optional battle_log sink for every battle's events (default:
+              events are dropped)
+
+    Every battle starts from the character's and enemy's current health.
+
+    Returns: Dictionary with aggregated results:
+            {'battles', 'simulated', 'wins', 'losses', 'escapes', 'timeouts',
+             'win_rate', 'turns_histogram', 'damage_dealt_histogram',
+             'damage_taken_histogram', 'seed'}
+            Histograms map a value to how many battles produced it.
+            'simulated' is how many battles were actually played (1 for a
+            deterministic matchup, which is counted 'battles' times).
+    Raises: CharacterDeadError if character is already dead
+    """
+    if isinstance(enemy, str):
+        enemy = create_enemy(enemy)
+    fighter = dict(character)
+    opponent = dict(enemy)
+    fighter['health'] = int(fighter['health'])
+    opponent['health'] = int(opponent['health'])
+    character_health = fighter['health']
+    enemy_health = opponent['health']
+    battle = HeadlessBattle(fighter, opponent, policy, rng, sink)
+
+    # A battle with no random choices plays out the same way every time,
+    # so it only needs to be simulated once and counted count times
+    # (unless its events are being logged)
+    if is_deterministic(fighter, policy) and battle.emit is None:
+        simulated, weight = min(count, 1), count
+    else:
+        simulated, weight = count, 1
+
+    outcomes = {'player': 0, 'enemy': 0, 'escaped': 0, None: 0}
+    turns_histogram = {}
+    dealt_histogram = {}
+    taken_histogram = {}
+    for _ in range(simulated):
+        battle.reset(character_health, enemy_health)
+        outcomes[battle.play()] += weight
+        turns = battle.turn_counter
+        dealt = battle.damage_dealt
+        taken = battle.damage_taken
+        turns_histogram[turns] = turns_histogram.get(turns, 0) + weight
+        dealt_histogram[dealt] = dealt_histogram.get(dealt, 0) + weight
+        taken_histogram[taken] = taken_histogram.get(taken, 0) + weight
+
+    return {
+        'battles': count,
+        'simulated': simulated,
+        'wins': outcomes['player'],
+        'losses': outcomes['enemy'],
+        'escapes': outcomes['escaped'],
+        'timeouts': outcomes[None],
+        'win_rate': outcomes['player'] / count if count else 0.0,
+        'turns_histogram': turns_histogram,
+        'damage_dealt_histogram': dealt_histogram,
+        'damage_taken_histogram': taken_histogram,
+        'seed': battle.seed
+    }
+
+def run_roster(character, count, policy=attack_policy, roster=None): # runs battles against every enemy type
+    """
+    Run count battles against each enemy type in the roster
+
+    Returns: Dictionary of {enemy_type: run_battles result}
+    """
+    if roster is None:
+        roster = ENEMY_ROSTER
+    return {
+        enemy_type: run_battles(character, enemy_type, count, policy)
+        for enemy_type in roster
+    }
+
+# ============================================================================
+# TESTING
+# ============================================================================
+
+if __name__ == "__main__":
+    print("=== BATTLE SIMULATOR TEST ===")
+
+    from character_manager import create_character
+
+    for class_name in ["Warrior", "Mage", "Rogue", "Cleric"]:
+        hero = create_character("SimHero", class_name)
+        results = run_roster(hero, 1000, special_policy)
+        for enemy_type, stats in results.items():
+            print(f"{class_name} vs {enemy_type}: win rate {stats['win_rate']:.2%}")
@@ -0,0 +1,37 @@
+"""
+Benchmark: Batched Saves
+Compares saving characters one at a time with save_many
+"""
+
+import sys
+import os
+import time
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import character_manager
+
+def bench(label, save_function, count):
+    """Time saving count characters into a fresh directory"""
+    chars = [character_manager.create_character(f"Autosave{i}", "Warrior") for i in range(count)]
+    with tempfile.TemporaryDirectory() as save_directory:
+        start = time.perf_counter()
+        save_function(chars, save_directory)
+        elapsed = time.perf_counter() - start
+    print(f"{label:<22} {count:>6} saves  {count / elapsed:>10,.0f} saves/s")
+
+def save_one_by_one(chars, save_directory):
+    """Save each character with its own fsync"""
+    for char in chars:
+        character_manager.save_character(char, save_directory)
+
+def save_batched(chars, save_directory):
+    """Save every character, syncing the directory once"""
+    character_manager.save_many(chars, save_directory)
+
+if __name__ == "__main__":
+    print("=== BATCHED SAVE BENCHMARK ===")
+    for count in [100, 1000, 5000]:
+        bench("save_character loop", save_one_by_one, count)
+        bench("save_many", save_batched, count)
@@ -0,0 +1,47 @@
+"""
+Benchmark: Battle Event Sinks
+Runs the same simulated battles with events dropped, kept in a ring
+buffer, written to a JSON-lines file, and printed (to a null device),
+and reports battles per second for each
+"""
+
+import sys
+import os
+import contextlib
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import battle_simulator
+import character_manager
+from battle_log import JsonLinesSink, NullSink, PrintSink, RingBufferSink
+from combat_system import display_battle_log
+from rng import GameRNG
+
+BATTLES = 20000
+
+def bench(sink):
+    """Run BATTLES Rogue special-ability battles with one sink; returns battles/s"""
+    rogue = character_manager.create_character("BenchRogue", "Rogue")
+    start = time.perf_counter()
+    battle_simulator.run_battles(rogue, "orc", BATTLES, battle_simulator.special_policy,
+                                 GameRNG(163), sink)
+    if sink is not None:
+        sink.close()
+    return BATTLES / (time.perf_counter() - start)
+
+def report(label, rate):
+    """Print a throughput line"""
+    print(f"{label:<26} {rate:>12,.0f} battles/s")
+
+if __name__ == "__main__":
+    print("=== BATTLE LOG BENCHMARK ===")
+    report("no sink (default)", bench(None))
+    report("NullSink", bench(NullSink()))
+    report("RingBufferSink(10000)", bench(RingBufferSink(10000)))
+    with tempfile.TemporaryDirectory() as directory:
+        report("JsonLinesSink", bench(JsonLinesSink(os.path.join(directory, "battles.jsonl"))))
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        rate = bench(PrintSink(display_battle_log))
+    report("PrintSink (to devnull)", rate)
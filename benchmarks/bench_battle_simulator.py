@@ -0,0 +1,57 @@
+"""
+Benchmark: Headless Battle Simulator
+Measures battles per second for every class against the enemy roster
+
+run_battles plays a deterministic matchup (no random choices) once and
+counts it BATTLES times, so timing it says nothing about throughput.
+Those matchups are timed here by playing DETERMINISTIC_BATTLES identical
+battles with HeadlessBattle directly and are marked "deterministic"; the
+rest are timed through run_battles. Either way the rate is battles
+actually played per second. Matchups that stall until MAX_TURNS (e.g. a
+Cleric healing through a goblin's attacks) show up as very slow.
+"""
+
+import sys
+import os
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import battle_simulator
+import character_manager
+from combat_system import create_enemy
+from rng import GameRNG
+
+BATTLES = 100000
+DETERMINISTIC_BATTLES = 2000
+
+def play_every_battle(hero, enemy_type, policy):
+    """Play DETERMINISTIC_BATTLES battles one by one, skipping run_battles' shortcut; returns battles/s"""
+    enemy = create_enemy(enemy_type)
+    battle = battle_simulator.HeadlessBattle(dict(hero), dict(enemy), policy, GameRNG(163))
+    start = time.perf_counter()
+    for _ in range(DETERMINISTIC_BATTLES):
+        battle.reset(hero['health'], enemy['health'])
+        battle.play()
+    return DETERMINISTIC_BATTLES / (time.perf_counter() - start)
+
+def bench_roster(class_name, policy):
+    """Time played battles for one class against every roster enemy"""
+    hero = character_manager.create_character("BenchHero", class_name)
+    for enemy_type in battle_simulator.ENEMY_ROSTER:
+        start = time.perf_counter()
+        stats = battle_simulator.run_battles(hero, enemy_type, BATTLES, policy, GameRNG(163))
+        rate = BATTLES / (time.perf_counter() - start)
+        note = ""
+        if stats['simulated'] < BATTLES:
+            rate = play_every_battle(hero, enemy_type, policy)
+            note = "  (deterministic)"
+        print(f"{class_name:<8} {policy.__name__:<16} {enemy_type:<7} "
+              f"{rate:>10,.0f} battles/s  win rate {stats['win_rate']:.2%}{note}")
+
+if __name__ == "__main__":
+    print("=== BATTLE SIMULATOR BENCHMARK ===")
+    for class_name in ["Warrior", "Mage", "Rogue", "Cleric"]:
+        bench_roster(class_name, battle_simulator.attack_policy)
+        bench_roster(class_name, battle_simulator.special_policy)
+        bench_roster(class_name, battle_simulator.cautious_policy)
@@ -0,0 +1,69 @@
+"""
+Benchmark: Compiled Content Cache
+Compares parsing large content files with loading their compiled caches
+"""
+
+import sys
+import os
+import time
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import game_data
+
+def write_quests(filename, count):
+    """Write a generated quest file with count quests"""
+    with open(filename, "w", encoding="utf-8") as file:
+        for i in range(count):
+            prerequisite = f"quest_{i - 1}" if i else "NONE"
+            file.write(
+                f"QUEST_ID: quest_{i}\n"
+                f"TITLE: Generated Quest {i}\n"
+                f"DESCRIPTION: Defeat {i % 50 + 1} monsters for the village elder\n"
+                f"REWARD_XP: {50 + i % 500}\n"
+                f"REWARD_GOLD: {25 + i % 250}\n"
+                f"REQUIRED_LEVEL: {1 + i % 50}\n"
+                f"PREREQUISITE: {prerequisite}\n\n"
+            )
+
+def write_items(filename, count):
+    """Write a generated item file with count items"""
+    stats = ["health", "strength", "magic", "max_health"]
+    types = ["consumable", "weapon", "armor"]
+    with open(filename, "w", encoding="utf-8") as file:
+        for i in range(count):
+            file.write(
+                f"ITEM_ID: item_{i}\n"
+                f"NAME: Generated Item {i}\n"
+                f"TYPE: {types[i % 3]}\n"
+                f"EFFECT: {stats[i % 4]}:{i % 30 + 1}\n"
+                f"COST: {10 + i % 400}\n"
+                f"DESCRIPTION: A generated item for benchmarking\n\n"
+            )
+
+def bench(label, loader, filename):
+    """Time a parse (no cache) against a cached load"""
+    start = time.perf_counter()
+    loader(filename, use_cache=False)
+    parse_time = time.perf_counter() - start
+
+    loader(filename)  # build the cache
+    start = time.perf_counter()
+    loader(filename)
+    cache_time = time.perf_counter() - start
+
+    size = os.path.getsize(filename) / 1e6
+    print(f"{label:<7} {size:>7.1f} MB  parse {parse_time:>7.3f}s  "
+          f"cache {cache_time:>7.3f}s  ({parse_time / cache_time:.1f}x)")
+
+if __name__ == "__main__":
+    print("=== CONTENT CACHE BENCHMARK ===")
+    with tempfile.TemporaryDirectory() as directory:
+        for count in [10000, 100000]:
+            quests_file = os.path.join(directory, f"quests_{count}.txt")
+            items_file = os.path.join(directory, f"items_{count}.txt")
+            write_quests(quests_file, count)
+            write_items(items_file, count)
+            bench("quests", game_data.load_quests, quests_file)
+            bench("items", game_data.load_items, items_file)
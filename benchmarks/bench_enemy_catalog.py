@@ -0,0 +1,63 @@
+"""
+Benchmark: Enemy Catalog Encounters
+Compares per-encounter time (create_enemy and get_random_enemy_for_level
+style picks) for the three default enemies and for a catalog of
+generated enemy types
+"""
+
+import sys
+import os
+import random
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from enemy_catalog import EnemyCatalog, get_enemy_catalog
+
+ENCOUNTERS = 200000
+GENERATED_TYPES = [300, 3000]
+
+def generated_enemies(count):
+    """count enemy types with overlapping level bands and mixed weights"""
+    enemies = {}
+    for number in range(count):
+        enemy_id = f"enemy_{number}"
+        min_level = number % 50 + 1
+        enemies[enemy_id] = {
+            'enemy_id': enemy_id, 'name': f"Enemy {number}",
+            'health': 40 + number % 200, 'max_health': 40 + number % 200,
+            'strength': 5 + number % 30, 'magic': number % 20,
+            'xp_reward': 20 + number % 100, 'gold_reward': 5 + number % 50,
+            'min_level': min_level, 'max_level': min_level + number % 7,
+            'weight': 1 + number % 5
+        }
+    return enemies
+
+def bench(label, catalog):
+    """Time ENCOUNTERS level picks and type lookups"""
+    rng = random.Random(1)
+    levels = [rng.randint(1, 60) for _ in range(ENCOUNTERS)]
+    types = list(catalog.templates)
+
+    start = time.perf_counter()
+    for level in levels:
+        catalog.create_for_level(level, rng)
+    picks = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for number in range(ENCOUNTERS):
+        catalog.create(types[number % len(types)])
+    lookups = time.perf_counter() - start
+
+    print(f"{label:<22} {picks / ENCOUNTERS * 1e9:>8.0f} ns/level pick  "
+          f"{lookups / ENCOUNTERS * 1e9:>8.0f} ns/create")
+
+if __name__ == "__main__":
+    print("=== ENEMY CATALOG BENCHMARK ===")
+    bench("default (3 types)", get_enemy_catalog())
+    for count in GENERATED_TYPES:
+        start = time.perf_counter()
+        catalog = EnemyCatalog(generated_enemies(count))
+        built = time.perf_counter() - start
+        bench(f"{count} types", catalog)
+        print(f"{'':<22} built in {built * 1000:.1f} ms, {len(catalog.bands)} level bands")
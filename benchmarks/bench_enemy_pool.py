@@ -0,0 +1,65 @@
+"""
+Benchmark: Enemy Pool World Tick
+Runs an open-world tick (everyone takes an attack, the dead are removed
+and their rewards counted, replacements spawn) over a list of enemy
+dictionaries and over an EnemyPool
+"""
+
+import sys
+import os
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import combat_system
+from entities import EnemyPool
+
+ENEMIES = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+TICKS = 20
+ATTACKER_STRENGTH = 20
+
+def tick_dicts(enemies):
+    """One tick over a list of create_enemy dictionaries"""
+    survivors = []
+    xp = 0
+    for enemy in enemies:
+        damage = max(1, ATTACKER_STRENGTH - int(enemy['strength']) // 4)
+        enemy['health'] = max(0, int(enemy['health']) - damage)
+        if enemy['health'] > 0:
+            survivors.append(enemy)
+        else:
+            xp += enemy['xp_reward']
+    respawned = len(enemies) - len(survivors)
+    survivors.extend(combat_system.get_random_enemy_for_level(1) for _ in range(respawned))
+    return survivors, xp
+
+def tick_pool(pool):
+    """One tick over an EnemyPool"""
+    pool.attack_all(ATTACKER_STRENGTH)
+    reaped = pool.reap()
+    pool.spawn_many("goblin", len(reaped['slots']))
+    return reaped['xp']
+
+def run(label, setup, tick):
+    """Time TICKS ticks and report enemies processed per second"""
+    state = setup()
+    start = time.perf_counter()
+    xp = 0
+    for _ in range(TICKS):
+        state, gained = tick(state)
+        xp += gained
+    elapsed = time.perf_counter() - start
+    print(f"{label:<12} {ENEMIES * TICKS / elapsed:>14,.0f} enemies/s  "
+          f"{elapsed / TICKS * 1000:>8.1f} ms/tick  xp {xp:,}")
+
+if __name__ == "__main__":
+    print(f"=== ENEMY POOL BENCHMARK ({ENEMIES:,} enemies, {TICKS} ticks) ===")
+    run("dicts", lambda: [combat_system.create_enemy("goblin") for _ in range(ENEMIES)],
+        tick_dicts)
+
+    def setup_pool():
+        pool = EnemyPool()
+        pool.spawn_many("goblin", ENEMIES)
+        return pool
+
+    run("EnemyPool", setup_pool, lambda pool: (pool, tick_pool(pool)))
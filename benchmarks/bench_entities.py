@@ -0,0 +1,67 @@
+"""
+Benchmark: Enemy Records vs Enemy Dictionaries
+Measures the memory used by one million live enemies and how fast a
+damage pass over all of them runs, for create_enemy dictionaries and
+slotted Enemy records
+"""
+
+import sys
+import os
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import combat_system
+from entities import Enemy
+
+ENEMIES = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+ENEMY_TYPES = ["goblin", "orc", "dragon"]
+
+def make_dicts():
+    """ENEMIES enemy dictionaries from create_enemy"""
+    return [combat_system.create_enemy(ENEMY_TYPES[i % 3]) for i in range(ENEMIES)]
+
+def make_records():
+    """ENEMIES Enemy records built from the same templates"""
+    templates = [combat_system.create_enemy(enemy_type) for enemy_type in ENEMY_TYPES]
+    return [Enemy.from_dict(templates[i % 3]) for i in range(ENEMIES)]
+
+def measure(label, build):
+    """Report the memory and build time for one million enemies"""
+    tracemalloc.start()
+    start = time.perf_counter()
+    enemies = build()
+    elapsed = time.perf_counter() - start
+    used, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"{label:<22} {used / 2 ** 20:>8.1f} MiB  {used / ENEMIES:>6.0f} B/enemy  "
+          f"built in {elapsed:.2f}s")
+    return enemies
+
+def damage_pass(label, enemies, damage):
+    """Apply damage to every enemy and time it"""
+    start = time.perf_counter()
+    damage(enemies)
+    elapsed = time.perf_counter() - start
+    print(f"{label:<34} {ENEMIES / elapsed:>14,.0f} enemies/s")
+
+def damage_by_key(enemies):
+    """The existing apply_damage style: int() on every read"""
+    for enemy in enemies:
+        enemy['health'] = max(0, int(enemy['health']) - 5)
+
+def damage_by_attribute(enemies):
+    """Typed records: plain attribute reads, no int()"""
+    for enemy in enemies:
+        health = enemy.health - 5
+        enemy.health = health if health > 0 else 0
+
+if __name__ == "__main__":
+    print(f"=== ENTITIES BENCHMARK ({ENEMIES:,} enemies) ===")
+    dicts = measure("dict (create_enemy)", make_dicts)
+    damage_pass("dict, enemy['health']", dicts, damage_by_key)
+    del dicts
+    records = measure("Enemy record", make_records)
+    damage_pass("Enemy record, enemy['health']", records, damage_by_key)
+    damage_pass("Enemy record, enemy.health", records, damage_by_attribute)
@@ -0,0 +1,73 @@
+"""
+Benchmark: Quest Catalog
+Compares get_quests_by_level's list comprehension with QuestCatalog's
+bisect indexes on a generated catalog
+"""
+
+import sys
+import os
+import time
+import random
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import quest_handler
+from quest_catalog import QuestCatalog
+
+QUESTS = 100000
+QUERIES = 200
+
+def build_catalog(count, seed=163):
+    """Generate count quests with random levels and rewards"""
+    rng = random.Random(seed)
+    return {
+        f"quest_{i}": {
+            'quest_id': f"quest_{i}",
+            'title': f"Quest {i}",
+            'description': "Generated quest",
+            'reward_xp': rng.randrange(10, 5000),
+            'reward_gold': rng.randrange(5, 2000),
+            'required_level': rng.randrange(1, 101),
+            'prerequisite': "NONE"
+        }
+        for i in range(count)
+    }
+
+def timed(label, function, queries):
+    """Run function over every query and print queries per second"""
+    start = time.perf_counter()
+    for query in queries:
+        function(*query)
+    elapsed = time.perf_counter() - start
+    print(f"{label:<32} {len(queries) / elapsed:>12,.0f} queries/s")
+    return elapsed
+
+if __name__ == "__main__":
+    print("=== QUEST CATALOG BENCHMARK ===")
+    quests = build_catalog(QUESTS)
+    rng = random.Random(1)
+    ranges = []
+    for _ in range(QUERIES):
+        low = rng.randrange(1, 100)
+        ranges.append((low, low + rng.randrange(0, 3)))
+
+    start = time.perf_counter()
+    catalog = QuestCatalog(quests)
+    print(f"Build indexes ({QUESTS:,} quests): {time.perf_counter() - start:.3f}s")
+
+    scan = timed("Level range, list comprehension",
+                 lambda low, high: quest_handler.get_quests_by_level(quests, low, high), ranges)
+    indexed = timed("Level range, catalog order",
+                    lambda low, high: catalog.by_level(low, high), ranges)
+    timed("Level range, level order", catalog.range_ids,
+          [("required_level", low, high) for low, high in ranges])
+    print(f"Speedup (catalog order): {scan / indexed:.1f}x")
+
+    timed("Top 10 by XP, sorted()",
+          lambda: sorted(quests.values(), key=lambda q: q['reward_xp'], reverse=True)[:10],
+          [()] * 20)
+    timed("Top 10 by XP, catalog", lambda: catalog.top("reward_xp", 10), [()] * QUERIES)
+    timed("Combined filter, catalog",
+          lambda low, high: catalog.query(min_level=low, max_level=high, min_xp=4000,
+                                          order_by="reward_gold", descending=True),
+          ranges)
@@ -0,0 +1,103 @@
+"""
+Benchmark: Quest Graph
+Compares get_available_quests full scans with incremental availability
+on a generated 100k-quest catalog
+"""
+
+import sys
+import os
+import time
+import random
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import quest_handler
+from quest_graph import QuestGraph
+
+QUESTS = 100000
+STEPS = 200
+
+def build_catalog(count, seed=163):
+    """Generate count quests; most have an earlier quest as prerequisite"""
+    rng = random.Random(seed)
+    quests = {}
+    for i in range(count):
+        prerequisite = f"quest_{rng.randrange(i)}" if i and rng.random() < 0.9 else "NONE"
+        quests[f"quest_{i}"] = {
+            'quest_id': f"quest_{i}",
+            'title': f"Quest {i}",
+            'description': "Generated quest",
+            'reward_xp': 50 + i % 200,
+            'reward_gold': 25 + i % 100,
+            'required_level': 1 + rng.randrange(50),
+            'prerequisite': prerequisite
+        }
+    return quests
+
+def play(quests, availability=None):
+    """Complete STEPS quests, querying available quests after each one"""
+    hero = {'level': 1, 'active_quests': [], 'completed_quests': []}
+    if availability is not None:
+        availability = availability(hero)
+    for step in range(STEPS):
+        if availability is None:
+            available = quest_handler.get_available_quests(hero, quests)
+            quest_id = available[0]['quest_id']
+        else:
+            quest_id = availability.quest_ids()[0]
+        hero['completed_quests'].append(quest_id)
+        if step % 4 == 0:
+            hero['level'] += 1
+        if availability is not None:
+            availability.quest_completed(quest_id)
+    return hero['completed_quests']
+
+if __name__ == "__main__":
+    print("=== QUEST GRAPH BENCHMARK ===")
+    quests = build_catalog(QUESTS)
+
+    start = time.perf_counter()
+    graph = QuestGraph(quests)
+    print(f"Build graph ({QUESTS:,} quests): {time.perf_counter() - start:.3f}s")
+
+    start = time.perf_counter()
+    scanned = play(quests)
+    scan_time = time.perf_counter() - start
+    print(f"Full scan:   {STEPS / scan_time:>10,.0f} queries/s")
+
+    start = time.perf_counter()
+    tracked = play(quests, graph.tracker)
+    graph_time = time.perf_counter() - start
+    print(f"Incremental: {STEPS / graph_time:>10,.0f} queries/s "
+          f"({scan_time / graph_time:.0f}x)")
+    assert scanned == tracked
+
+    # Bookkeeping alone: complete the same quests without listing them
+    start = time.perf_counter()
+    hero = {'level': 1, 'active_quests': [], 'completed_quests': []}
+    availability = graph.tracker(hero)
+    for step, quest_id in enumerate(tracked):
+        hero['completed_quests'].append(quest_id)
+        if step % 4 == 0:
+            hero['level'] += 1
+        availability.quest_completed(quest_id)
+    update_time = time.perf_counter() - start
+    print(f"Updates only: {STEPS / update_time:>9,.0f} completions/s "
+          f"({len(availability):,} quests available)")
+
+    # Prerequisite engine: one pass over the catalog, then memoized chains
+    start = time.perf_counter()
+    graph.resolve()
+    deepest = max(graph.depth, key=graph.depth.get)
+    print(f"Resolve order and depth: {time.perf_counter() - start:.3f}s "
+          f"(deepest chain {graph.depth[deepest] + 1} quests)")
+
+    start = time.perf_counter()
+    for _ in range(1000):
+        quest_handler.get_quest_prerequisite_chain(deepest, quests)
+    walk_time = time.perf_counter() - start
+    start = time.perf_counter()
+    for _ in range(1000):
+        graph.prerequisite_chain(deepest)
+    memo_time = time.perf_counter() - start
+    print(f"Deepest chain x1000: walk {walk_time:.4f}s, memoized {memo_time:.4f}s")
@@ -0,0 +1,62 @@
+"""
+Benchmark: Game RNG
+Compares the old `import random` inside the function with GameRNG draws
+(one at a time, pre-generated blocks, and draws() batches), then runs
+Rogue special-ability battles with each GameRNG mode
+"""
+
+import sys
+import os
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import battle_simulator
+import character_manager
+from rng import GameRNG
+
+DRAWS = 1000000
+BATTLES = 100000
+
+def old_roll():
+    """The old rogue_critical_strike roll"""
+    import random
+    return random.random() < 0.5
+
+def bench_draws():
+    """Time DRAWS 50% rolls each way"""
+    start = time.perf_counter()
+    for _ in range(DRAWS):
+        old_roll()
+    report("import random per roll", DRAWS, time.perf_counter() - start, "rolls")
+
+    for label, rng in [("GameRNG.random", GameRNG(163)),
+                       ("GameRNG block_size=4096", GameRNG(163, block_size=4096))]:
+        draw = rng.random
+        start = time.perf_counter()
+        for _ in range(DRAWS):
+            draw() < 0.5
+        report(label, DRAWS, time.perf_counter() - start, "rolls")
+
+    rng = GameRNG(163)
+    start = time.perf_counter()
+    rolls = [value < 0.5 for value in rng.draws(DRAWS)]
+    report("GameRNG.draws batch", len(rolls), time.perf_counter() - start, "rolls")
+
+def bench_battles():
+    """Time Rogue special-ability battles (every turn rolls a crit)"""
+    rogue = character_manager.create_character("BenchRogue", "Rogue")
+    for label, block_size in [("battles, one at a time", 0), ("battles, block_size=4096", 4096)]:
+        start = time.perf_counter()
+        battle_simulator.run_battles(rogue, "orc", BATTLES, battle_simulator.special_policy,
+                                     GameRNG(163, block_size))
+        report(label, BATTLES, time.perf_counter() - start, "battles")
+
+def report(label, count, elapsed, unit):
+    """Print a throughput line"""
+    print(f"{label:<26} {count / elapsed:>14,.0f} {unit}/s")
+
+if __name__ == "__main__":
+    print("=== RNG BENCHMARK ===")
+    bench_draws()
+    bench_battles()
@@ -0,0 +1,46 @@
+"""
+Benchmark: Save File Formats
+Compares load time and file size of the text and binary save formats
+"""
+
+import sys
+import os
+import time
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import character_manager
+import inventory_system
+
+LOADS = 2000
+
+def build_veteran(name, completed_quests):
+    """Create a character with a full inventory and many completed quests"""
+    char = character_manager.create_character(name, "Warrior")
+    char['inventory'] = [f"item_{i % 7}" for i in range(inventory_system.MAX_INVENTORY_SIZE)]
+    char['active_quests'] = [f"active_quest_{i}" for i in range(5)]
+    char['completed_quests'] = [f"completed_quest_{i:05d}" for i in range(completed_quests)]
+    return char
+
+def bench_format(char, save_format, save_directory):
+    """Save once, then time repeated loads"""
+    character_manager.save_character(char, save_directory, save_format)
+    path = character_manager.get_save_path(char['name'], save_directory)
+    size = os.path.getsize(path)
+    start = time.perf_counter()
+    for _ in range(LOADS):
+        character_manager.load_character(char['name'], save_directory)
+    elapsed = time.perf_counter() - start
+    return size, elapsed / LOADS
+
+if __name__ == "__main__":
+    print("=== SAVE FORMAT BENCHMARK ===")
+    with tempfile.TemporaryDirectory() as save_directory:
+        for completed in [0, 100, 500, 2000]:
+            char = build_veteran(f"Bench{completed}", completed)
+            for save_format in [character_manager.SAVE_FORMAT_TEXT,
+                                character_manager.SAVE_FORMAT_BINARY]:
+                size, per_load = bench_format(char, save_format, save_directory)
+                print(f"{completed:>5} quests  {save_format:<6} {size:>8,} bytes  "
+                      f"{per_load * 1e6:>8.1f} us/load")
@@ -0,0 +1,76 @@
+"""
+Benchmark: Shop Under Concurrent Purchases
+Several threads buy and sell for the same character at once; checks that
+no gold or items are lost and measures transactions per second
+"""
+
+import sys
+import os
+import time
+import threading
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import inventory_system
+from shop import Shop
+
+THREADS = 8
+ROUNDS = 20000
+ITEMS = {
+    "potion": {'item_id': "potion", 'name': "Potion", 'type': "consumable",
+               'effect': {"health": 20}, 'cost': 25},
+    "sword": {'item_id': "sword", 'name': "Sword", 'type': "weapon",
+              'effect': {"strength": 5}, 'cost': 100}
+}
+
+def make_character():
+    """A rich character with a roomy counted inventory"""
+    character = {'name': "StressTest", 'gold': 10 ** 9, 'inventory': []}
+    inventory_system.use_counted_inventory(character, stack_limit=10 ** 6)
+    return character
+
+def trade(buy, sell, character, item_id, errors):
+    """Buy then sell one item ROUNDS times, counting failed trades"""
+    for _ in range(ROUNDS):
+        try:
+            buy(character, item_id)
+            sell(character, item_id)
+        except Exception:
+            errors.append(item_id)
+
+def run(label, buy, sell):
+    """Run THREADS traders against one character and check the books"""
+    character = make_character()
+    start_gold = character['gold']
+    errors = []
+    threads = [
+        threading.Thread(target=trade, args=(buy, sell, character,
+                                             "potion" if i % 2 else "sword", errors))
+        for i in range(THREADS)
+    ]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - start
+
+    per_pair = {"potion": 25 - 25 // 2, "sword": 100 - 100 // 2}
+    expected = start_gold - sum(
+        ROUNDS * per_pair["potion" if i % 2 else "sword"] for i in range(THREADS)
+    )
+    lost = character['gold'] - expected
+    transactions = THREADS * ROUNDS * 2
+    print(f"{label:<28} {transactions / elapsed:>10,.0f} transactions/s  "
+          f"gold off by {lost:+,}  items left {len(character['inventory'])}  "
+          f"failed trades {len(errors)}")
+
+if __name__ == "__main__":
+    print("=== SHOP CONCURRENCY BENCHMARK ===")
+    sys.setswitchinterval(1e-6) # switch threads often to expose races
+
+    shop = Shop(ITEMS)
+    run("Shop (locked)", shop.purchase, shop.sell)
+    run("purchase_item (no locks)",
+        lambda character, item_id: inventory_system.purchase_item(character, item_id, ITEMS[item_id]),
+        lambda character, item_id: inventory_system.sell_item(character, item_id, ITEMS[item_id]))
@@ -0,0 +1,60 @@
+"""
+Benchmark: Typed Save Loading
+Measures load + validate throughput over a corpus of generated text saves
+"""
+
+import sys
+import os
+import time
+import random
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import character_manager
+
+CORPUS_SIZE = 2000
+PARSES = 20
+
+def generate_corpus(save_directory, count):
+    """Write count random characters as text saves"""
+    rng = random.Random(163)
+    classes = ["Warrior", "Mage", "Rogue", "Cleric"]
+    chars = []
+    for i in range(count):
+        char = character_manager.create_character_at_level(
+            f"Corpus{i}", rng.choice(classes), rng.randint(1, 30))
+        char['inventory'] = [f"item_{rng.randint(0, 9)}" for _ in range(rng.randint(0, 20))]
+        char['completed_quests'] = [f"quest_{q}" for q in range(rng.randint(0, 200))]
+        chars.append(char)
+    character_manager.save_many(chars, save_directory)
+    return [char['name'] for char in chars]
+
+def bench_parsers(texts):
+    """Compare the fast path with the general line-by-line path"""
+    crlf_texts = [text.replace("\n", "\r\n") for text in texts]
+    for label, corpus in [("fast path", texts), ("general path", crlf_texts)]:
+        start = time.perf_counter()
+        for _ in range(PARSES):
+            for text in corpus:
+                character_manager.decode_character_text(text)
+        elapsed = time.perf_counter() - start
+        print(f"decode {label:<14} {len(corpus) * PARSES / elapsed:>10,.0f} saves/s")
+
+if __name__ == "__main__":
+    print("=== TYPED LOAD BENCHMARK ===")
+    with tempfile.TemporaryDirectory() as save_directory:
+        names = generate_corpus(save_directory, CORPUS_SIZE)
+
+        start = time.perf_counter()
+        for name in names:
+            loaded = character_manager.load_character(name, save_directory)
+            character_manager.validate_character_data(loaded)
+        elapsed = time.perf_counter() - start
+        print(f"load + validate       {len(names) / elapsed:>10,.0f} saves/s")
+
+        texts = []
+        for name in names:
+            with open(character_manager.get_save_path(name, save_directory)) as file:
+                texts.append(file.read())
+        bench_parsers(texts)
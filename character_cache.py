@@ -0,0 +1,215 @@
+"""
+COMP 163 - Project 3: Quest Chronicles
+Character Cache Module
+
+This module keeps recently used characters in memory in front of
+character_manager.load_character/save_character so the same save file
+is not read and parsed over and over.
+"""
+
+import os
+from collections import OrderedDict
+
+import character_manager
+from custom_exceptions import CharacterNotFoundError
+
+WRITE_THROUGH = "write-through"
+WRITE_BACK = "write-back"
+
+# ============================================================================
+# CHARACTER CACHE
+# ============================================================================
+
+class CharacterCache: # LRU cache of loaded characters
+    """
+    Least-recently-used cache of characters
+
+    Modes:
+    - write-through: save() writes to disk immediately
+    - write-back: save() only marks the character dirty; dirty characters
+      are written by flush() or when they are evicted
+
+    A cached character is reloaded if its save file's modification time or
+    size changed since it was read (another process saved it), unless it has
+    unsaved write-back changes.
+
+    load() returns the cached dictionary itself, so changes made to it are
+    seen by later loads from this cache.
+    """
+
+    def __init__(self, capacity=128, mode=WRITE_THROUGH,
+                 save_directory="data/save_games",
+                 save_format=character_manager.SAVE_FORMAT_TEXT):
+        """Create an empty cache"""
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1")
+        if mode not in (WRITE_THROUGH, WRITE_BACK):
+            raise ValueError(f"Unknown cache mode: {mode}")
+        self.capacity = capacity
+        self.mode = mode
+        self.save_directory = save_directory
+        self.save_format = save_format
+        # name -> [character, file_signature, dirty]
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+        self.writes = 0
+
+    def __len__(self):
+        return len(self.entries)
+
+    def __contains__(self, character_name):
+        return character_name in self.entries
+
+    def file_signature(self, character_name): # (mtime, size, inode) of a save file
+        """
+        Get the modification time, size and inode of a character's save file
+
+        Atomic saves replace the file, so the inode changes on every save
+        even if the modification time looks the same.
+
+        Returns: Tuple (mtime_ns, size, inode), or None if the file doesn't exist
+        """
+        path = character_manager.get_save_path(character_name, self.save_directory)
+        try:
+            info = os.stat(path)
+        except FileNotFoundError:
+            return None
+        return (info.st_mtime_ns, info.st_size, info.st_ino)
+
+    def load(self, character_name): # loads a character through the cache
+        """
+        Load a character, using the cached copy when it is still current
+
+        Returns: Character dictionary
+        Raises: Same exceptions as character_manager.load_character
+        """
+        entry = self.entries.get(character_name)
+        if entry is not None:
+            character, signature, dirty = entry
+            if dirty or self.file_signature(character_name) == signature:
+                self.entries.move_to_end(character_name)
+                self.hits += 1
+                return character
+            self.invalidations += 1
+            del self.entries[character_name]
+
+        self.misses += 1
+        signature = self.file_signature(character_name)
+        character = character_manager.load_character(character_name, self.save_directory)
+        self.store(character_name, character, signature, False)
+        return character
+
+    def save(self, character): # saves a character through the cache
+        """
+        Save a character (immediately in write-through mode,
+        on flush/eviction in write-back mode)
+
+        Returns: True if successful
+        """
+        name = character['name']
+        if self.mode == WRITE_THROUGH:
+            self.write(character)
+            self.store(name, character, self.file_signature(name), False)
+        else:
+            self.store(name, character, None, True)
+        return True
+
+    def delete(self, character_name): # deletes a character and forgets it
+        """
+        Delete a character's save and drop it from the cache
+
+        Returns: True if deleted successfully
+        Raises: CharacterNotFoundError if character doesn't exist
+        """
+        entry = self.entries.pop(character_name, None)
+        try:
+            return character_manager.delete_character(character_name, self.save_directory)
+        except CharacterNotFoundError:
+            # A write-back character that was never flushed only lived here
+            if entry is not None and entry[2]:
+                return True
+            raise
+
+    def flush(self): # writes every dirty character
+        """
+        Write all unsaved write-back changes to disk in one batch
+
+        Returns: Number of characters written
+        """
+        dirty = [entry[0] for entry in self.entries.values() if entry[2]]
+        if not dirty:
+            return 0
+        character_manager.save_many(dirty, self.save_directory, self.save_format)
+        self.writes += len(dirty)
+        for character in dirty:
+            entry = self.entries[character['name']]
+            entry[1] = self.file_signature(character['name'])
+            entry[2] = False
+        return len(dirty)
+
+    def clear(self): # flushes and empties the cache
+        """Flush dirty characters and drop everything from the cache"""
+        self.flush()
+        self.entries.clear()
+
+    def stats(self): # counters for monitoring
+        """
+        Get cache counters
+
+        Returns: Dictionary with size, capacity, hits, misses, evictions,
+                 invalidations, writes, dirty and hit_rate
+        """
+        lookups = self.hits + self.misses
+        return {
+            'size': len(self.entries),
+            'capacity': self.capacity,
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'invalidations': self.invalidations,
+            'writes': self.writes,
+            'dirty': sum(1 for entry in self.entries.values() if entry[2]),
+            'hit_rate': self.hits / lookups if lookups else 0.0
+        }
+
+    # ------------------------------------------------------------------------
+    # Internal helpers
+    # ------------------------------------------------------------------------
+
+    def write(self, character): # writes one character to disk
+        """Write one character with character_manager.save_character"""
+        character_manager.save_character(character, self.save_directory, self.save_format)
+        self.writes += 1
+
+    def store(self, name, character, signature, dirty): # adds an entry, evicting if full
+        """
+        Insert or replace an entry as most recently used, evicting the oldest if full
+
+        A dirty entry is written before it is dropped, so if the write
+        fails it stays in the cache (and the error propagates).
+        """
+        self.entries[name] = [character, signature, dirty]
+        self.entries.move_to_end(name)
+        while len(self.entries) > self.capacity:
+            old_name = next(iter(self.entries))
+            old_character, _, old_dirty = self.entries[old_name]
+            if old_dirty:
+                self.write(old_character)
+            del self.entries[old_name]
+            self.evictions += 1
+
+# ============================================================================
+# TESTING
+# ============================================================================
+
+if __name__ == "__main__":
+    print("=== CHARACTER CACHE TEST ===")
+
+    cache = CharacterCache(capacity=2)
+    for name in character_manager.list_saved_characters():
+        cache.load(name)
+        cache.load(name)
+    print(cache.stats())
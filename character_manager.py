@@ -10,6 +10,10 @@ This module handles character creation, loading, and saving.
 """
 
 import os
+import re
+import struct
+import tempfile
+import zlib
 from custom_exceptions import (
     InvalidCharacterClassError,
     CharacterNotFoundError,
@@ -17,6 +21,86 @@ from custom_exceptions import (
     InvalidSaveDataError,
     CharacterDeadError
 )
+from inventory_system import Inventory
+
+# Every saved character field and its type, in save file order.
+# Used by validate_character_data and by the text save reader/writer.
+CHARACTER_FIELDS = {
+    "name" : str,
+    "class" : str,
+    "level" : int,
+    "health" : int,
+    "max_health" : int,
+    "strength" : int,
+    "magic" : int,
+    "experience" : int,
+    "gold" : int,
+    "inventory" : list,
+    "active_quests" : list,
+    "completed_quests" : list
+}
+
+# Fields saved after CHARACTER_FIELDS when the character has them.
+# Saves written before they existed still load (without them).
+OPTIONAL_CHARACTER_FIELDS = {
+    "quest_xp_earned" : int,
+    "quest_gold_earned" : int
+}
+
+SAVE_FIELDS = {**CHARACTER_FIELDS, **OPTIONAL_CHARACTER_FIELDS}
+
+# Types validate_character_data accepts for each field. A counted
+# Inventory (see inventory_system.use_counted_inventory) can stand in for
+# the inventory list; it is saved as the same comma-separated line.
+VALID_FIELD_TYPES = {**CHARACTER_FIELDS, "inventory" : (list, Inventory)}
+
+# Matches a whole text save laid out exactly as encode_character_text
+# writes it, capturing one value per field in SAVE_FIELDS order
+TEXT_SAVE_PATTERN = re.compile("\n".join(
+    f"{field.upper()}: (-?[0-9]+)" if field_type is int else f"{field.upper()}: ([^\n]*)"
+    for field, field_type in SAVE_FIELDS.items()
+) + r"\Z")
+
+# Save formats accepted by save_character
+SAVE_FORMAT_TEXT = "text"
+SAVE_FORMAT_BINARY = "binary"
+
+# Binary save layout (version 3):
+#   magic (4 bytes) + version (1 byte)
+#   7 stats as varints: level, health, max_health, strength, magic,
+#                       experience, gold
+#   2 optional fields as varints: quest_xp_earned, quest_gold_earned
+#                       (-1 = not set)
+#   string section: a flag varint (BINARY_PLAIN or BINARY_ZLIB), a byte
+#                   length varint and the (possibly zlib-compressed) tables
+#                   name, class, inventory, active_quests, completed_quests
+# A varint is 7 bits per byte, low bits first; signed numbers are
+# zigzag-encoded first (0, -1, 1, -2... -> 0, 1, 2, 3...), so small stats
+# take one or two bytes. A string table is a count varint and a byte length
+# varint followed by the UTF-8 entries joined with NUL bytes. The string
+# section is compressed once it reaches BINARY_COMPRESS_MIN bytes, since
+# quest IDs repeat long prefixes.
+#
+# Versions 1 and 2 (still read) used fixed-width little-endian fields:
+#   7 signed 64-bit stats, string tables with unsigned 32-bit count and
+#   length, and (version 2) 2 signed 64-bit optional fields after them.
+BINARY_SAVE_MAGIC = b"QCSV"
+BINARY_SAVE_VERSION = 3
+BINARY_HEADER = struct.Struct("<4sB")
+BINARY_STATS = struct.Struct("<7q")
+BINARY_TABLE = struct.Struct("<II")
+BINARY_OPTIONAL = struct.Struct("<2q")
+BINARY_PLAIN = 0
+BINARY_ZLIB = 1
+BINARY_COMPRESS_MIN = 256
+BINARY_STAT_FIELDS = [
+    "level", "health", "max_health", "strength",
+    "magic", "experience", "gold"
+]
+BINARY_TABLE_FIELDS = ["inventory", "active_quests", "completed_quests"]
+
+# Character fields holding quest IDs (kept as QuestList)
+QUEST_LIST_FIELDS = ["active_quests", "completed_quests"]
 
 # ============================================================================
 # CHARACTER MANAGEMENT FUNCTIONS
@@ -70,13 +154,15 @@ def create_character(name, character_class): # creates a new character and valid
         "experience": 0,
         "gold": 100,
         "inventory": [],
-        "active_quests": [],
-        "completed_quests": []
+        "active_quests": QuestList(),
+        "completed_quests": QuestList(),
+        "quest_xp_earned": 0,
+        "quest_gold_earned": 0
     }
 
 
 
-def save_character(character, save_directory="data/save_games"): # saves character data to a file
+def save_character(character, save_directory="data/save_games", save_format=SAVE_FORMAT_TEXT): # saves character data to a file
     """
     Save character to file
     
@@ -95,50 +181,76 @@ def save_character(character, save_directory="data/save_games"): # saves charact
     INVENTORY: item1,item2,item3
     ACTIVE_QUESTS: quest1,quest2
     COMPLETED_QUESTS: quest1,quest2
+
+    With save_format="binary" the same file holds the compact binary
+    format instead (see encode_character_binary).
+
+    The save is written to a temporary file, flushed to disk and renamed
+    over the old save, so a crash mid-write never leaves a truncated save.
     
     Returns: True if successful
     Raises: PermissionError, IOError (let them propagate or handle)
+            ValueError if save_format is not recognized
     """
     # TODO: Implement save functionality
     # Create save_directory if it doesn't exist
     # Handle any file I/O errors appropriately
     # Lists should be saved as comma-separated values
+    data = encode_character(character, save_format)
     os.makedirs(save_directory, exist_ok=True)
-    filename = f"{character['name']}_save.txt"
-    filepath = os.path.join(save_directory, filename)
+    filepath = get_save_path(character['name'], save_directory)
 
+    temp_path = write_temp_file(save_directory, data, sync=True)
     try:
-        lines = [
-            f"NAME: {character['name']}",
-            f"CLASS: {character['class']}",
-            f"LEVEL: {character['level']}",
-            f"HEALTH: {character['health']}",
-            f"MAX_HEALTH: {character['max_health']}",
-            f"STRENGTH: {character['strength']}",
-            f"MAGIC: {character['magic']}",
-            f"EXPERIENCE: {character['experience']}",
-            f"GOLD: {character['gold']}",
-            f"INVENTORY: {','.join(character.get('inventory', []))}",
-            f"ACTIVE_QUESTS: {','.join(character.get('active_quests', []))}",
-            f"COMPLETED_QUESTS: {','.join(character.get('completed_quests', []))}"
-        ]
-        with open(filepath, "w") as file:
-            file.write('\n'.join(lines))
-        return True
-    except (PermissionError, IOError):
+        os.replace(temp_path, filepath)
+    except BaseException:
+        os.remove(temp_path)
         raise
+    sync_directory(save_directory)
+    return True
+
+def save_many(characters, save_directory="data/save_games", save_format=SAVE_FORMAT_TEXT): # saves a batch of characters with one directory sync
+    """
+    Save many characters at once
 
- 
+    Every character is written to a temporary file first. The temporary
+    files are then synced to disk together in one pass (see sync_files),
+    renamed over the real save files, and the directory is synced once, so
+    a crash leaves each save either fully old or fully new.
+
+    Returns: Number of characters saved
+    Raises: PermissionError, IOError (let them propagate)
+            ValueError if save_format is not recognized
+    """
+    os.makedirs(save_directory, exist_ok=True)
+    pending = []
+    try:
+        for character in characters:
+            data = encode_character(character, save_format)
+            temp_path = write_temp_file(save_directory, data)
+            pending.append((temp_path, get_save_path(character['name'], save_directory)))
+        sync_files([temp_path for temp_path, _ in pending])
+        for temp_path, filepath in pending:
+            os.replace(temp_path, filepath)
+    except BaseException:
+        for temp_path, _ in pending:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+        raise
+    sync_directory(save_directory)
+    return len(pending)
 
 def load_character(character_name, save_directory="data/save_games"): # loads character data from a file
     """
     Load character from save file
+
+    The save format (text or binary) is detected automatically.
     
     Args:
         character_name: Name of character to load
         save_directory: Directory containing save files
     
-    Returns: Character dictionary
+    Returns: Character dictionary (numbers as ints, lists as lists)
     Raises: 
         CharacterNotFoundError if save file doesn't exist
         SaveFileCorruptedError if file exists but can't be read
@@ -149,29 +261,21 @@ def load_character(character_name, save_directory="data/save_games"): # loads ch
     # Try to read file → SaveFileCorruptedError
     # Validate data format → InvalidSaveDataError
     # Parse comma-separated lists back into Python lists
-    filename = f"{character_name}_save.txt"
-    filepath = os.path.join(save_directory, filename)
+    filepath = get_save_path(character_name, save_directory)
     if not os.path.exists(filepath):
         raise CharacterNotFoundError
     try:
-        with open(filepath, "r") as file:
-            lines = file.readlines()
+        with open(filepath, "rb") as file:
+            data = file.read()
     except:
         raise SaveFileCorruptedError 
-    character = {}
+    if data.startswith(BINARY_SAVE_MAGIC):
+        return decode_character_binary(data)
     try:
-        for line in lines:
-            key, value = line.strip().split(":", 1)
-            key = key.strip().lower()
-            value = value.strip()
-
-            if "," in value:
-                character[key] = value.strip().split(",")
-            else:
-                character[key] = value
-    except:
-        raise InvalidSaveDataError
-    return character
+        text = data.decode("utf-8")
+    except UnicodeDecodeError:
+        raise SaveFileCorruptedError
+    return decode_character_text(text)
 
 def list_saved_characters(save_directory="data/save_games"): # lists all saved character names in the save directory
     """
@@ -200,13 +304,377 @@ def delete_character(character_name, save_directory="data/save_games"): # delete
     """
     # TODO: Implement character deletion
     # Verify file exists before attempting deletion
-    filename = f"{character_name}_save.txt"
-    filepath = os.path.join(save_directory, filename)
+    filepath = get_save_path(character_name, save_directory)
     if not os.path.exists(filepath):
         raise CharacterNotFoundError
     os.remove(filepath)
     return True
 
+# ============================================================================
+# SAVE FILE FORMATS
+# ============================================================================
+
+def get_save_path(character_name, save_directory="data/save_games"): # builds the save file path for a character
+    """
+    Get the save file path for a character
+
+    Both save formats use the same {name}_save.txt file name on purpose:
+    a character only ever has one save, so switching formats replaces the
+    old save instead of leaving a stale one next to it, and listing,
+    deleting and the character cache work the same for either format.
+    load_character tells the formats apart by the binary magic bytes, not
+    the extension.
+    """
+    return os.path.join(save_directory, f"{character_name}_save.txt")
+
+def encode_character(character, save_format=SAVE_FORMAT_TEXT): # builds save contents in either format
+    """
+    Build the save file contents for a character
+
+    Returns: Bytes in the requested format
+    Raises: ValueError if save_format is not recognized
+    """
+    if save_format == SAVE_FORMAT_TEXT:
+        return encode_character_text(character).encode("utf-8")
+    if save_format == SAVE_FORMAT_BINARY:
+        return encode_character_binary(character)
+    raise ValueError(f"Unknown save format: {save_format}")
+
+def write_temp_file(directory, data, sync=False): # writes data to a new temporary file
+    """
+    Write data to a new temporary file in directory
+
+    The temporary name never ends in _save.txt, so a half-written file is
+    never listed or loaded as a save. With sync=True the file is synced
+    to disk (see sync_file) before returning.
+
+    Returns: Path of the temporary file
+    """
+    fd, temp_path = tempfile.mkstemp(dir=directory, prefix=".", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as file:
+            file.write(data)
+            if sync:
+                file.flush()
+                sync_file(file.fileno())
+    except BaseException:
+        os.remove(temp_path)
+        raise
+    return temp_path
+
+def sync_file(fd): # makes one open file's contents durable
+    """
+    Flush an open file's data to disk
+
+    Uses fdatasync where available (the file's data, without metadata
+    such as access times), otherwise fsync.
+    """
+    if hasattr(os, "fdatasync"):
+        os.fdatasync(fd)
+    else:
+        os.fsync(fd)
+
+def sync_files(paths): # makes a batch of written files durable
+    """
+    Sync already-written files to disk in one pass
+
+    Each file still gets its own sync (see sync_file), but only after all
+    of them are written, so the OS can write them back together and most
+    syncs find their data already on its way to disk. There is no portable
+    call that syncs just a list of files at once.
+    """
+    for path in paths:
+        fd = os.open(path, os.O_RDWR)
+        try:
+            sync_file(fd)
+        finally:
+            os.close(fd)
+
+def sync_directory(directory): # makes renames inside a directory durable
+    """
+    Flush a directory entry so renames inside it survive a crash
+
+    Only needed (and only possible) on POSIX systems.
+    """
+    if os.name != "posix":
+        return
+    fd = os.open(directory, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+def encode_character_text(character): # builds the text save contents
+    """
+    Build the line-oriented text save for a character
+
+    Returns: String with one "KEY: value" line per field
+    """
+    lines = []
+    for field, field_type in SAVE_FIELDS.items():
+        if field in OPTIONAL_CHARACTER_FIELDS and field not in character:
+            continue
+        if field_type is list:
+            value = ','.join(character.get(field, []))
+        else:
+            value = character[field]
+        lines.append(f"{field.upper()}: {value}")
+    return '\n'.join(lines)
+
+def convert_save_value(field, value): # converts one text value to its schema type
+    """
+    Convert a text save value to the type listed in SAVE_FIELDS
+
+    Unknown fields are kept as strings.
+
+    Raises: InvalidSaveDataError if a number can't be parsed
+    """
+    field_type = SAVE_FIELDS.get(field, str)
+    if field_type is int:
+        try:
+            return int(value)
+        except ValueError:
+            raise InvalidSaveDataError
+    if field_type is list:
+        return value.split(",") if value else []
+    return value
+
+def decode_character_text_fast(text): # parses a save written by save_character
+    """
+    Parse a text save laid out exactly as encode_character_text writes it
+
+    The whole file is matched by TEXT_SAVE_PATTERN in one call, so no
+    per-line strip/split is needed; only the values are converted.
+
+    Returns: Character dictionary, or None if the layout is different
+    """
+    match = TEXT_SAVE_PATTERN.match(text)
+    if match is None:
+        return None
+    character = {}
+    for (field, field_type), value in zip(SAVE_FIELDS.items(), match.groups()):
+        if field_type is int:
+            character[field] = int(value)
+        elif field_type is list:
+            character[field] = value.split(",") if value else []
+        else:
+            character[field] = value
+    return character
+
+def decode_character_text(text): # parses the text save contents
+    """
+    Parse a text save back into a character dictionary
+
+    Values are converted to the types in CHARACTER_FIELDS in a single pass.
+    Saves written by save_character take the fast path; anything else
+    (extra spaces, Windows line endings, extra fields) is parsed line by line.
+
+    Raises: InvalidSaveDataError if a line is not "KEY: value"
+    """
+    character = decode_character_text_fast(text)
+    if character is not None:
+        return use_quest_lists(character)
+    character = {}
+    try:
+        for line in text.splitlines():
+            key, value = line.strip().split(":", 1)
+            key = key.strip().lower()
+            character[key] = convert_save_value(key, value.strip())
+    except ValueError:
+        raise InvalidSaveDataError
+    return use_quest_lists(character)
+
+def pack_varint(value): # unsigned int -> varint bytes
+    """Encode a non-negative int 7 bits per byte, low bits first"""
+    out = bytearray()
+    while value >= 0x80:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+    return bytes(out)
+
+def unpack_varint(data, offset): # reads one varint back out of bytes
+    """
+    Read a varint written by pack_varint
+
+    Returns: Tuple (value, next_offset)
+    Raises: IndexError if the data is cut off
+    """
+    result = 0
+    shift = 0
+    while True:
+        byte = data[offset]
+        offset += 1
+        result |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return result, offset
+        shift += 7
+
+def zigzag(value): # signed -> unsigned, keeping small numbers small
+    """Map 0, -1, 1, -2... to 0, 1, 2, 3..."""
+    return value * 2 if value >= 0 else -value * 2 - 1
+
+def unzigzag(value): # undoes zigzag
+    """Map 0, 1, 2, 3... back to 0, -1, 1, -2..."""
+    return value >> 1 if not value & 1 else -(value >> 1) - 1
+
+def pack_string_table(strings): # packs a list of strings into bytes
+    """
+    Pack strings as a length-prefixed table
+
+    Returns: Bytes (count varint, byte length varint, NUL-joined UTF-8 entries)
+    """
+    blob = "\0".join(strings).encode("utf-8")
+    return pack_varint(len(strings)) + pack_varint(len(blob)) + blob
+
+def unpack_string_table(data, offset): # reads a string table back out of bytes
+    """
+    Read a string table written by pack_string_table
+
+    Returns: Tuple (list_of_strings, next_offset)
+    Raises: SaveFileCorruptedError if the table is cut off
+    """
+    # Counts and lengths under 128 are one byte, so skip the call for them
+    count = data[offset]
+    if count < 0x80:
+        offset += 1
+    else:
+        count, offset = unpack_varint(data, offset)
+    length = data[offset]
+    if length < 0x80:
+        offset += 1
+    else:
+        length, offset = unpack_varint(data, offset)
+    return split_string_table(data, offset, count, length)
+
+def unpack_fixed_string_table(data, offset): # reads a version 1/2 string table
+    """
+    Read a string table from a version 1 or 2 save (32-bit count and length)
+
+    Returns: Tuple (list_of_strings, next_offset)
+    Raises: SaveFileCorruptedError if the table is cut off
+    """
+    count, length = BINARY_TABLE.unpack_from(data, offset)
+    return split_string_table(data, offset + BINARY_TABLE.size, count, length)
+
+def split_string_table(data, offset, count, length): # splits a table's NUL-joined entries
+    """
+    Split the length bytes at offset into count strings
+
+    Returns: Tuple (list_of_strings, next_offset)
+    Raises: SaveFileCorruptedError if the table is cut off
+    """
+    end = offset + length
+    if end > len(data):
+        raise SaveFileCorruptedError
+    if count == 0:
+        return [], end
+    strings = data[offset:end].decode("utf-8").split("\0")
+    if len(strings) != count:
+        raise SaveFileCorruptedError
+    return strings, end
+
+def encode_character_binary(character): # builds the binary save contents
+    """
+    Build the compact binary save for a character
+
+    Returns: Bytes in the BINARY_SAVE_VERSION layout
+    """
+    numbers = [int(character[field]) for field in BINARY_STAT_FIELDS]
+    numbers += [int(character.get(field, -1)) for field in OPTIONAL_CHARACTER_FIELDS]
+    tables = [pack_string_table([str(character['name'])]),
+              pack_string_table([str(character['class'])])]
+    for field in BINARY_TABLE_FIELDS:
+        tables.append(pack_string_table(list(character.get(field, []))))
+    section = b"".join(tables)
+    flag = BINARY_PLAIN
+    if len(section) >= BINARY_COMPRESS_MIN:
+        compressed = zlib.compress(section)
+        if len(compressed) < len(section):
+            section, flag = compressed, BINARY_ZLIB
+    return b"".join([
+        BINARY_HEADER.pack(BINARY_SAVE_MAGIC, BINARY_SAVE_VERSION),
+        *[pack_varint(zigzag(number)) for number in numbers],
+        pack_varint(flag),
+        pack_varint(len(section)),
+        section
+    ])
+
+def decode_character_binary(data): # parses the binary save contents
+    """
+    Parse a binary save back into a character dictionary
+
+    Numbers come back as ints and lists as lists. Version 1 and 2 saves
+    (the older fixed-width layout) are still read.
+
+    Raises:
+        InvalidSaveDataError if the file is not a supported binary save
+        SaveFileCorruptedError if the file is cut off or unreadable
+    """
+    try:
+        magic, version = BINARY_HEADER.unpack_from(data, 0)
+        if magic != BINARY_SAVE_MAGIC or version not in (1, 2, BINARY_SAVE_VERSION):
+            raise InvalidSaveDataError
+        if version < 3:
+            return use_quest_lists(decode_fixed_width_binary(data, version))
+        offset = BINARY_HEADER.size
+        numbers = []
+        for _ in range(len(BINARY_STAT_FIELDS) + len(OPTIONAL_CHARACTER_FIELDS)):
+            value = data[offset]
+            if value < 0x80:
+                offset += 1
+            else:
+                value, offset = unpack_varint(data, offset)
+            numbers.append(value >> 1 if not value & 1 else -(value >> 1) - 1)
+        flag, offset = unpack_varint(data, offset)
+        length, offset = unpack_varint(data, offset)
+        section = data[offset:offset + length]
+        if len(section) != length:
+            raise SaveFileCorruptedError
+        if flag == BINARY_ZLIB:
+            section = zlib.decompress(section)
+        elif flag != BINARY_PLAIN:
+            raise InvalidSaveDataError
+        character = {}
+        names, offset = unpack_string_table(section, 0)
+        classes, offset = unpack_string_table(section, offset)
+        character["name"] = names[0]
+        character["class"] = classes[0]
+        character.update(zip(BINARY_STAT_FIELDS, numbers))
+        for field in BINARY_TABLE_FIELDS:
+            character[field], offset = unpack_string_table(section, offset)
+        for field, value in zip(OPTIONAL_CHARACTER_FIELDS, numbers[len(BINARY_STAT_FIELDS):]):
+            if value >= 0:
+                character[field] = value
+    except (struct.error, UnicodeDecodeError, IndexError, zlib.error):
+        raise SaveFileCorruptedError
+    return use_quest_lists(character)
+
+def decode_fixed_width_binary(data, version): # parses a version 1/2 binary save
+    """
+    Parse the fixed-width layout used by version 1 and 2 binary saves
+
+    Returns: Character dictionary (quest fields still plain lists)
+    Raises: struct.error, IndexError or SaveFileCorruptedError if cut off
+    """
+    offset = BINARY_HEADER.size
+    stats = BINARY_STATS.unpack_from(data, offset)
+    offset += BINARY_STATS.size
+    character = {}
+    names, offset = unpack_fixed_string_table(data, offset)
+    classes, offset = unpack_fixed_string_table(data, offset)
+    character["name"] = names[0]
+    character["class"] = classes[0]
+    character.update(zip(BINARY_STAT_FIELDS, stats))
+    for field in BINARY_TABLE_FIELDS:
+        character[field], offset = unpack_fixed_string_table(data, offset)
+    if version >= 2:
+        optional = BINARY_OPTIONAL.unpack_from(data, offset)
+        for field, value in zip(OPTIONAL_CHARACTER_FIELDS, optional):
+            if value >= 0:
+                character[field] = value
+    return character
+
 # ============================================================================
 # CHARACTER OPERATIONS
 # ============================================================================
@@ -243,6 +711,21 @@ def gain_experience(character, xp_amount): # adds experience and handles level u
         character["health"] = character["max_health"]
     return character
 
+def create_character_at_level(name, character_class, level): # creates a character already leveled up
+    """
+    Create a character and level it up to the given level
+
+    Stats are derived with gain_experience, so they match a character
+    that earned each level normally (experience is left at 0).
+
+    Returns: Character dictionary
+    Raises: InvalidCharacterClassError if class is not valid
+    """
+    character = create_character(name, character_class)
+    while character["level"] < level:
+        gain_experience(character, character["level"] * 100)
+    return character
+
 def add_gold(character, amount): # this adds gold to the character's inventory
     """
     Add gold to character's inventory
@@ -310,6 +793,105 @@ def revive_character(character): # revives a dead character with 50% health
     return True
 
 
+# ============================================================================
+# QUEST STATE
+# ============================================================================
+
+class QuestList(list): # list of quest IDs with O(1) membership
+    """
+    List of quest IDs that also keeps a count of each ID
+
+    It is still a list (same order, same saving, isinstance(..., list)),
+    but `quest_id in quests` looks at the counts instead of scanning.
+    Every list method that adds or removes items keeps the counts in step.
+    """
+
+    __slots__ = ("counts",)
+
+    def __init__(self, quest_ids=()):
+        super().__init__(quest_ids)
+        self.counts = {}
+        self.recount()
+
+    def __contains__(self, quest_id):
+        return quest_id in self.counts
+
+    def __reduce__(self):
+        return (QuestList, (list(self),))
+
+    def copy(self):
+        return QuestList(self)
+
+    def append(self, quest_id):
+        super().append(quest_id)
+        self.counts[quest_id] = self.counts.get(quest_id, 0) + 1
+
+    def insert(self, index, quest_id):
+        super().insert(index, quest_id)
+        self.counts[quest_id] = self.counts.get(quest_id, 0) + 1
+
+    def extend(self, quest_ids):
+        for quest_id in quest_ids:
+            self.append(quest_id)
+
+    def __iadd__(self, quest_ids):
+        self.extend(quest_ids)
+        return self
+
+    def __imul__(self, times):
+        super().__imul__(times)
+        self.recount()
+        return self
+
+    def remove(self, quest_id):
+        super().remove(quest_id)
+        self.discount(quest_id)
+
+    def pop(self, index=-1):
+        quest_id = super().pop(index)
+        self.discount(quest_id)
+        return quest_id
+
+    def clear(self):
+        super().clear()
+        self.counts.clear()
+
+    def __setitem__(self, index, value):
+        super().__setitem__(index, value)
+        self.recount()
+
+    def __delitem__(self, index):
+        super().__delitem__(index)
+        self.recount()
+
+    def discount(self, quest_id): # drops one copy of quest_id from the counts
+        """Lower the count for quest_id, forgetting it at zero"""
+        remaining = self.counts[quest_id] - 1
+        if remaining:
+            self.counts[quest_id] = remaining
+        else:
+            del self.counts[quest_id]
+
+    def recount(self): # rebuilds the counts from the list
+        """Count every quest ID again (after slice assignment or deletion)"""
+        self.counts.clear()
+        for quest_id in self:
+            self.counts[quest_id] = self.counts.get(quest_id, 0) + 1
+
+def use_quest_lists(character): # turns the quest fields into QuestLists
+    """
+    Make active_quests and completed_quests QuestLists (in place)
+
+    Fields that are missing, or already QuestLists, are left alone.
+
+    Returns: The same character dictionary
+    """
+    for field in QUEST_LIST_FIELDS:
+        quests = character.get(field)
+        if isinstance(quests, list) and not isinstance(quests, QuestList):
+            character[field] = QuestList(quests)
+    return character
+
 # ============================================================================
 # VALIDATION
 # ============================================================================
@@ -322,6 +904,8 @@ def validate_character_data(character): # validates that the character data has
                     strength, magic, experience, gold, inventory,
                     active_quests, completed_quests
     
+    inventory may be a list or a counted Inventory.
+
     Returns: True if valid
     Raises: InvalidSaveDataError if missing fields or invalid types
     """
@@ -329,21 +913,7 @@ def validate_character_data(character): # validates that the character data has
     # Check all required keys exist
     # Check that numeric values are numbers
     # Check that lists are actually lists
-    required_feilds = {
-        "name" : str,
-        "class" : str,
-        "level" : int,
-        "health" : int,
-        "max_health" : int,
-        "strength" : int,
-        "magic" : int,
-        "experience" : int,
-        "gold" : int,
-        "inventory" : list,
-        "active_quests" : list,
-        "completed_quests" : list
-    }
-    for feild, expected_types in required_feilds.items():
+    for feild, expected_types in VALID_FIELD_TYPES.items():
         if feild not in character:
             raise InvalidSaveDataError
         if not isinstance(character[feild], expected_types):
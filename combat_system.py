@@ -15,6 +15,9 @@ from custom_exceptions import (
     CharacterDeadError,
     AbilityOnCooldownError
 )
+from battle_log import BattleEvent, PrintSink
+from enemy_catalog import get_enemy_catalog
+from rng import GameRNG, get_rng
 
 # ============================================================================
 # ENEMY DEFINITIONS
@@ -24,7 +27,7 @@ def create_enemy(enemy_type): # creates enemy based on type meaning goblin, orc,
     """
     Create an enemy based on type
     
-    Example enemy types and stats:
+    Enemy types and stats come from data/enemies.txt (see enemy_catalog), e.g.:
     - goblin: health=50, strength=8, magic=2, xp_reward=25, gold_reward=10
     - orc: health=80, strength=12, magic=5, xp_reward=50, gold_reward=25
     - dragon: health=200, strength=25, magic=15, xp_reward=200, gold_reward=100
@@ -32,61 +35,27 @@ def create_enemy(enemy_type): # creates enemy based on type meaning goblin, orc,
     Returns: Enemy dictionary
     Raises: InvalidTargetError if enemy_type not recognized
     """
-    # TODO: Implement enemy creation
     # Return dictionary with: name, health, max_health, strength, magic, xp_reward, gold_reward
-    enemy_type = enemy_type.capitalize()
-    if enemy_type == "Goblin":
-        return {
-            'name': 'Goblin',
-            'health': 50,
-            'max_health': 50,
-            'strength': 8,
-            'magic': 2,
-            'xp_reward': 25,
-            'gold_reward': 10
-        }
-    elif enemy_type == "Orc":
-        return {
-            'name': 'Orc',
-            'health': 80,
-            'max_health': 80,
-            'strength': 12,
-            'magic': 5,
-            'xp_reward': 50,
-            'gold_reward': 25
-        }
-    elif enemy_type == "Dragon":
-        return {
-            'name': 'Dragon',
-            'health': 200,
-            'max_health': 200,
-            'strength': 25,
-            'magic': 15,
-            'xp_reward': 200,
-            'gold_reward': 100
-        }
-    else:
-        raise InvalidTargetError()
+    return get_enemy_catalog().create(enemy_type)
 
-def get_random_enemy_for_level(character_level): # creates enemy based on character level
+def get_random_enemy_for_level(character_level, rng=None): # creates enemy based on character level
     """
     Get an appropriate enemy for character's level
     
+    Each enemy type in data/enemies.txt has a level band (MIN_LEVEL to
+    MAX_LEVEL); when several fit, one is picked at random by WEIGHT.
+    With the default enemies:
     Level 1-2: Goblins
     Level 3-5: Orcs
     Level 6+: Dragons
     
+    Args:
+        character_level: Character's level
+        rng: Optional GameRNG (or anything with a random() method)
+    
     Returns: Enemy dictionary
     """
-    # TODO: Implement level-appropriate enemy selection
-    # Use if/elif/else to select enemy type
-    # Call create_enemy with appropriate type
-    if int(character_level) <= 2:
-        return create_enemy("Goblin")
-    elif 3 <= int(character_level) <= 5:
-        return create_enemy("Orc")
-    else:
-        return create_enemy("Dragon")
+    return get_enemy_catalog().create_for_level(int(character_level), rng)
 
 # ============================================================================
 # COMBAT SYSTEM
@@ -97,10 +66,25 @@ class SimpleBattle: # simple turn-based combat system
     Simple turn-based combat system
     
     Manages combat between character and enemy
+
+    Every random roll (escaping, the Rogue's critical strike) comes from
+    self.rng. Its seed is kept in self.seed, so passing GameRNG(seed) to a
+    new battle with the same fighters and choices replays it exactly.
+
+    Every action is sent to self.sink as a battle_log.BattleEvent. The
+    default PrintSink shows them with display_battle_log; pass a
+    RingBufferSink, JsonLinesSink or NullSink (or a FanOutSink of several)
+    to keep, save or drop them instead.
     """
     
-    def __init__(self, character, enemy):
-        """Initialize battle with character and enemy"""
+    def __init__(self, character, enemy, rng=None, sink=None):
+        """
+        Initialize battle with character and enemy
+
+        Args:
+            rng: GameRNG for this battle (default: a new one with a fresh seed)
+            sink: Where battle events go (default: PrintSink(display_battle_log))
+        """
         # TODO: Implement initialization
         # Store character and enemy
         # Set combat_active flag
@@ -109,6 +93,11 @@ class SimpleBattle: # simple turn-based combat system
         self.enemy = enemy
         self.combat_active = True
         self.turn_counter = 1
+        self.rng = rng if rng is not None else GameRNG()
+        self.seed = self.rng.seed
+        self.sink = sink if sink is not None else PrintSink(display_battle_log)
+        # None when events are dropped, so no event is ever built for them
+        self.emit = self.sink.emit if self.sink.enabled else None
     
     def start_battle(self): # starts the battle loop
         """
@@ -163,25 +152,32 @@ class SimpleBattle: # simple turn-based combat system
             print("2. Special Ability")
             print("3. Try to Run")
             choice = input("Choose an action (1-3): ")
+            enemy = self.enemy
             if choice == '1':
-                damage = self.calculate_damage(self.character, self.enemy)
-                self.apply_damage(self.enemy, damage)
-                display_battle_log(f"You attack the {self.enemy['name']} for {damage} damage!")
+                damage = self.calculate_damage(self.character, enemy)
+                self.apply_damage(enemy, damage)
+                self.log_event("player", "attack", damage, enemy,
+                               f"You attack the {enemy['name']} for {damage} damage!")
             elif choice == '2':
+                health_before = int(enemy['health'])
                 try:
-                    result = use_special_ability(self.character, self.enemy)
-                    display_battle_log(result)
+                    result = use_special_ability(self.character, enemy, self.rng)
+                    self.log_event("player", "special", health_before - int(enemy['health']),
+                                   enemy, result)
                 except AbilityOnCooldownError as e:
-                    display_battle_log(str(e))
+                    self.log_event("player", "special", 0, enemy, str(e))
             elif choice == '3':
                 escaped = self.attempt_escape()
                 if escaped:
-                    display_battle_log("You successfully escaped the battle!")
+                    self.log_event("player", "escape", 0, self.character,
+                                   "You successfully escaped the battle!")
                     self.combat_active = False
                 else:
-                    display_battle_log("Escape failed! The battle continues.")
+                    self.log_event("player", "escape_failed", 0, self.character,
+                                   "Escape failed! The battle continues.")
             else:
-                display_battle_log("Invalid choice! You lose your turn.")
+                self.log_event("player", "invalid", 0, self.character,
+                               "Invalid choice! You lose your turn.")
         else:
             raise CombatNotActiveError()
     
@@ -202,7 +198,18 @@ class SimpleBattle: # simple turn-based combat system
         if not self.check_battle_end():
             damage = self.calculate_damage(self.enemy, self.character)
             self.apply_damage(self.character, damage)
-            display_battle_log(f"The {self.enemy['name']} attacks you for {damage} damage!")
+            self.log_event("enemy", "attack", damage, self.character,
+                           f"The {self.enemy['name']} attacks you for {damage} damage!")
+    
+    def log_event(self, actor, action, damage, target, message): # sends one event to the sink
+        """
+        Send a BattleEvent for this turn to the battle's sink
+
+        Does nothing (and builds nothing) when the sink is a NullSink.
+        """
+        if self.emit is not None:
+            self.emit(BattleEvent(self.turn_counter, actor, action, damage,
+                                  int(target['health']), message))
     
     def calculate_damage(self, attacker, defender): # calculates damage from attacker to defender
         """
@@ -248,18 +255,14 @@ class SimpleBattle: # simple turn-based combat system
         
         Returns: True if escaped, False if failed
         """
-        # TODO: Implement escape attempt
-        # Use random number or simple calculation
-        # If successful, set combat_active to False
-        import random
-        return random.choice([True, False])
+        return self.rng.chance(0.5)
 
 
 # ============================================================================
 # SPECIAL ABILITIES
 # ============================================================================
 
-def use_special_ability(character, enemy): # uses character's special ability based on class
+def use_special_ability(character, enemy, rng=None): # uses character's special ability based on class
     """
     Use character's class-specific special ability
     
@@ -269,6 +272,9 @@ def use_special_ability(character, enemy): # uses character's special ability ba
     - Rogue: Critical Strike (3x strength damage, 50% chance)
     - Cleric: Heal (restore 30 health)
     
+    Args:
+        rng: GameRNG for random abilities (default: rng.DEFAULT_RNG)
+    
     Returns: String describing what happened
     Raises: AbilityOnCooldownError if ability was used recently
     """
@@ -284,7 +290,7 @@ def use_special_ability(character, enemy): # uses character's special ability ba
         mage_fireball(character, enemy)
         return "You cast Fireball!"
     elif char_class == 'rogue':
-        rogue_critical_strike(character, enemy)
+        rogue_critical_strike(character, enemy, rng)
         return "You performed Critical Strike!"
     elif char_class == 'cleric':
         cleric_heal(character)
@@ -309,12 +315,11 @@ def mage_fireball(character, enemy): # mage special ability
     enemy['health'] = max(0, int(enemy['health']) - int(damage))
 
 
-def rogue_critical_strike(character, enemy): # rogue special ability
-    """Rogue special ability"""
+def rogue_critical_strike(character, enemy, rng=None): # rogue special ability
+    """Rogue special ability (rng: GameRNG, default rng.DEFAULT_RNG)"""
     # TODO: Implement critical strike
     # 50% chance for triple damage
-    import random
-    if random.random() < 0.5:
+    if get_rng(rng).random() < 0.5:
         damage = int(character['strength']) * 3 - (int(enemy['strength']) // 4)
     else:
         damage = int(character['strength']) - (int(enemy['strength']) // 4)
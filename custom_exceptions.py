@@ -40,8 +40,12 @@ class InventoryError(GameError): # the base exception for inventory-related erro
 # Data Loading Exceptions
 class InvalidDataFormatError(DataError):
     """Raised when data file has incorrect format"""
-    def __init__(self):
-        super().__init__("data file has incorrect format")
+    def __init__(self, line_number=None):
+        self.line_number = line_number
+        if line_number is None:
+            super().__init__("data file has incorrect format")
+        else:
+            super().__init__(f"data file has incorrect format (line {line_number})")
 
 class MissingDataFileError(DataError):
     """Raised when required data file is not found"""
@@ -111,6 +115,15 @@ class QuestNotActiveError(QuestError):
     def __init__(self):
         super().__init__("Quest isn't active")
 
+class QuestPrerequisiteCycleError(QuestError):
+    """Raised when quest prerequisites loop back on themselves"""
+    def __init__(self, path=None):
+        self.path = list(path or [])
+        if not self.path:
+            super().__init__("Quest prerequisites form a cycle")
+        else:
+            super().__init__(f"Quest prerequisites form a cycle: {' -> '.join(self.path)}")
+
 # Inventory Exceptions
 class InventoryFullError(InventoryError):
     """Raised when trying to add items to a full inventory"""
@@ -132,6 +145,11 @@ class InvalidItemTypeError(InventoryError):
     def __init__(self):
         super().__init__("Item not recognized")
 
+class OutOfStockError(InventoryError):
+    """Raised when a shop has none of an item left"""
+    def __init__(self):
+        super().__init__("The shop is out of stock")
+
 # Save/Load Exceptions
 class SaveFileCorruptedError(GameError):
     """Raised when save file cannot be loaded due to corruption"""
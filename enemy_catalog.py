@@ -0,0 +1,187 @@
+"""
+COMP 163 - Project 3: Quest Chronicles
+Enemy Catalog Module
+
+This module turns the load_enemies output (data/enemies.txt) into enemy
+templates looked up by type, plus a level-band index for picking a random
+enemy for a character's level. Both are built once, so creating an enemy
+costs one dictionary copy and picking one is a bisect, however many enemy
+types the content file has.
+"""
+
+import os
+from bisect import bisect_right
+
+import game_data
+from custom_exceptions import InvalidTargetError
+from rng import get_rng
+
+# Enemy file next to this module, so enemies load from any working directory
+DEFAULT_ENEMY_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                  "data", "enemies.txt")
+
+# Keys copied into every enemy dictionary (the create_enemy format)
+ENEMY_FIELDS = ["name", "health", "max_health", "strength", "magic",
+                "xp_reward", "gold_reward"]
+
+# Catalog used by combat_system.create_enemy, loaded on first use
+DEFAULT_CATALOG = None
+
+# ============================================================================
+# ENEMY CATALOG
+# ============================================================================
+
+class EnemyCatalog: # enemy templates by type and by level band
+    """
+    Enemy templates indexed by type and level
+
+    Attributes:
+        enemies: The enemy data dictionary (load_enemies output)
+        templates: enemy_id -> enemy dictionary in create_enemy format
+        band_starts: Sorted first level of each level band
+        bands: For each band, (enemy_ids, cumulative_weights) of the
+               enemies that can appear at those levels
+
+    A band is a level range where the same enemies can appear. Levels not
+    covered by any enemy use the closest band below them (or the lowest
+    band, for levels below every enemy).
+    """
+
+    def __init__(self, enemy_data_dict):
+        """Build the templates and level bands from an enemy data dictionary"""
+        self.enemies = enemy_data_dict
+        self.templates = {
+            enemy_id.lower(): {field: enemy[field] for field in ENEMY_FIELDS}
+            for enemy_id, enemy in enemy_data_dict.items()
+        }
+
+        starts = set()
+        for enemy in enemy_data_dict.values():
+            starts.add(enemy["min_level"])
+            if enemy["max_level"] is not None:
+                starts.add(enemy["max_level"] + 1)
+        self.band_starts = sorted(starts)
+        self.bands = []
+        for start in self.band_starts:
+            enemy_ids = []
+            cumulative_weights = []
+            total = 0
+            for enemy_id, enemy in enemy_data_dict.items():
+                if enemy["min_level"] <= start and (enemy["max_level"] is None
+                                                    or start <= enemy["max_level"]):
+                    total += enemy.get("weight", 1)
+                    enemy_ids.append(enemy_id.lower())
+                    cumulative_weights.append(total)
+            self.bands.append((enemy_ids, cumulative_weights))
+
+        # Gaps between bands use the band below; leading gaps the first real band
+        previous = None
+        for position, band in enumerate(self.bands):
+            if band[0]:
+                previous = band
+            elif previous is not None:
+                self.bands[position] = previous
+        first = next((band for band in self.bands if band[0]), None)
+        self.bands = [band if band[0] else first for band in self.bands]
+        if first is None:
+            self.band_starts = []
+            self.bands = []
+
+    @classmethod
+    def load(cls, filename=DEFAULT_ENEMY_FILE): # builds a catalog from an enemy file
+        """
+        Load a catalog from an enemy file (through game_data.load_enemies,
+        so the compiled content cache is used)
+
+        Raises: Same exceptions as game_data.load_enemies
+        """
+        return cls(game_data.load_enemies(filename))
+
+    def __len__(self):
+        return len(self.templates)
+
+    def __contains__(self, enemy_type):
+        return str(enemy_type).lower() in self.templates
+
+    def create(self, enemy_type): # new enemy dictionary for a type
+        """
+        Create an enemy of the given type (case doesn't matter)
+
+        Returns: Enemy dictionary
+        Raises: InvalidTargetError if enemy_type not recognized
+        """
+        template = self.templates.get(str(enemy_type).strip().lower())
+        if template is None:
+            raise InvalidTargetError()
+        return dict(template)
+
+    def enemy_types_for_level(self, level): # enemies that can appear at a level
+        """
+        Get the enemy types that can appear at a level
+
+        Returns: List of enemy IDs (empty if the catalog is empty)
+        """
+        return list(self.band_for_level(level)[0])
+
+    def choose(self, level, rng=None): # weighted random enemy type for a level
+        """
+        Pick an enemy type for a level, weighted by each enemy's WEIGHT
+
+        Args:
+            level: Character level
+            rng: GameRNG or other object with a random() method (default:
+                 rng.DEFAULT_RNG); not used when only one enemy fits the level
+
+        Returns: Enemy ID
+        Raises: InvalidTargetError if the catalog is empty
+        """
+        enemy_ids, cumulative_weights = self.band_for_level(level)
+        if not enemy_ids:
+            raise InvalidTargetError()
+        if len(enemy_ids) == 1:
+            return enemy_ids[0]
+        roll = get_rng(rng).random() * cumulative_weights[-1]
+        return enemy_ids[bisect_right(cumulative_weights, roll)]
+
+    def create_for_level(self, level, rng=None): # random enemy for a level
+        """
+        Create a random enemy suitable for a level
+
+        Returns: Enemy dictionary
+        Raises: InvalidTargetError if the catalog is empty
+        """
+        return dict(self.templates[self.choose(level, rng)])
+
+    # ------------------------------------------------------------------------
+    # Internal helpers
+    # ------------------------------------------------------------------------
+
+    def band_for_level(self, level): # (enemy_ids, cumulative_weights) for a level
+        """Find the level band for level"""
+        if not self.bands:
+            return [], []
+        position = bisect_right(self.band_starts, int(level)) - 1
+        return self.bands[max(position, 0)]
+
+def get_enemy_catalog(): # the catalog create_enemy uses
+    """
+    Get the default enemy catalog, loading DEFAULT_ENEMY_FILE the first time
+
+    Raises: Same exceptions as game_data.load_enemies
+    """
+    global DEFAULT_CATALOG
+    if DEFAULT_CATALOG is None:
+        DEFAULT_CATALOG = EnemyCatalog.load()
+    return DEFAULT_CATALOG
+
+# ============================================================================
+# TESTING
+# ============================================================================
+
+if __name__ == "__main__":
+    print("=== ENEMY CATALOG TEST ===")
+
+    catalog = get_enemy_catalog()
+    for level in [1, 3, 6, 50]:
+        print(f"Level {level}: {catalog.enemy_types_for_level(level)}")
+    print(catalog.create("Orc"))
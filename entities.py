@@ -0,0 +1,439 @@
+"""
+COMP 163 - Project 3: Quest Chronicles
+Entities Module
+
+This module has compact Character and Enemy records: fixed __slots__
+fields (no per-object dictionary) with the numeric stats stored as ints,
+so code reading them never needs int() on values that came back from a
+save file as strings.
+
+Both work anywhere a character or enemy dictionary is expected:
+record['health'], record.get('gold'), 'name' in record, record.items()
+and so on behave like the dictionaries from create_character and
+create_enemy. Keys that aren't fields (equipped_weapon, equipment_bonuses...)
+go in a small extras dictionary that is only made when first needed.
+
+For crowds of enemies, EnemyPool stores each stat as one array instead of
+one object per enemy.
+"""
+
+from array import array
+from collections.abc import MutableMapping
+from itertools import compress
+
+import character_manager
+import combat_system
+from custom_exceptions import InvalidTargetError
+
+# ============================================================================
+# RECORD BASE
+# ============================================================================
+
+class EntityRecord(MutableMapping): # dictionary-compatible slotted record
+    """
+    Base for slotted records that can be used like dictionaries
+
+    Subclasses list their fields in FIELDS (dictionary key -> attribute
+    name, in the same order as __init__'s arguments) and the fields stored
+    as ints in INT_FIELDS. Setting an int field
+    through record[key] converts the value with int(); attributes are
+    expected to be set to ints directly.
+    """
+
+    __slots__ = ("extras",)
+
+    FIELDS = {}
+    INT_FIELDS = frozenset()
+
+    @classmethod
+    def from_dict(cls, data): # builds a record from a dictionary
+        """
+        Build a record from a character or enemy dictionary
+
+        Keys that aren't fields are kept in extras.
+
+        Raises: KeyError if a field is missing
+                ValueError if an int field isn't a number
+        """
+        record = cls(*[data[key] for key in cls.FIELDS]) # FIELDS is in __init__ order
+        if len(data) > len(cls.FIELDS):
+            for key, value in data.items():
+                if key not in cls.FIELDS:
+                    record[key] = value
+        return record
+
+    def to_dict(self): # back to a plain dictionary
+        """Return the record as a plain dictionary (fields first, then extras)"""
+        return dict(self.items())
+
+    def __getitem__(self, key):
+        attr = self.FIELDS.get(key)
+        if attr is not None:
+            return getattr(self, attr)
+        extras = self.extras
+        if extras is not None and key in extras:
+            return extras[key]
+        raise KeyError(key)
+
+    def __setitem__(self, key, value):
+        attr = self.FIELDS.get(key)
+        if attr is None:
+            if self.extras is None:
+                self.extras = {}
+            self.extras[key] = value
+        elif key in self.INT_FIELDS:
+            setattr(self, attr, int(value))
+        else:
+            setattr(self, attr, value)
+
+    def __delitem__(self, key):
+        """
+        Remove an extra key
+
+        Raises: KeyError if key is a field (fields can't be removed) or missing
+        """
+        if key in self.FIELDS or self.extras is None:
+            raise KeyError(key)
+        del self.extras[key]
+
+    def __contains__(self, key):
+        return key in self.FIELDS or (self.extras is not None and key in self.extras)
+
+    def __iter__(self):
+        yield from self.FIELDS
+        if self.extras is not None:
+            yield from list(self.extras)
+
+    def __len__(self):
+        return len(self.FIELDS) + (len(self.extras) if self.extras is not None else 0)
+
+    def get(self, key, default=None): # dictionary-style lookup without exceptions
+        """Return the value for key, or default if there is none"""
+        attr = self.FIELDS.get(key)
+        if attr is not None:
+            return getattr(self, attr)
+        extras = self.extras
+        if extras is not None:
+            return extras.get(key, default)
+        return default
+
+    def __repr__(self):
+        return f"{type(self).__name__}({self.to_dict()!r})"
+
+# ============================================================================
+# CHARACTER AND ENEMY
+# ============================================================================
+
+class Character(EntityRecord): # slotted character
+    """
+    Player character with the same keys as create_character's dictionary
+
+    The 'class' key is the character_class attribute.
+    """
+
+    __slots__ = ("name", "character_class", "level", "health", "max_health",
+                 "strength", "magic", "experience", "gold", "inventory",
+                 "active_quests", "completed_quests")
+
+    FIELDS = {
+        "name": "name",
+        "class": "character_class",
+        "level": "level",
+        "health": "health",
+        "max_health": "max_health",
+        "strength": "strength",
+        "magic": "magic",
+        "experience": "experience",
+        "gold": "gold",
+        "inventory": "inventory",
+        "active_quests": "active_quests",
+        "completed_quests": "completed_quests"
+    }
+    INT_FIELDS = frozenset(["level", "health", "max_health", "strength",
+                            "magic", "experience", "gold"])
+
+    def __init__(self, name, character_class, level, health, max_health, strength,
+                 magic, experience, gold, inventory, active_quests, completed_quests):
+        self.extras = None
+        self.name = name
+        self.character_class = character_class
+        self.level = int(level)
+        self.health = int(health)
+        self.max_health = int(max_health)
+        self.strength = int(strength)
+        self.magic = int(magic)
+        self.experience = int(experience)
+        self.gold = int(gold)
+        self.inventory = inventory
+        self.active_quests = active_quests
+        self.completed_quests = completed_quests
+
+    @classmethod
+    def create(cls, name, character_class): # same as create_character, as a record
+        """
+        Create a new character (see character_manager.create_character)
+
+        Raises: InvalidCharacterClassError if class is invalid
+        """
+        return cls.from_dict(character_manager.create_character(name, character_class))
+
+class Enemy(EntityRecord): # slotted enemy
+    """Enemy with the same keys as create_enemy's dictionary"""
+
+    __slots__ = ("name", "health", "max_health", "strength", "magic",
+                 "xp_reward", "gold_reward")
+
+    FIELDS = {
+        "name": "name",
+        "health": "health",
+        "max_health": "max_health",
+        "strength": "strength",
+        "magic": "magic",
+        "xp_reward": "xp_reward",
+        "gold_reward": "gold_reward"
+    }
+    INT_FIELDS = frozenset(["health", "max_health", "strength", "magic",
+                            "xp_reward", "gold_reward"])
+
+    def __init__(self, name, health, max_health, strength, magic, xp_reward, gold_reward):
+        self.extras = None
+        self.name = name
+        self.health = int(health)
+        self.max_health = int(max_health)
+        self.strength = int(strength)
+        self.magic = int(magic)
+        self.xp_reward = int(xp_reward)
+        self.gold_reward = int(gold_reward)
+
+    @classmethod
+    def create(cls, enemy_type): # same as create_enemy, as a record
+        """
+        Create an enemy (see combat_system.create_enemy)
+
+        Raises: InvalidTargetError if enemy_type not recognized
+        """
+        return cls.from_dict(combat_system.create_enemy(enemy_type))
+
+    def is_dead(self): # health reached 0
+        """Return True if the enemy has no health left"""
+        return self.health <= 0
+
+# ============================================================================
+# ENEMY POOL
+# ============================================================================
+
+# Stat columns kept by EnemyPool (named after the enemy dictionary keys)
+POOL_COLUMNS = ["health", "max_health", "strength", "magic", "xp_reward", "gold_reward"]
+
+class EnemyPool: # struct-of-arrays storage for many enemies
+    """
+    Many enemies stored as parallel arrays, one per stat
+
+    The enemy in slot i is names[i], health[i], strength[i] and so on, and
+    live[i] is 1 while the slot holds an enemy. Released slots are reused by
+    later spawns, so a long-running world doesn't keep growing or create
+    an object per enemy. Stat columns are array('q') (64-bit ints), and
+    the bulk methods work on whole columns at once.
+
+    Free slots always have 0 health, so damaging everything never brings
+    them back.
+    """
+
+    def __init__(self):
+        """Create an empty pool"""
+        self.names = []
+        self.live = bytearray()
+        self.free = [] # released slots, reused last in first out
+        self.count = 0
+        self.health = array("q")
+        self.max_health = array("q")
+        self.strength = array("q")
+        self.magic = array("q")
+        self.xp_reward = array("q")
+        self.gold_reward = array("q")
+        self.columns = [self.health, self.max_health, self.strength,
+                        self.magic, self.xp_reward, self.gold_reward]
+
+    def __len__(self):
+        return self.count
+
+    def capacity(self): # slots allocated, live or free
+        """Return the number of slots the pool has allocated"""
+        return len(self.names)
+
+    # ------------------------------------------------------------------------
+    # Spawning and releasing
+    # ------------------------------------------------------------------------
+
+    def spawn(self, enemy): # one enemy -> slot
+        """
+        Add one enemy to the pool
+
+        Args:
+            enemy: Enemy type name ("goblin"), enemy dictionary or Enemy record
+
+        Returns: Slot number of the new enemy
+        Raises: InvalidTargetError if enemy is an unknown type name
+        """
+        return self.spawn_many(enemy, 1)[0]
+
+    def spawn_many(self, enemy, amount): # many copies of one enemy -> slots
+        """
+        Add amount copies of one enemy, filling free slots first
+
+        Returns: List of slot numbers
+        Raises: InvalidTargetError if enemy is an unknown type name
+        """
+        if isinstance(enemy, str):
+            enemy = combat_system.create_enemy(enemy)
+        name = enemy['name']
+        values = [int(enemy[column]) for column in POOL_COLUMNS]
+
+        reused = self.free[len(self.free) - min(amount, len(self.free)):]
+        del self.free[len(self.free) - len(reused):]
+        names = self.names
+        live = self.live
+        for slot in reused:
+            names[slot] = name
+            live[slot] = 1
+        for column, value in zip(self.columns, values):
+            for slot in reused:
+                column[slot] = value
+
+        new = amount - len(reused)
+        start = len(self.names)
+        self.names.extend([name] * new)
+        self.live.extend(b"\x01" * new)
+        for column, value in zip(self.columns, values):
+            column.extend(array("q", [value]) * new)
+
+        self.count += amount
+        return reused[::-1] + list(range(start, start + new))
+
+    def release(self, slot): # frees one slot for reuse
+        """
+        Remove the enemy in slot from the pool
+
+        Raises: InvalidTargetError if the slot holds no enemy
+        """
+        self.release_many([slot])
+
+    def release_many(self, slots): # frees many slots for reuse
+        """
+        Remove the enemies in slots from the pool
+
+        Raises: InvalidTargetError if a slot holds no enemy (slots before it
+                are still released)
+        """
+        live = self.live
+        health = self.health
+        free = self.free
+        size = len(live)
+        for slot in slots:
+            if not 0 <= slot < size or not live[slot]:
+                raise InvalidTargetError
+            live[slot] = 0
+            health[slot] = 0
+            free.append(slot)
+            self.count -= 1
+
+    # ------------------------------------------------------------------------
+    # Bulk updates and queries
+    # ------------------------------------------------------------------------
+
+    def damage(self, slot, amount): # damages one enemy
+        """
+        Damage one enemy (health stops at 0)
+
+        Returns: The enemy's health afterwards
+        """
+        health = max(0, self.health[slot] - int(amount))
+        self.health[slot] = health
+        return health
+
+    def damage_many(self, slots, amounts): # damages chosen enemies
+        """
+        Damage several enemies
+
+        Args:
+            slots: Slot numbers
+            amounts: One amount for every slot, or a single int for all of them
+        """
+        health = self.health
+        if isinstance(amounts, int):
+            amounts = [amounts] * len(slots)
+        for slot, amount in zip(slots, amounts):
+            left = health[slot] - amount
+            health[slot] = left if left > 0 else 0
+
+    def damage_all(self, amount): # damages every enemy in the pool
+        """Damage every enemy in the pool by the same amount"""
+        amount = int(amount)
+        self.health[:] = array("q", [h - amount if h > amount else 0 for h in self.health])
+
+    def attack_all(self, attacker_strength): # basic attack on every enemy
+        """
+        Hit every enemy with a basic attack from an attacker with the given
+        strength (same formula as SimpleBattle.calculate_damage)
+        """
+        attacker_strength = int(attacker_strength)
+        # Few distinct strengths, so work out each one's damage once
+        damage_for = {s: max(1, attacker_strength - s // 4) for s in set(self.strength)}
+        self.health[:] = array("q", [
+            h - d if h > d else 0
+            for h, d in zip(self.health, map(damage_for.__getitem__, self.strength))
+        ])
+
+    def find_dead(self): # slots of live enemies with no health
+        """Return the slots of enemies in the pool whose health is 0"""
+        live = self.live
+        candidates = compress(range(len(live)), map((0).__ge__, self.health))
+        return [slot for slot in candidates if live[slot]]
+
+    def live_slots(self): # slots holding an enemy
+        """Return every slot that holds an enemy"""
+        return list(compress(range(len(self.live)), self.live))
+
+    def reap(self): # removes dead enemies and totals their rewards
+        """
+        Release every dead enemy
+
+        Returns: Dictionary {'slots': released slots, 'xp': total xp_reward,
+                 'gold': total gold_reward}
+        """
+        dead = self.find_dead()
+        xp_reward = self.xp_reward
+        gold_reward = self.gold_reward
+        xp = sum(xp_reward[slot] for slot in dead)
+        gold = sum(gold_reward[slot] for slot in dead)
+        self.release_many(dead)
+        return {'slots': dead, 'xp': xp, 'gold': gold}
+
+    def get(self, slot): # one enemy as a record
+        """
+        Copy the enemy in slot into an Enemy record
+
+        Raises: InvalidTargetError if the slot holds no enemy
+        """
+        if not 0 <= slot < len(self.live) or not self.live[slot]:
+            raise InvalidTargetError
+        return Enemy(self.names[slot], *[column[slot] for column in self.columns])
+
+# ============================================================================
+# TESTING
+# ============================================================================
+
+if __name__ == "__main__":
+    print("=== ENTITIES TEST ===")
+
+    hero = Character.create("RecordHero", "Warrior")
+    orc = Enemy.create("orc")
+    orc['health'] = "40"
+    print(f"{hero['name']} ({hero['class']}) vs {orc['name']} with {orc.health} HP")
+    print(orc.to_dict())
+
+    pool = EnemyPool()
+    pool.spawn_many("goblin", 1000)
+    pool.attack_all(hero.strength)
+    pool.damage_all(40)
+    print(f"Reaped {len(pool.reap()['slots'])} goblins, {len(pool)} left")
@@ -0,0 +1,145 @@
+"""
+COMP 163 - Project 3: Quest Chronicles
+Equipment Module
+
+This module keeps track of what a character has equipped and the stat
+bonuses that equipment gives, separately from the character's base stats.
+
+character['strength'], ['magic'] and ['max_health'] stay the totals
+(base + equipment bonus) that the rest of the game reads, so combat never
+has to add bonuses up. The bonuses are stored in
+character['equipment_bonuses'], so base stats can always be recovered
+and the totals rebuilt.
+"""
+
+# Equipment slots, named after the item type that goes in them.
+# Slot "weapon" uses character['equipped_weapon'] and
+# character['equipped_weapon_effect'] (same for "armor").
+EQUIPMENT_SLOTS = ["weapon", "armor"]
+
+# Stats that have a base value plus equipment bonuses
+DERIVED_STATS = ["strength", "magic", "max_health"]
+
+# Stats an equipment effect may change
+EQUIPMENT_STATS = ["health", "max_health", "strength", "magic"]
+
+# ============================================================================
+# BASE STATS AND BONUSES
+# ============================================================================
+
+def get_equipment_bonuses(character): # stat -> total bonus from equipment
+    """
+    Get the stat bonuses from everything equipped
+
+    Returns: Dictionary {stat_name: bonus}
+    """
+    return dict(character.get("equipment_bonuses", {}))
+
+def get_base_stats(character): # stats without equipment
+    """
+    Get the character's stats without equipment bonuses
+
+    Returns: Dictionary {stat_name: value} for DERIVED_STATS
+    """
+    bonuses = character.get("equipment_bonuses", {})
+    return {stat: character[stat] - bonuses.get(stat, 0) for stat in DERIVED_STATS}
+
+def recompute_stats(character, base_stats=None): # rebuilds totals from base stats and equipment
+    """
+    Rebuild equipment bonuses from the equipped items and set every
+    derived stat to base + bonus
+
+    Args:
+        character: Character dictionary
+        base_stats: Optional {stat_name: value}; defaults to get_base_stats()
+
+    Returns: Dictionary of the new totals
+    """
+    if base_stats is None:
+        base_stats = get_base_stats(character)
+    bonuses = {}
+    for slot in EQUIPMENT_SLOTS:
+        effect = character.get(f"equipped_{slot}_effect")
+        if character.get(f"equipped_{slot}") and effect:
+            stat, value = effect
+            bonuses[stat] = bonuses.get(stat, 0) + value
+    character["equipment_bonuses"] = bonuses
+    for stat in DERIVED_STATS:
+        character[stat] = base_stats[stat] + bonuses.get(stat, 0)
+    if character.get("health", 0) > character["max_health"]:
+        character["health"] = character["max_health"]
+    return {stat: character[stat] for stat in DERIVED_STATS}
+
+# ============================================================================
+# EQUIP AND UNEQUIP
+# ============================================================================
+
+def get_equipped(character, slot): # item ID in a slot
+    """Return the item ID equipped in slot, or None"""
+    return character.get(f"equipped_{slot}")
+
+def set_equipped(character, slot, item_id, effect): # puts an item in a slot
+    """
+    Equip item_id in slot, replacing (and un-applying) whatever was there
+
+    Moving items in or out of the inventory is up to the caller
+    (see inventory_system.equip_weapon/equip_armor).
+
+    Args:
+        character: Character dictionary
+        slot: One of EQUIPMENT_SLOTS
+        item_id: Item to equip
+        effect: Tuple (stat_name, value) the item adds, or None
+
+    Returns: Item ID that was in the slot before, or None
+    Raises: ValueError if slot or the effect's stat is not valid
+    """
+    if slot not in EQUIPMENT_SLOTS:
+        raise ValueError(f"Unknown equipment slot: {slot}")
+    if effect is not None and effect[0] not in EQUIPMENT_STATS:
+        raise ValueError(f"Invalid stat name {effect[0]}")
+    old_item_id = clear_equipped(character, slot)
+    character[f"equipped_{slot}"] = item_id
+    character[f"equipped_{slot}_effect"] = effect
+    if effect is not None:
+        add_bonus(character, effect[0], effect[1])
+    return old_item_id
+
+def clear_equipped(character, slot): # empties a slot
+    """
+    Unequip whatever is in slot and remove its bonus
+
+    Returns: Item ID that was unequipped, or None if the slot was empty
+    """
+    item_id = character.get(f"equipped_{slot}")
+    if not item_id:
+        return None
+    effect = character.get(f"equipped_{slot}_effect")
+    if effect:
+        add_bonus(character, effect[0], -effect[1])
+    character[f"equipped_{slot}"] = None
+    character[f"equipped_{slot}_effect"] = None
+    return item_id
+
+def add_bonus(character, stat, value): # changes one equipment bonus and its total
+    """Add value to a stat's equipment bonus and to the stat total"""
+    bonuses = character.setdefault("equipment_bonuses", {})
+    bonuses[stat] = bonuses.get(stat, 0) + value
+    if not bonuses[stat]:
+        del bonuses[stat]
+    character[stat] = character.get(stat, 0) + value
+    if stat == "max_health" and character.get("health", 0) > character["max_health"]:
+        character["health"] = character["max_health"]
+
+# ============================================================================
+# TESTING
+# ============================================================================
+
+if __name__ == "__main__":
+    print("=== EQUIPMENT TEST ===")
+
+    hero = {'health': 100, 'max_health': 100, 'strength': 10, 'magic': 5}
+    set_equipped(hero, "weapon", "iron_sword", ("strength", 5))
+    set_equipped(hero, "armor", "leather_armor", ("max_health", 10))
+    print(f"Totals: {hero['strength']} STR, {hero['max_health']} max HP")
+    print(f"Base: {get_base_stats(hero)}, bonuses: {get_equipment_bonuses(hero)}")
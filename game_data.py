@@ -10,17 +10,26 @@ This module handles loading and validating game data from text files.
 """
 
 import os
+import pickle
+import tempfile
 from custom_exceptions import (
     InvalidDataFormatError,
     MissingDataFileError,
     CorruptedDataError
 )
 
+# Compiled content caches are written next to the source file as
+# {filename}.cache and are only used while the source's size and
+# modification time still match. Bump the version when the parsed
+# format changes.
+CONTENT_CACHE_VERSION = 1
+CONTENT_CACHE_SUFFIX = ".cache"
+
 # ============================================================================
 # DATA LOADING FUNCTIONS
 # ============================================================================
 
-def load_quests(filename="data/quests.txt"): # loads quest data from a text file
+def load_quests(filename="data/quests.txt", use_cache=True): # loads quest data from a text file
     """
     Load quest data from file
     
@@ -41,49 +50,19 @@ def load_quests(filename="data/quests.txt"): # loads quest data from a text file
     # - FileNotFoundError → raise MissingDataFileError
     # - Invalid format → raise InvalidDataFormatError
     # - Corrupted/unreadable data → raise CorruptedDataError
+    source_info, quests = read_content_cache(filename, "quests") if use_cache else (None, None)
+    if quests is not None:
+        return quests
     quests = {}
-    try:
-        with open(filename, "r", encoding="utf-8") as f:
-            content = f.read()
-    except FileNotFoundError:
-        raise MissingDataFileError
-    except OSError:
-        raise CorruptedDataError
-    quest_blocks = [block.strip() for block in content.split("\n\n") if block.strip()]
-    for block in quest_blocks: 
-        quest_data = {}
-        try:
-            for line in block.splitlines():
-                if ":" not in line:
-                    raise InvalidDataFormatError
-                key, value = line.split(":", 1)
-                quest_data[key.strip().lower()] = value.strip()
-            required_keys = [
-                "quest_id", "title", "description", 
-                "reward_xp", "reward_gold",
-                "required_level", "prerequisite"
-            ]
-            for key in required_keys:
-                if key not in quest_data: 
-                    raise InvalidDataFormatError
-            try:
-                quest_data["reward_xp"] = int(quest_data["reward_xp"])
-                quest_data["reward_gold"] = int(quest_data["reward_gold"])
-                quest_data["required_level"] = int(quest_data["required_level"])
-            except ValueError:
-                raise InvalidDataFormatError
-            quest_id = quest_data["quest_id"]
-            quests[quest_id] = quest_data
-        except Exception as e:
-            if isinstance(e, (InvalidDataFormatError,)):
-                raise
-            else:
-                raise CorruptedDataError
+    for quest_data in iter_quests(filename):
+        quests[quest_data["quest_id"]] = quest_data
+    if source_info is not None:
+        write_content_cache(filename, "quests", source_info, quests)
     return quests
 
     
 
-def load_items(filename="data/items.txt"): # loads item data from a text file
+def load_items(filename="data/items.txt", use_cache=True): # loads item data from a text file
     """
     Load item data from file
     
@@ -100,40 +79,257 @@ def load_items(filename="data/items.txt"): # loads item data from a text file
     """
     # TODO: Implement this function
     # Must handle same exceptions as load_quests
-    if not os.path.exists(filename):
-        raise MissingDataFileError
+    source_info, items = read_content_cache(filename, "items") if use_cache else (None, None)
+    if items is not None:
+        return items
+    items = {}
+    for item_content in iter_items(filename):
+        items[item_content["item_id"]] = item_content
+    if source_info is not None:
+        write_content_cache(filename, "items", source_info, items)
+    return items
+
+def load_enemies(filename="data/enemies.txt", use_cache=True): # loads enemy templates from a text file
+    """
+    Load enemy templates from file
+    
+    Expected format per enemy (separated by blank lines):
+    ENEMY_ID: unique_enemy_type
+    NAME: Enemy Display Name
+    HEALTH: 50
+    STRENGTH: 8
+    MAGIC: 2
+    XP_REWARD: 25
+    GOLD_REWARD: 10
+    MIN_LEVEL: 1
+    MAX_LEVEL: 2 (or NONE for no upper limit)
+    WEIGHT: 1 (optional, how often it is picked among enemies for a level)
+    
+    Returns: Dictionary of enemies {enemy_id: enemy_data_dict}
+    Raises: MissingDataFileError, InvalidDataFormatError, CorruptedDataError
+    """
+    source_info, enemies = read_content_cache(filename, "enemies") if use_cache else (None, None)
+    if enemies is not None:
+        return enemies
+    enemies = {}
+    for enemy_data in iter_enemies(filename):
+        enemies[enemy_data["enemy_id"]] = enemy_data
+    if source_info is not None:
+        write_content_cache(filename, "enemies", source_info, enemies)
+    return enemies
+
+# ============================================================================
+# COMPILED CONTENT CACHE
+# ============================================================================
+
+def get_cache_path(filename): # path of the compiled cache for a content file
+    """Return the compiled cache path for a content file"""
+    return filename + CONTENT_CACHE_SUFFIX
+
+def read_content_cache(filename, kind): # reads a compiled cache if it is still current
+    """
+    Read the compiled cache for a content file
+
+    The cache is only used if it was built by this cache version, for the
+    same kind of content, from a source file with the same path, size and
+    modification time. A missing, stale or unreadable cache is ignored.
+
+    Returns: Tuple (source_key, data); data is None when the cache can't
+             be used, and source_key is None when the source doesn't exist
+    """
+    try:
+        info = os.stat(filename)
+    except OSError:
+        return None, None
+    source_key = (os.path.abspath(filename), info.st_size, info.st_mtime_ns)
+    try:
+        with open(get_cache_path(filename), "rb") as file:
+            cached = pickle.load(file)
+    except Exception:
+        return source_key, None
+    if (not isinstance(cached, dict)
+            or cached.get("version") != CONTENT_CACHE_VERSION
+            or cached.get("kind") != kind
+            or cached.get("source") != source_key):
+        return source_key, None
+    return source_key, cached["data"]
+
+def write_content_cache(filename, kind, source_key, data): # writes a compiled cache
+    """
+    Write the compiled cache for a content file
+
+    source_key must be the key read before parsing, so a source that
+    changes while it is being parsed never gets a matching cache.
+    The cache is only an optimization; failures to write it are ignored.
+
+    Returns: True if the cache was written
+    """
+    cached = {
+        "version": CONTENT_CACHE_VERSION,
+        "kind": kind,
+        "source": source_key,
+        "data": data
+    }
+    cache_path = get_cache_path(filename)
+    try:
+        fd, temp_path = tempfile.mkstemp(dir=os.path.dirname(cache_path) or ".",
+                                         prefix=".", suffix=".tmp")
+    except OSError:
+        return False
+    try:
+        with os.fdopen(fd, "wb") as file:
+            pickle.dump(cached, file, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temp_path, cache_path)
+    except OSError:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        return False
+    return True
+
+# ============================================================================
+# STREAMING PARSERS
+# ============================================================================
+
+QUEST_REQUIRED_KEYS = [
+    "quest_id", "title", "description",
+    "reward_xp", "reward_gold",
+    "required_level", "prerequisite"
+]
+QUEST_NUMERIC_KEYS = ["reward_xp", "reward_gold", "required_level"]
+
+def iter_blocks(filename): # streams blank-line separated blocks from a data file
+    """
+    Read a data file one line at a time and yield its blocks
+
+    Blocks are separated by blank lines. Only the current block is kept
+    in memory, so files of any size use constant memory.
+
+    Yields: List of (line_number, key, value) tuples for one block
+            (keys lowercased, keys and values stripped)
+    Raises:
+        MissingDataFileError if the file doesn't exist
+        CorruptedDataError if the file can't be read
+        InvalidDataFormatError (with line_number) if a line has no ':'
+    """
     try:
-        with open(filename, "r") as file:
-            data = file.read()
-    except (OSError, IOError):
+        file = open(filename, "r", encoding="utf-8")
+    except FileNotFoundError:
+        raise MissingDataFileError
+    except OSError:
         raise CorruptedDataError
-    items = {}
-    raw_items = data.strip().split("\n\n")
-    for section in raw_items:
-        lines = section.strip().split("\n")
-        item_content = {}
+    with file:
+        block = []
         try:
-            for line in lines:
-                key, value = line.split(":", 1)
-                key = key.strip().lower()
-                value = value.strip()
-
-                if key == "item_id":
-                    item_id = value
-                    item_content["item_id"] = item_id
-                elif key == "effect":
+            for line_number, line in enumerate(file, start=1):
+                key, separator, value = line.partition(":")
+                if not separator:
+                    if line.strip():
+                        raise InvalidDataFormatError(line_number)
+                    if block:
+                        yield block
+                        block = []
+                    continue
+                block.append((line_number, key.strip().lower(), value.strip()))
+        except (OSError, UnicodeDecodeError):
+            raise CorruptedDataError
+        if block:
+            yield block
+
+def iter_quests(filename="data/quests.txt"): # streams quests one at a time
+    """
+    Stream quests from a quest file
+
+    Yields: Quest dictionaries in file order (same fields as load_quests)
+    Raises: MissingDataFileError, InvalidDataFormatError, CorruptedDataError
+            InvalidDataFormatError.line_number points at the bad line
+    """
+    for block in iter_blocks(filename):
+        quest_data = {}
+        line_numbers = {}
+        for line_number, key, value in block:
+            quest_data[key] = value
+            line_numbers[key] = line_number
+        for key in QUEST_REQUIRED_KEYS:
+            if key not in quest_data:
+                raise InvalidDataFormatError(block[0][0])
+        for key in QUEST_NUMERIC_KEYS:
+            try:
+                quest_data[key] = int(quest_data[key])
+            except ValueError:
+                raise InvalidDataFormatError(line_numbers[key])
+        yield quest_data
+
+def iter_items(filename="data/items.txt"): # streams items one at a time
+    """
+    Stream items from an item file
+
+    Yields: Item dictionaries in file order (same fields as load_items)
+    Raises: MissingDataFileError, InvalidDataFormatError, CorruptedDataError
+            InvalidDataFormatError.line_number points at the bad line
+    """
+    for block in iter_blocks(filename):
+        item_content = {}
+        for line_number, key, value in block:
+            try:
+                if key == "effect":
                     stat, val = value.split(":")
                     item_content["effect"] = {stat.strip(): int(val.strip())}
                 elif key == "cost":
                     item_content["cost"] = int(value)
                 else:
-                    item_content[key] = value 
-            if not item_id:
-                raise InvalidDataFormatError
-            items[item_id] = item_content
+                    item_content[key] = value
+            except ValueError:
+                raise InvalidDataFormatError(line_number)
+        if not item_content.get("item_id"):
+            raise InvalidDataFormatError(block[0][0])
+        yield item_content
+
+ENEMY_REQUIRED_KEYS = [
+    "enemy_id", "name", "health", "strength", "magic",
+    "xp_reward", "gold_reward", "min_level", "max_level"
+]
+ENEMY_NUMERIC_KEYS = [
+    "health", "max_health", "strength", "magic",
+    "xp_reward", "gold_reward", "min_level", "max_level", "weight"
+]
+
+def iter_enemies(filename="data/enemies.txt"): # streams enemy templates one at a time
+    """
+    Stream enemy templates from an enemy file
+
+    The enemy_id is lowercased, max_health defaults to health, a MAX_LEVEL
+    of NONE becomes None and WEIGHT defaults to 1.
+
+    Yields: Enemy dictionaries in file order (same fields as load_enemies)
+    Raises: MissingDataFileError, InvalidDataFormatError, CorruptedDataError
+            InvalidDataFormatError.line_number points at the bad line
+    """
+    for block in iter_blocks(filename):
+        enemy_data = {}
+        line_numbers = {}
+        for line_number, key, value in block:
+            enemy_data[key] = value
+            line_numbers[key] = line_number
+        for key in ENEMY_REQUIRED_KEYS:
+            if key not in enemy_data:
+                raise InvalidDataFormatError(block[0][0])
+        enemy_data["enemy_id"] = enemy_data["enemy_id"].lower()
+        enemy_data.setdefault("max_health", enemy_data["health"])
+        enemy_data.setdefault("weight", "1")
+        if enemy_data["max_level"].upper() == "NONE":
+            enemy_data["max_level"] = None
+        for key in ENEMY_NUMERIC_KEYS:
+            if enemy_data[key] is None:
+                continue
+            try:
+                enemy_data[key] = int(enemy_data[key])
+            except ValueError:
+                raise InvalidDataFormatError(line_numbers.get(key, block[0][0]))
+        try:
+            validate_enemy_data(enemy_data)
         except InvalidDataFormatError:
-            raise InvalidDataFormatError
-    return items
+            raise InvalidDataFormatError(block[0][0])
+        yield enemy_data
 
 def validate_quest_data(quest_dict): # validates that the quest data has all required fields and correct types
     """
@@ -196,6 +392,32 @@ def validate_item_data(item_dict): # validates that the item data has all requir
         raise InvalidDataFormatError
     return True
 
+def validate_enemy_data(enemy_dict): # validates that the enemy data has all required fields and sensible values
+    """
+    Validate that enemy dictionary has all required fields
+
+    Required fields: enemy_id, name, health, strength, magic,
+                    xp_reward, gold_reward, min_level, max_level
+    Levels: min_level <= max_level (max_level None = no limit)
+    Weight: more than 0 (if given)
+
+    Returns: True if valid
+    Raises: InvalidDataFormatError if missing fields or bad values
+    """
+    for field in ENEMY_REQUIRED_KEYS:
+        if field not in enemy_dict:
+            raise InvalidDataFormatError
+    try:
+        min_level = int(enemy_dict["min_level"])
+        max_level = enemy_dict["max_level"]
+        if max_level is not None and int(max_level) < min_level:
+            raise InvalidDataFormatError
+        if int(enemy_dict.get("weight", 1)) <= 0 or int(enemy_dict["health"]) <= 0:
+            raise InvalidDataFormatError
+    except (ValueError, TypeError):
+        raise InvalidDataFormatError
+    return True
+
 def create_default_data_files(): # creates default data files if they don't exist
     """
     Create default data files if they don't exist
@@ -208,6 +430,7 @@ def create_default_data_files(): # creates default data files if they don't exis
     data_dir = "data"
     quests_file = os.path.join(data_dir, "quests.txt")
     items_file = os.path.join(data_dir, "items.txt")
+    enemies_file = os.path.join(data_dir, "enemies.txt")
     try:
         if not os.path.exists(data_dir):
             os.makedirs(data_dir, exist_ok=True)
@@ -245,6 +468,37 @@ def create_default_data_files(): # creates default data files if they don't exis
                 "COST: 50\n"
                 "DESCRIPTION: A basic potion for adventurers.\n"
                 )
+        if not os.path.exists(enemies_file):
+            with open(enemies_file, "w", encoding="utf-8") as f:
+                f.write(
+                "ENEMY_ID: goblin\n"
+                "NAME: Goblin\n"
+                "HEALTH: 50\n"
+                "STRENGTH: 8\n"
+                "MAGIC: 2\n"
+                "XP_REWARD: 25\n"
+                "GOLD_REWARD: 10\n"
+                "MIN_LEVEL: 1\n"
+                "MAX_LEVEL: 2\n\n"
+                "ENEMY_ID: orc\n"
+                "NAME: Orc\n"
+                "HEALTH: 80\n"
+                "STRENGTH: 12\n"
+                "MAGIC: 5\n"
+                "XP_REWARD: 50\n"
+                "GOLD_REWARD: 25\n"
+                "MIN_LEVEL: 3\n"
+                "MAX_LEVEL: 5\n\n"
+                "ENEMY_ID: dragon\n"
+                "NAME: Dragon\n"
+                "HEALTH: 200\n"
+                "STRENGTH: 25\n"
+                "MAGIC: 15\n"
+                "XP_REWARD: 200\n"
+                "GOLD_REWARD: 100\n"
+                "MIN_LEVEL: 6\n"
+                "MAX_LEVEL: NONE\n"
+                )
     except PermissionError:
         raise PermissionError("Insufficient permissions to create data files.")
 
@@ -347,53 +601,48 @@ if __name__ == "__main__":
     except InvalidDataFormatError as e:
         print(f"Invalid item format: {e}")
     
-quest = {
-    "quest_id": "quest_001",
-    "title": "First Steps",
-    "description": "Defeat 5 slimes in the forest.",
-    "reward_xp": 100,
-    "reward_gold": 50,
-    "required_level": 1,
-    "prerequisite": "NONE"
-}
-
-try:
-    if validate_quest_data(quest):
-        print("Quest data is valid!")
-except InvalidDataFormatError as e:
-    print("Validation failed:", e)
-
-item = {
-    "item_id": "sword_001",
-    "name": "Iron Sword",
-    "type": "weapon",
-    "effect": "Deals extra damage to slimes",
-    "cost": 150,
-    "description": "A sturdy iron sword."
-}
-
-try:
-    if validate_item_data(item):
-        print("Item data is valid!")
-except InvalidDataFormatError as e:
-    print("Validation failed:", e)
-
-try:
-    create_default_data_files()
-    print("Default data files are ready!")
-except PermissionError as e:
-    print("Setup failed:", e)
-lines = [
-    "id: 101",
-    "name: Rescue the Villager",
-    "difficulty: 3",
-    "reward: 50"
-]
-
-quest = parse_quest_block(lines)
-print(quest)
+    quest = {
+        "quest_id": "quest_001",
+        "title": "First Steps",
+        "description": "Defeat 5 slimes in the forest.",
+        "reward_xp": 100,
+        "reward_gold": 50,
+        "required_level": 1,
+        "prerequisite": "NONE"
+    }
 
+    try:
+        if validate_quest_data(quest):
+            print("Quest data is valid!")
+    except InvalidDataFormatError as e:
+        print("Validation failed:", e)
 
+    item = {
+        "item_id": "sword_001",
+        "name": "Iron Sword",
+        "type": "weapon",
+        "effect": "Deals extra damage to slimes",
+        "cost": 150,
+        "description": "A sturdy iron sword."
+    }
 
+    try:
+        if validate_item_data(item):
+            print("Item data is valid!")
+    except InvalidDataFormatError as e:
+        print("Validation failed:", e)
 
+    try:
+        create_default_data_files()
+        print("Default data files are ready!")
+    except PermissionError as e:
+        print("Setup failed:", e)
+    lines = [
+        "id: 101",
+        "name: Rescue the Villager",
+        "difficulty: 3",
+        "reward: 50"
+    ]
 
+    quest = parse_quest_block(lines)
+    print(quest)
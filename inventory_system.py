@@ -16,10 +16,196 @@ from custom_exceptions import (
     InvalidItemTypeError
 )
 from collections import Counter #Ai helped me import Counter for counting items in inventory
+from contextlib import contextmanager
+from item_catalog import ItemRecord, parse_effect
+import equipment
 
 # Maximum inventory size
 MAX_INVENTORY_SIZE = 20
 
+# ============================================================================
+# COUNTED INVENTORY
+# ============================================================================
+
+class Inventory: # item_id -> quantity, with stacks and a slot budget
+    """
+    Inventory that stores a quantity per item ID instead of one list entry
+    per item, so adding, removing, counting and checking items don't scan.
+
+    Items fill slots: one slot holds up to stack_limit of the same item
+    (or stack_limits[item_id] for items with their own limit). With the
+    default stack_limit of 1, the MAX_INVENTORY_SIZE slot budget is the
+    same 20-item limit as the list inventory.
+
+    It also works where a list of item IDs is expected: len() is the
+    number of items, iterating repeats each item ID by its quantity (in the
+    order items were first added), and append/remove/count/clear/`in` and
+    indexing behave like the list versions. ",".join(inventory) gives the
+    same INVENTORY save line as the list.
+    """
+
+    def __init__(self, items=(), max_slots=MAX_INVENTORY_SIZE, stack_limit=1,
+                 stack_limits=None):
+        """
+        Create an inventory holding items (a list of item IDs)
+
+        Raises: InventoryFullError if items don't fit
+        """
+        if stack_limit < 1:
+            raise ValueError("stack_limit must be at least 1")
+        self.max_slots = max_slots
+        self.stack_limit = stack_limit
+        self.stack_limits = dict(stack_limits or {})
+        self.quantities = {}
+        self.slots_used = 0
+        self.total = 0
+        for item_id in items:
+            self.add(item_id)
+
+    @classmethod
+    def from_line(cls, line, **options): # reads an INVENTORY save value
+        """Create an inventory from a comma-separated INVENTORY save value"""
+        return cls(line.split(",") if line else [], **options)
+
+    def to_line(self): # writes an INVENTORY save value
+        """Return the comma-separated INVENTORY save value"""
+        return ",".join(self)
+
+    def to_list(self): # one entry per item, like the list inventory
+        """Return the items as a list of item IDs"""
+        return list(self)
+
+    def items(self): # (item_id, quantity) pairs
+        """Return (item_id, quantity) pairs in the order items were first added"""
+        return self.quantities.items()
+
+    def slots_needed(self, item_id, quantity): # slots used by quantity of one item
+        """Number of slots quantity of item_id takes up"""
+        limit = self.stack_limits.get(item_id, self.stack_limit)
+        return -(-quantity // limit)
+
+    def can_add(self, item_id, quantity=1): # would the items fit
+        """Check if quantity more of item_id fit in the free slots"""
+        return self.can_add_many({item_id: quantity})
+
+    def can_add_many(self, counts): # would a whole batch fit
+        """Check if every {item_id: quantity} in counts fits at once"""
+        extra = 0
+        for item_id, quantity in counts.items():
+            current = self.quantities.get(item_id, 0)
+            extra += (self.slots_needed(item_id, current + quantity)
+                      - self.slots_needed(item_id, current))
+        return self.slots_used + extra <= self.max_slots
+
+    def add(self, item_id, quantity=1): # adds items, checking the slot budget
+        """
+        Add quantity of item_id
+
+        Raises: InventoryFullError if they don't fit
+        """
+        if quantity < 1:
+            raise ValueError("quantity must be at least 1")
+        if not self.can_add(item_id, quantity):
+            raise InventoryFullError
+        current = self.quantities.get(item_id, 0)
+        self.slots_used += (self.slots_needed(item_id, current + quantity)
+                            - self.slots_needed(item_id, current))
+        self.quantities[item_id] = current + quantity
+        self.total += quantity
+        return True
+
+    def remove(self, item_id, quantity=1): # removes items
+        """
+        Remove quantity of item_id
+
+        Raises: ItemNotFoundError if there are fewer than quantity
+        """
+        current = self.quantities.get(item_id, 0)
+        if quantity < 1 or current < quantity:
+            raise ItemNotFoundError
+        remaining = current - quantity
+        self.slots_used -= (self.slots_needed(item_id, current)
+                            - self.slots_needed(item_id, remaining))
+        if remaining:
+            self.quantities[item_id] = remaining
+        else:
+            del self.quantities[item_id]
+        self.total -= quantity
+        return True
+
+    def count(self, item_id): # quantity of one item
+        """Return how many of item_id are held"""
+        return self.quantities.get(item_id, 0)
+
+    def has(self, item_id): # at least one of an item
+        """Check if at least one item_id is held"""
+        return item_id in self.quantities
+
+    def free_slots(self): # slots left in the budget
+        """Return the number of empty slots"""
+        return max(0, self.max_slots - self.slots_used)
+
+    def append(self, item_id): # list-style add
+        """Add one item_id (raises InventoryFullError if it doesn't fit)"""
+        self.add(item_id)
+
+    def clear(self): # removes everything
+        """Remove every item"""
+        self.quantities.clear()
+        self.slots_used = 0
+        self.total = 0
+
+    def __len__(self):
+        return self.total
+
+    def __contains__(self, item_id):
+        return item_id in self.quantities
+
+    def __iter__(self):
+        for item_id, quantity in self.quantities.items():
+            for _ in range(quantity):
+                yield item_id
+
+    def __getitem__(self, index):
+        return self.to_list()[index]
+
+    def __eq__(self, other):
+        if isinstance(other, Inventory):
+            return self.quantities == other.quantities
+        if isinstance(other, list):
+            return Counter(other) == Counter(self.quantities)
+        return NotImplemented
+
+    def __repr__(self):
+        return f"Inventory({self.quantities}, slots={self.slots_used}/{self.max_slots})"
+
+def use_counted_inventory(character, **options): # turns a list inventory into an Inventory
+    """
+    Replace character['inventory'] (a list) with an Inventory, in place
+
+    Args:
+        character: Character dictionary
+        options: Inventory options (max_slots, stack_limit, stack_limits)
+
+    Returns: The Inventory
+    Raises: InventoryFullError if the items don't fit the slot budget
+    """
+    inventory = character.get("inventory", [])
+    if not isinstance(inventory, Inventory):
+        inventory = Inventory(inventory, **options)
+        character["inventory"] = inventory
+    return inventory
+
+def has_room_for(inventory, item_id, quantity=1): # capacity check for lists and Inventory
+    """Check if quantity more of item_id fit in a list or Inventory"""
+    return has_room_for_many(inventory, {item_id: quantity})
+
+def has_room_for_many(inventory, counts): # batch capacity check for lists and Inventory
+    """Check if every {item_id: quantity} in counts fits in a list or Inventory"""
+    if isinstance(inventory, Inventory):
+        return inventory.can_add_many(counts)
+    return len(inventory) + sum(counts.values()) <= MAX_INVENTORY_SIZE
+
 # ============================================================================
 # INVENTORY MANAGEMENT
 # ============================================================================
@@ -38,7 +224,7 @@ def add_item_to_inventory(character, item_id): # adds an item to the character's
     # TODO: Implement adding items
     # Check if inventory is full (>= MAX_INVENTORY_SIZE)
     # Add item_id to character['inventory'] list
-    if len(character['inventory']) >= MAX_INVENTORY_SIZE:
+    if not has_room_for(character['inventory'], item_id):
         raise InventoryFullError
     else:
         character['inventory'].append(item_id)
@@ -93,6 +279,8 @@ def get_inventory_space_remaining(character): # calculates how many more items c
     Returns: Integer representing available slots
     """
     # TODO: Implement space calculation
+    if isinstance(character['inventory'], Inventory):
+        return character['inventory'].free_slots()
     if len(character['inventory']) < MAX_INVENTORY_SIZE:
         return MAX_INVENTORY_SIZE - len(character['inventory']) 
     else:
@@ -122,7 +310,8 @@ def use_item(character, item_id, item_data): # uses a consumable item from the c
     Args:
         character: Character dictionary
         item_id: Item to use
-        item_data: Item information dictionary from game_data
+        item_data: Item information dictionary from game_data, or an
+                   ItemRecord from item_catalog
     
     Item types and effects:
     - consumable: Apply effect and remove from inventory
@@ -145,7 +334,7 @@ def use_item(character, item_id, item_data): # uses a consumable item from the c
         raise ItemNotFoundError
     if item_data['type'] != "consumable": 
         raise InvalidItemTypeError
-    stat_name, value = parse_item_effect(item_data["effect"])
+    stat_name, value = get_item_effect(item_data)
     apply_stat_effect(character, stat_name, value)
     character['inventory'].remove(item_id)
     return f"{item_id} used to increase {stat_name} by {value}"
@@ -157,7 +346,7 @@ def equip_weapon(character, item_id, item_data): # equips a weapon from the char
     Args:
         character: Character dictionary
         item_id: Weapon to equip
-        item_data: Item information dictionary
+        item_data: Item information dictionary or ItemRecord
     
     Weapon effect format: "strength:5" (adds 5 to strength)
     
@@ -170,22 +359,8 @@ def equip_weapon(character, item_id, item_data): # equips a weapon from the char
         ItemNotFoundError if item not in inventory
         InvalidItemTypeError if item type is not 'weapon'
     """
-    # TODO: Implement weapon equipping
-    # Check item exists and is type 'weapon'
-    # Handle unequipping current weapon if exists
-    # Parse effect and apply to character stats
-    # Store equipped_weapon in character dictionary
-    # Remove item from inventory
-    if not has_item(character, item_id):
-        raise ItemNotFoundError
-    if item_data is None or item_data.get("type") != "weapon":
-        raise InvalidItemTypeError
-    old_weapon_id = unequip_weapon(character)
-    stat, value = parse_item_effect(item_data["effect"])
-    apply_stat_effect(character, stat, value)
-    character["equipped_weapon"] = item_id
-    character["equipped_weapon_effect"] = (stat, value)
-    character["inventory"].remove(item_id)
+    return equip_item(character, item_id, item_data, "weapon")
+
 def equip_armor(character, item_id, item_data): # equips armor from the character's inventory
     """
     Equip armor
@@ -193,7 +368,7 @@ def equip_armor(character, item_id, item_data): # equips armor from the characte
     Args:
         character: Character dictionary
         item_id: Armor to equip
-        item_data: Item information dictionary
+        item_data: Item information dictionary or ItemRecord
     
     Armor effect format: "max_health:10" (adds 10 to max_health)
     
@@ -206,36 +381,7 @@ def equip_armor(character, item_id, item_data): # equips armor from the characte
         ItemNotFoundError if item not in inventory
         InvalidItemTypeError if item type is not 'armor'
     """
-    # TODO: Implement armor equipping
-    # Similar to equip_weapon but for armor
-    inventory = character.get("inventory", [])
-
-    if item_id not in inventory:
-        raise ItemNotFoundError
-    
-    if item_data.get("type") != "armor":
-        raise InvalidItemTypeError
-    
-    if character.get("equipped_armor"):
-        old_armor = unequip_armor(character)
-
-        old_itme_data = item_data.get("effects_removed", {})
-
-        if "effect" in item_data:
-            stat, value = item_data["effect"].split(":")
-            character[stat] = character.get(stat, 0) - int(value)
-    inventory.remove(item_id)
-    character["equipped_armor"] = item_id
-
-    effect = item_data.get("effect")
-    if effect:
-        try:
-            stat, value = effect.split(":")
-            character[stat] = character.get(stat, 0) + int(value)
-        except ValueError:
-            pass
-
-    return f"Equipped {item_data.get("name", item_data)} as armor"
+    return equip_item(character, item_id, item_data, "armor")
 
 def unequip_weapon(character): # removes the equipped weapon from the character and returns it to inventory
     """
@@ -244,24 +390,7 @@ def unequip_weapon(character): # removes the equipped weapon from the character
     Returns: Item ID that was unequipped, or None if no weapon equipped
     Raises: InventoryFullError if inventory is full
     """
-    # TODO: Implement weapon unequipping
-    # Check if weapon is equipped
-    # Remove stat bonuses
-    # Add weapon back to inventory
-    # Clear equipped_weapon from character
-    weapon_id = character.get("equipped_weapon")
-    if not weapon_id:
-        return None
-    if get_inventory_space_remaining(character) == 0:
-        raise InventoryFullError
-    effect = character.get("equipped_weapon_effect")
-    if effect:
-        stat, value = effect
-        apply_stat_effect(character, stat, -value)
-    character["inventory"].append(weapon_id)
-    character["equipped_weapon"] = None
-    character["equipped_weapon_effect"] = None
-    return weapon_id
+    return unequip_item(character, "weapon")
 
 def unequip_armor(character): # removes the equipped armor from the character and returns it to inventory
     """
@@ -270,21 +399,64 @@ def unequip_armor(character): # removes the equipped armor from the character an
     Returns: Item ID that was unequipped, or None if no armor equipped
     Raises: InventoryFullError if inventory is full
     """
-    # TODO: Implement armor unequipping
-    equipped_armor = character.get("equiped_armor")
-    inventory = character.get("inventory", [])
+    return unequip_item(character, "armor")
+
+def equip_item(character, item_id, item_data, slot): # shared weapon/armor equipping
+    """
+    Move an item from the inventory into an equipment slot
 
-    if not equip_armor:
+    The bonus goes through the equipment module, which keeps it separate
+    from the character's base stats. The new item leaves the inventory
+    before the old one comes back, so swapping works with a full inventory.
+    If the old item still has nowhere to go (a full stack in a counted
+    Inventory), nothing changes.
+
+    Args:
+        slot: "weapon" or "armor" (also the item type the slot accepts)
+
+    Returns: String describing equipment change
+    Raises:
+        ItemNotFoundError if item not in inventory
+        InvalidItemTypeError if item type doesn't match the slot
+        InventoryFullError if the old item can't go back to the inventory
+    """
+    if not has_item(character, item_id):
+        raise ItemNotFoundError
+    if item_data is None or item_data.get("type") != slot:
+        raise InvalidItemTypeError
+    effect = get_item_effect(item_data) if item_data.get("effect") else None
+    character["inventory"].remove(item_id)
+    current_item_id = equipment.get_equipped(character, slot)
+    if current_item_id and not has_room_for(character["inventory"], current_item_id):
+        character["inventory"].append(item_id)
+        raise InventoryFullError
+    try:
+        old_item_id = equipment.set_equipped(character, slot, item_id, effect)
+    except ValueError:
+        character["inventory"].append(item_id)
+        raise
+    if old_item_id:
+        character["inventory"].append(old_item_id)
+    name = item_data.get("name", item_id)
+    if old_item_id:
+        return f"Equipped {name} as {slot} (unequipped {old_item_id})"
+    return f"Equipped {name} as {slot}"
+
+def unequip_item(character, slot): # shared weapon/armor unequipping
+    """
+    Move whatever is in an equipment slot back to the inventory
+
+    Returns: Item ID that was unequipped, or None if the slot was empty
+    Raises: InventoryFullError if inventory is full
+    """
+    item_id = equipment.get_equipped(character, slot)
+    if not item_id:
         return None
-    
-    if len(inventory) >= MAX_INVENTORY_SIZE:
+    if not has_room_for(character["inventory"], item_id):
         raise InventoryFullError
-    
-    inventory.append(equipped_armor)
-    character["inventory"] = inventory
-    character["equip_armor"] = None
-
-    return equipped_armor
+    equipment.clear_equipped(character, slot)
+    character["inventory"].append(item_id)
+    return item_id
 
 # ============================================================================
 # SHOP SYSTEM
@@ -297,7 +469,7 @@ def purchase_item(character, item_id, item_data): # purchases an item from a sho
     Args:
         character: Character dictionary
         item_id: Item to purchase
-        item_data: Item information with 'cost' field
+        item_data: Item information with 'cost' field (or an ItemRecord)
     
     Returns: True if purchased successfully
     Raises:
@@ -315,7 +487,7 @@ def purchase_item(character, item_id, item_data): # purchases an item from a sho
 
     if gold < cost:
         raise InsufficientResourcesError
-    if len(inventory) >= MAX_INVENTORY_SIZE:
+    if not has_room_for(inventory, item_id):
         raise InventoryFullError
     
     character["gold"] -= cost
@@ -331,7 +503,7 @@ def sell_item(character, item_id, item_data): # sells an item from the character
     Args:
         character: Character dictionary
         item_id: Item to sell
-        item_data: Item information with 'cost' field
+        item_data: Item information with 'cost' field (or an ItemRecord)
     
     Returns: Amount of gold received
     Raises: ItemNotFoundError if item not in inventory
@@ -355,6 +527,163 @@ def sell_item(character, item_id, item_data): # sells an item from the character
     character["gold"] = gold + sell_price
 
     return sell_price
+
+# ============================================================================
+# BATCH TRANSACTIONS
+# ============================================================================
+
+def add_items(character, item_ids): # adds a whole batch of items or none of them
+    """
+    Add several items to inventory in one transaction
+
+    Capacity is checked once for the whole batch; if it doesn't fit,
+    nothing is added.
+
+    Args:
+        character: Character dictionary
+        item_ids: Item IDs to add (repeat an ID to add several)
+
+    Returns: Dictionary {'added': number of items, 'space_remaining': slots left}
+    Raises: InventoryFullError if the batch doesn't fit
+    """
+    item_ids = list(item_ids)
+    inventory = character['inventory']
+    if not has_room_for_many(inventory, Counter(item_ids)):
+        raise InventoryFullError
+    with inventory_transaction(character):
+        add_to_inventory(inventory, item_ids)
+    return {
+        'added': len(item_ids),
+        'space_remaining': get_inventory_space_remaining(character)
+    }
+
+def purchase_items(character, item_ids, item_data_dict): # buys a whole batch of items or none of them
+    """
+    Purchase several items in one transaction
+
+    The total cost and the capacity are checked once for the whole batch;
+    if either check fails, no gold is spent and nothing is added.
+
+    Args:
+        character: Character dictionary
+        item_ids: Item IDs to buy (repeat an ID to buy several)
+        item_data_dict: Item data by ID (dictionaries or an ItemCatalog)
+
+    Returns: Dictionary {'purchased': number of items, 'total_cost': gold spent,
+                         'gold_remaining': gold left}
+    Raises:
+        ItemNotFoundError if an item ID is not in item_data_dict
+        InsufficientResourcesError if the total cost is more than the gold
+        InventoryFullError if the batch doesn't fit
+    """
+    item_ids = list(item_ids)
+    total_cost = 0
+    for item_id in item_ids:
+        item_data = item_data_dict.get(item_id)
+        if item_data is None:
+            raise ItemNotFoundError
+        total_cost += int(item_data.get("cost", 0))
+
+    gold = int(character.get("gold", 0))
+    inventory = character.get("inventory", [])
+    if gold < total_cost:
+        raise InsufficientResourcesError
+    if not has_room_for_many(inventory, Counter(item_ids)):
+        raise InventoryFullError
+
+    with inventory_transaction(character):
+        add_to_inventory(inventory, item_ids)
+        character["inventory"] = inventory
+        character["gold"] = gold - total_cost
+    return {
+        'purchased': len(item_ids),
+        'total_cost': total_cost,
+        'gold_remaining': character["gold"]
+    }
+
+def sell_items(character, item_ids, item_data_dict): # sells a whole batch of items or none of them
+    """
+    Sell several items (each for half its cost) in one transaction
+
+    Every item must be in the inventory (as many times as it is listed);
+    otherwise nothing is sold.
+
+    Args:
+        character: Character dictionary
+        item_ids: Item IDs to sell (repeat an ID to sell several)
+        item_data_dict: Item data by ID (dictionaries or an ItemCatalog)
+
+    Returns: Dictionary {'sold': number of items, 'gold_received': gold earned,
+                         'gold': gold after the sale}
+    Raises: ItemNotFoundError if an item is not held (or not in item_data_dict)
+    """
+    counts = Counter(item_ids)
+    inventory = character.get("inventory", [])
+    gold_received = 0
+    for item_id, quantity in counts.items():
+        item_data = item_data_dict.get(item_id)
+        if item_data is None or inventory.count(item_id) < quantity:
+            raise ItemNotFoundError
+        gold_received += (int(item_data.get("cost", 0)) // 2) * quantity
+
+    with inventory_transaction(character):
+        if isinstance(inventory, Inventory):
+            for item_id, quantity in counts.items():
+                inventory.remove(item_id, quantity)
+        else:
+            remaining = dict(counts)
+            kept = []
+            for item_id in inventory:
+                if remaining.get(item_id):
+                    remaining[item_id] -= 1
+                else:
+                    kept.append(item_id)
+            inventory[:] = kept
+        character["inventory"] = inventory
+        character["gold"] = int(character.get("gold", 0)) + gold_received
+    return {
+        'sold': sum(counts.values()),
+        'gold_received': gold_received,
+        'gold': character["gold"]
+    }
+
+@contextmanager
+def inventory_transaction(character): # puts inventory and gold back if a batch fails
+    """
+    Snapshot a character's inventory and gold, and restore them (in the
+    same inventory object) if the block raises
+    """
+    inventory = character.get("inventory", [])
+    had_gold = "gold" in character
+    gold = character.get("gold")
+    if isinstance(inventory, Inventory):
+        saved = (dict(inventory.quantities), inventory.slots_used, inventory.total)
+    else:
+        saved = list(inventory)
+    try:
+        yield
+    except BaseException:
+        if isinstance(inventory, Inventory):
+            quantities, inventory.slots_used, inventory.total = saved
+            inventory.quantities.clear()
+            inventory.quantities.update(quantities)
+        else:
+            inventory[:] = saved
+        character["inventory"] = inventory
+        if had_gold:
+            character["gold"] = gold
+        else:
+            character.pop("gold", None)
+        raise
+
+def add_to_inventory(inventory, item_ids): # appends items to a list or Inventory
+    """Add item_ids to a list or Inventory (capacity already checked)"""
+    if isinstance(inventory, Inventory):
+        for item_id, quantity in Counter(item_ids).items():
+            inventory.add(item_id, quantity)
+    else:
+        inventory.extend(item_ids)
+
 # ============================================================================
 # HELPER FUNCTIONS
 # ============================================================================
@@ -364,7 +693,8 @@ def parse_item_effect(effect_string): # parses an item effect string into stat n
     Parse item effect string into stat name and value
     
     Args:
-        effect_string: String in format "stat_name:value"
+        effect_string: String in format "stat_name:value" (the
+                       {stat_name: value} dictionary from load_items also works)
     
     Returns: Tuple of (stat_name, value)
     Example: "health:20" → ("health", 20)
@@ -372,13 +702,25 @@ def parse_item_effect(effect_string): # parses an item effect string into stat n
     # TODO: Implement effect parsing
     # Split on ":"
     # Convert value to integer
-    try:
-        stat, val = effect_string.split(":")
-        stat = stat.strip()
-        val = int(val.strip())
-        return stat, val
-    except (ValueError, AttributeError):
+    effect = parse_effect(effect_string)
+    if effect is None:
         raise ValueError(f"Invalid Effect Format: {effect_string}")
+    return effect
+
+def get_item_effect(item_data): # gets the (stat, value) effect of an item
+    """
+    Get an item's effect as (stat_name, value)
+
+    ItemRecords already hold the parsed tuple; item dictionaries have
+    their "stat:value" string (or load_items {stat: value}) parsed.
+
+    Raises: ValueError if the item has no readable effect
+    """
+    if isinstance(item_data, ItemRecord):
+        if item_data.effect is None:
+            raise ValueError(f"Invalid Effect Format: {item_data.effect}")
+        return item_data.effect
+    return parse_item_effect(item_data.get("effect"))
 
     
 
@@ -418,7 +760,10 @@ def display_inventory(character, item_data_dict): # displays the character's inv
     if not inventory:
         print("Inventory is empty.")
         return
-    item_counts = Counter(inventory) # Count occurrences of each item_id (Ai helped me with this part)
+    if isinstance(inventory, Inventory):
+        item_counts = inventory.quantities
+    else:
+        item_counts = Counter(inventory) # Count occurrences of each item_id (Ai helped me with this part)
     print("=== INVENTORY ===")
     for item_id, count in item_counts.items():
         item_info = item_data_dict.get(item_id, {})
@@ -0,0 +1,214 @@
+"""
+COMP 163 - Project 3: Quest Chronicles
+Item Catalog Module
+
+This module turns the load_items output into compact item records with
+the effect already split into a (stat, value) tuple, the type as an
+ItemType and the cost as an int, so using, equipping, buying and selling
+items never has to parse strings again.
+"""
+
+from enum import Enum
+
+import game_data
+from custom_exceptions import ItemNotFoundError, InvalidItemTypeError
+
+# ============================================================================
+# ITEM RECORDS
+# ============================================================================
+
+class ItemType(str, Enum): # the three item types
+    """
+    Item type
+
+    Members are also strings, so ItemType.WEAPON == "weapon" and existing
+    checks like item_data['type'] != "consumable" keep working. They print
+    as their value ("weapon"), the same text the player saw before.
+    """
+    CONSUMABLE = "consumable"
+    WEAPON = "weapon"
+    ARMOR = "armor"
+
+    def __str__(self):
+        return self.value
+
+    def __format__(self, format_spec):
+        return format(self.value, format_spec)
+
+def parse_effect(effect): # effect in any stored format -> (stat, value)
+    """
+    Convert an item effect to a (stat, value) tuple
+
+    Accepts the "stat:value" string from items.txt, the {stat: value}
+    dictionary made by game_data.load_items, or a (stat, value) tuple.
+
+    Returns: Tuple (stat_name, value), or None if there is no effect
+    Raises: ValueError if the effect can't be read
+    """
+    if effect is None or effect == "":
+        return None
+    if isinstance(effect, tuple):
+        stat, value = effect
+        return stat, int(value)
+    if isinstance(effect, dict):
+        if len(effect) != 1:
+            raise ValueError(f"Invalid Effect Format: {effect}")
+        (stat, value), = effect.items()
+        return stat, int(value)
+    try:
+        stat, value = effect.split(":")
+        return stat.strip(), int(value.strip())
+    except (ValueError, AttributeError):
+        raise ValueError(f"Invalid Effect Format: {effect}")
+
+class ItemRecord: # one item with pre-parsed fields
+    """
+    One catalog item
+
+    Attributes:
+        item_id, name, description: Strings
+        type: ItemType
+        effect: Tuple (stat_name, value), or None
+        cost: Integer
+
+    item['cost'] and item.get('type') work like they do on item dictionaries.
+    """
+
+    __slots__ = ("item_id", "name", "type", "effect", "cost", "description")
+
+    def __init__(self, item_id, name, item_type, effect, cost, description=""):
+        self.item_id = item_id
+        self.name = name
+        self.type = item_type
+        self.effect = effect
+        self.cost = cost
+        self.description = description
+
+    @classmethod
+    def from_dict(cls, item_data): # builds a record from an item dictionary
+        """
+        Build a record from an item dictionary (load_items format)
+
+        Raises: InvalidItemTypeError if the type is not a known ItemType
+                ValueError if the effect or cost can't be read
+        """
+        try:
+            item_type = ItemType(str(item_data.get("type", "")).strip().lower())
+        except ValueError:
+            raise InvalidItemTypeError
+        return cls(
+            item_data["item_id"],
+            item_data.get("name", item_data["item_id"]),
+            item_type,
+            parse_effect(item_data.get("effect")),
+            int(item_data.get("cost", 0)),
+            item_data.get("description", "")
+        )
+
+    def __getitem__(self, key):
+        if key not in ItemRecord.__slots__:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __contains__(self, key):
+        return key in ItemRecord.__slots__
+
+    def get(self, key, default=None): # dictionary-style lookup
+        """Return the field named key, or default if there is no such field"""
+        if key not in ItemRecord.__slots__:
+            return default
+        return getattr(self, key)
+
+    def to_dict(self): # back to a load_items style dictionary
+        """Return the item as a load_items style dictionary"""
+        effect = {self.effect[0]: self.effect[1]} if self.effect else None
+        return {
+            "item_id": self.item_id,
+            "name": self.name,
+            "type": self.type.value,
+            "effect": effect,
+            "cost": self.cost,
+            "description": self.description
+        }
+
+    def __repr__(self):
+        return f"ItemRecord({self.item_id!r}, {self.type.value}, {self.effect}, cost={self.cost})"
+
+# ============================================================================
+# ITEM CATALOG
+# ============================================================================
+
+class ItemCatalog: # every item record by ID and by type
+    """
+    Catalog of ItemRecords
+
+    Lookups by item ID are dictionary lookups; items of one type are kept
+    in their own list (in file order).
+    """
+
+    def __init__(self, records=()):
+        """Build a catalog from ItemRecords"""
+        self.items = {}
+        self.by_type = {item_type: [] for item_type in ItemType}
+        for record in records:
+            self.items[record.item_id] = record
+            self.by_type[record.type].append(record)
+
+    @classmethod
+    def from_items(cls, item_data_dict): # builds a catalog from load_items output
+        """Build a catalog from an item data dictionary"""
+        return cls(ItemRecord.from_dict(item_data) for item_data in item_data_dict.values())
+
+    @classmethod
+    def load(cls, filename="data/items.txt"): # builds a catalog from an items file
+        """
+        Load a catalog from an items file (through game_data.load_items,
+        so the compiled content cache is used)
+
+        Raises: Same exceptions as game_data.load_items
+        """
+        return cls.from_items(game_data.load_items(filename))
+
+    def __len__(self):
+        return len(self.items)
+
+    def __contains__(self, item_id):
+        return item_id in self.items
+
+    def __iter__(self):
+        return iter(self.items.values())
+
+    def __getitem__(self, item_id):
+        """
+        Get the record for item_id
+
+        Raises: ItemNotFoundError if no such item
+        """
+        try:
+            return self.items[item_id]
+        except KeyError:
+            raise ItemNotFoundError
+
+    def get(self, item_id, default=None): # record or default
+        """Get the record for item_id, or default if there is no such item"""
+        return self.items.get(item_id, default)
+
+    def of_type(self, item_type): # every item of one type
+        """
+        Get all items of one type, in file order
+
+        Returns: List of ItemRecords
+        """
+        return list(self.by_type[ItemType(item_type)])
+
+# ============================================================================
+# TESTING
+# ============================================================================
+
+if __name__ == "__main__":
+    print("=== ITEM CATALOG TEST ===")
+
+    catalog = ItemCatalog.load()
+    for record in catalog:
+        print(record)
+    print(f"Weapons: {[record.item_id for record in catalog.of_type('weapon')]}")
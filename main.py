@@ -16,6 +16,7 @@ import inventory_system
 import quest_handler
 import combat_system
 import game_data
+from shop import Shop
 from custom_exceptions import *
 
 # ============================================================================
@@ -528,6 +529,11 @@ def explore(): # allows the player to explore and find random battles
         print(f"Error during exploration: {e}")
     
 
+def show_shop_items(items): # prints one line per shop item
+    """Print shop items (as returned by Shop.browse) with their costs"""
+    for item in items:
+        print(f"- {item['item_id']}: {item.get('name', 'Unknown')} ({item.get('type', 'unknown')}) - {item['cost']} gold")
+
 def shop(): # allows the player to buy/sell items in a shop
     """Shop menu for buying/selling items"""
     global current_character, all_items
@@ -537,42 +543,41 @@ def shop(): # allows the player to buy/sell items in a shop
     # Show current gold
     # Options: Buy item, Sell item, Back
     # Handle exceptions from inventory_system
+    store = Shop(all_items)
     while True:
         print("\n=== Shop Menu ===")
         print(f"Your Gold: {current_character.get('gold', 0)}")
         
         print("\nItems for Sale:")
-        for item_id, item in all_items.items():
-            cost = item.get("cost", 0)
-            print(f"- {item_id}: {item.get('name', 'Unknown')} ({item.get('type', 'unknown')}) - {cost} gold")
+        show_shop_items(store.browse(in_stock_only=False))
         
         print("\nOptions:")
         print("1. Buy item")
         print("2. Sell item")
         print("3. Back")
+        print("4. Show items you can afford")
         
         choice = input("Select an option: ").strip()
         
         try:
             if choice == "1": 
                 item_id = input("Enter item ID to buy: ").strip()
-                item_data = all_items.get(item_id)
-                
-                if not item_data:
-                    print("Item not found in shop.")
-                    continue
-                
-                result = inventory_system.purchase_item(current_character, item_id, item_data)
-                print(result)
+                store.purchase(current_character, item_id)
+                print(f"Purchased {item_id}.")
             
             elif choice == "2":  
-                result = inventory_system.sell_item(current_character, all_items)
-                print(result)
+                item_id = input("Enter item ID to sell: ").strip()
+                gold = store.sell(current_character, item_id)
+                print(f"Sold {item_id} for {gold} gold.")
             
             elif choice == "3":  # Back
                 print("Leaving the shop...")
                 break 
             
+            elif choice == "4":
+                print("\nItems You Can Afford:")
+                show_shop_items(store.affordable(current_character))
+            
             else:
                 print("Invalid choice. Try again.")
         
@@ -581,6 +586,8 @@ def shop(): # allows the player to buy/sell items in a shop
             print(f"Item not found: {e}")
         except InventoryFullError as e:
             print(f"Inventory full: {e}")
+        except (InsufficientResourcesError, OutOfStockError) as e:
+            print(f"Cannot buy: {e}")
         except ValueError:
             print("Invalid input.")
         except Exception as e:
@@ -0,0 +1,277 @@
+"""
+COMP 163 - Project 3: Quest Chronicles
+Monte Carlo Combat Module
+
+This module estimates battle outcome probabilities by running many
+battles at once as NumPy arrays (one column per stat, one row per battle).
+The rules mirror combat_system: basic attacks, the four class special
+abilities (including the Rogue's 50% critical strike), and the 50%
+escape chance.
+
+NumPy is only needed by this module.
+"""
+
+try:
+    import numpy as np
+except ImportError: # NumPy is optional, only the Monte Carlo engine needs it
+    np = None
+
+from combat_system import create_enemy
+from character_manager import create_character_at_level
+from battle_simulator import ATTACK, SPECIAL, RUN, MAX_TURNS
+
+# Class codes stored in the class column
+CLASS_CODES = {"warrior": 0, "mage": 1, "rogue": 2, "cleric": 3}
+CHARACTER_CLASSES = ["Warrior", "Mage", "Rogue", "Cleric"]
+
+# Outcome codes stored in the winner column
+ONGOING = 0
+PLAYER_WON = 1
+ENEMY_WON = 2
+ESCAPED = 3
+TIMED_OUT = 4
+
+# ============================================================================
+# ARRAY SIMULATION
+# ============================================================================
+
+def require_numpy(): # makes sure NumPy is available
+    """
+    Check that NumPy is installed
+
+    Raises: ImportError if NumPy is not installed
+    """
+    if np is None:
+        raise ImportError("The Monte Carlo engine requires NumPy (pip install numpy)")
+
+def build_columns(characters, enemy, trials): # turns character/enemy dicts into stat columns
+    """
+    Build stat columns for trials battles per character
+
+    Args:
+        characters: List of character dictionaries
+        enemy: Enemy dictionary
+        trials: Number of battles to run for each character
+
+    Returns: Dictionary of NumPy arrays with one row per battle
+    """
+    require_numpy()
+    count = len(characters) * trials
+
+    def column(values):
+        return np.repeat(np.array(values, dtype=np.int64), trials)
+
+    return {
+        'player_health': column([int(c['health']) for c in characters]),
+        'player_max_health': column([int(c['max_health']) for c in characters]),
+        'player_strength': column([int(c['strength']) for c in characters]),
+        'player_magic': column([int(c['magic']) for c in characters]),
+        'player_class': column([CLASS_CODES.get(str(c.get('class', '')).lower(), -1)
+                                for c in characters]),
+        'enemy_health': np.full(count, int(enemy['health']), dtype=np.int64),
+        'enemy_strength': np.full(count, int(enemy['strength']), dtype=np.int64),
+        'enemy_magic': np.full(count, int(enemy['magic']), dtype=np.int64)
+    }
+
+def special_damage(player_class, strength, magic, enemy_strength, rng): # vectorized special abilities
+    """
+    Calculate special ability damage for every row at once
+
+    Mirrors warrior_power_strike, mage_fireball and rogue_critical_strike.
+    Cleric rows (Heal) and unknown classes deal no damage.
+
+    Returns: Array of damage per row
+    """
+    armor = enemy_strength // 4
+    crit = rng.random(len(player_class)) < 0.5
+    rogue_strength = np.where(crit, strength * 3, strength)
+    damage = np.select(
+        [player_class == 0, player_class == 1, player_class == 2],
+        [strength * 2 - armor, magic * 2 - armor, rogue_strength - armor],
+        default=0
+    )
+    dealing = (player_class >= 0) & (player_class <= 2)
+    return np.where(dealing, np.maximum(1, damage), 0)
+
+def simulate_columns(columns, action=ATTACK, seed=None): # advances every battle turn by turn
+    """
+    Run every battle in the columns to the end
+
+    Each loop iteration is one turn for all unfinished battles: the player
+    acts, then the enemy attacks if it is still alive. Finished battles are
+    dropped from the working arrays so later turns only touch live rows.
+
+    Args:
+        columns: Dictionary from build_columns
+        action: ATTACK, SPECIAL or RUN, used by every player every turn
+        seed: Optional seed for reproducible results
+
+    Returns: Tuple (winner, turns) of arrays with one entry per battle
+    Raises: ValueError if action is not recognized
+    """
+    require_numpy()
+    if action not in (ATTACK, SPECIAL, RUN):
+        raise ValueError(f"Unknown action: {action}")
+    rng = np.random.default_rng(seed)
+
+    count = len(columns['player_health'])
+    winner = np.full(count, ONGOING, dtype=np.int8)
+    turns = np.zeros(count, dtype=np.int32)
+
+    rows = np.arange(count)
+    player_health = columns['player_health'].copy()
+    max_health = columns['player_max_health']
+    strength = columns['player_strength']
+    magic = columns['player_magic']
+    player_class = columns['player_class']
+    enemy_health = columns['enemy_health'].copy()
+    enemy_strength = columns['enemy_strength']
+
+    turn = 1
+    while len(rows):
+        start_player_health = player_health
+        start_enemy_health = enemy_health
+
+        # Player's turn
+        escaped = np.zeros(len(rows), dtype=bool)
+        if action == ATTACK:
+            damage = np.maximum(1, strength - enemy_strength // 4)
+            enemy_health = np.maximum(0, enemy_health - damage)
+        elif action == SPECIAL:
+            damage = special_damage(player_class, strength, magic, enemy_strength, rng)
+            enemy_health = np.maximum(0, enemy_health - damage)
+            healing = np.where(player_class == 3, 30, 0)
+            player_health = np.minimum(max_health, player_health + healing)
+        else:
+            escaped = rng.random(len(rows)) < 0.5
+
+        # Enemy's turn, skipped if the enemy died or the player escaped
+        attacking = (enemy_health > 0) & ~escaped
+        enemy_damage = np.maximum(1, enemy_strength - strength // 4)
+        player_health = np.where(attacking,
+                                 np.maximum(0, player_health - enemy_damage),
+                                 player_health)
+
+        # Check battle end
+        result = np.full(len(rows), ONGOING, dtype=np.int8)
+        result[player_health <= 0] = ENEMY_WON
+        result[enemy_health <= 0] = PLAYER_WON
+        result[escaped] = ESCAPED
+        if turn >= MAX_TURNS:
+            result[result == ONGOING] = TIMED_OUT
+
+        # A battle that ends a turn exactly where it started (a Cleric healing
+        # back every point the enemy dealt) will repeat until MAX_TURNS
+        stalled = ((result == ONGOING)
+                   & (player_health == start_player_health)
+                   & (enemy_health == start_enemy_health))
+        result[stalled] = TIMED_OUT
+
+        finished = result != ONGOING
+        winner[rows[finished]] = result[finished]
+        turns[rows[finished]] = np.where(stalled[finished], MAX_TURNS, turn)
+
+        ongoing = ~finished
+        rows = rows[ongoing]
+        player_health = player_health[ongoing]
+        max_health = max_health[ongoing]
+        strength = strength[ongoing]
+        magic = magic[ongoing]
+        player_class = player_class[ongoing]
+        enemy_health = enemy_health[ongoing]
+        enemy_strength = enemy_strength[ongoing]
+        turn += 1
+
+    return winner, turns
+
+def summarize(winner, turns): # turns outcome arrays into probabilities
+    """
+    Summarize outcome arrays
+
+    Returns: Dictionary with:
+            {'trials', 'win_probability', 'loss_probability',
+             'escape_probability', 'timeout_probability',
+             'mean_turns', 'turns_distribution'}
+            turns_distribution[n] is the number of battles that took n turns.
+    """
+    trials = len(winner)
+    if trials == 0:
+        return {
+            'trials': 0, 'win_probability': 0.0, 'loss_probability': 0.0,
+            'escape_probability': 0.0, 'timeout_probability': 0.0,
+            'mean_turns': 0.0, 'turns_distribution': np.zeros(1, dtype=np.int64)
+        }
+    outcome_counts = np.bincount(winner, minlength=TIMED_OUT + 1)
+    return {
+        'trials': trials,
+        'win_probability': float(outcome_counts[PLAYER_WON] / trials),
+        'loss_probability': float(outcome_counts[ENEMY_WON] / trials),
+        'escape_probability': float(outcome_counts[ESCAPED] / trials),
+        'timeout_probability': float(outcome_counts[TIMED_OUT] / trials),
+        'mean_turns': float(turns.mean()),
+        'turns_distribution': np.bincount(turns)
+    }
+
+# ============================================================================
+# PUBLIC API
+# ============================================================================
+
+def simulate_battles(character, enemy, trials, action=ATTACK, seed=None): # outcome probabilities for one matchup
+    """
+    Estimate outcome probabilities for one character against one enemy
+
+    Args:
+        character: Character dictionary (not modified)
+        enemy: Enemy dictionary or enemy type name (e.g. "goblin")
+        trials: Number of battles to simulate
+        action: ATTACK, SPECIAL or RUN
+        seed: Optional seed for reproducible results
+
+    Returns: Dictionary from summarize()
+    """
+    if isinstance(enemy, str):
+        enemy = create_enemy(enemy)
+    columns = build_columns([character], enemy, trials)
+    winner, turns = simulate_columns(columns, action, seed)
+    return summarize(winner, turns)
+
+def simulate_class_matchups(enemy, trials, action=SPECIAL, level=1, seed=None): # per-class outcome probabilities
+    """
+    Estimate outcome probabilities for every character class against an enemy
+
+    All classes are simulated together in one set of arrays.
+
+    Args:
+        enemy: Enemy dictionary or enemy type name
+        trials: Number of battles per class
+        action: ATTACK, SPECIAL or RUN
+        level: Character level; stats are derived with gain_experience
+        seed: Optional seed for reproducible results
+
+    Returns: Dictionary of {class_name: summarize() result}
+    """
+    if isinstance(enemy, str):
+        enemy = create_enemy(enemy)
+    characters = [create_character_at_level(class_name, class_name, level)
+                  for class_name in CHARACTER_CLASSES]
+
+    columns = build_columns(characters, enemy, trials)
+    winner, turns = simulate_columns(columns, action, seed)
+    results = {}
+    for index, class_name in enumerate(CHARACTER_CLASSES):
+        block = slice(index * trials, (index + 1) * trials)
+        results[class_name] = summarize(winner[block], turns[block])
+    return results
+
+# ============================================================================
+# TESTING
+# ============================================================================
+
+if __name__ == "__main__":
+    print("=== MONTE CARLO COMBAT TEST ===")
+
+    for enemy_type in ["goblin", "orc", "dragon"]:
+        results = simulate_class_matchups(enemy_type, 100000, SPECIAL, seed=163)
+        for class_name, stats in results.items():
+            print(f"{class_name} vs {enemy_type}: win {stats['win_probability']:.2%}, "
+                  f"mean turns {stats['mean_turns']:.2f}")
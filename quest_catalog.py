@@ -0,0 +1,203 @@
+"""
+COMP 163 - Project 3: Quest Chronicles
+Quest Catalog Module
+
+This module answers quest searches (level ranges, reward ranges, best
+rewards) from sorted indexes built once over the load_quests output,
+using bisect instead of filtering every quest on each call.
+"""
+
+from bisect import bisect_left, bisect_right
+
+# Quest fields with a sorted index
+INDEXED_FIELDS = ["required_level", "reward_xp", "reward_gold"]
+
+# ============================================================================
+# QUEST CATALOG
+# ============================================================================
+
+def quest_field_value(quest, field): # reads a numeric field in either key case
+    """
+    Read a numeric quest field, accepting lowercase or uppercase keys
+
+    Returns: Integer value, or None if missing or not a number
+    """
+    value = quest.get(field, quest.get(field.upper()))
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
+
+class QuestCatalog: # sorted indexes over the quest catalog
+    """
+    Read-only query engine over a quest data dictionary
+
+    Each field in INDEXED_FIELDS has three parallel lists sorted by value
+    (ties keep catalog order): the values, the matching quest IDs and
+    their positions in the catalog.
+    Quests missing a field (or with a non-number) are left out of that
+    field's index and never match queries on it.
+    """
+
+    def __init__(self, quest_data_dict):
+        """Build the indexes from a quest data dictionary"""
+        self.quests = quest_data_dict
+        self.quest_ids = list(quest_data_dict)
+        self.order = {quest_id: position for position, quest_id in enumerate(self.quest_ids)}
+        self.values = {}
+        self.indexes = {}
+        for field in INDEXED_FIELDS:
+            values = {}
+            for quest_id, quest in quest_data_dict.items():
+                value = quest_field_value(quest, field)
+                if value is not None:
+                    values[quest_id] = value
+            ordered = sorted(values, key=values.__getitem__) # stable, so ties keep catalog order
+            self.values[field] = values
+            self.indexes[field] = (
+                [values[quest_id] for quest_id in ordered],
+                ordered,
+                [self.order[quest_id] for quest_id in ordered]
+            )
+
+    def __len__(self):
+        return len(self.quests)
+
+    def range_ids(self, field, low=None, high=None): # quest IDs with low <= field <= high
+        """
+        Get IDs of quests whose field is between low and high (inclusive)
+
+        Args:
+            field: One of INDEXED_FIELDS
+            low, high: Bounds (None = unbounded)
+
+        Returns: List of quest IDs sorted by the field's value
+        Raises: ValueError if field is not indexed
+        """
+        start, end = self.bounds(field, low, high)
+        return self.index(field)[1][start:end]
+
+    def in_range(self, field, low=None, high=None): # quests with low <= field <= high
+        """
+        Get quests whose field is between low and high (inclusive)
+
+        Returns: List of quest dictionaries sorted by the field's value
+        """
+        return [self.quests[quest_id] for quest_id in self.range_ids(field, low, high)]
+
+    def by_level(self, min_level, max_level): # same result as quest_handler.get_quests_by_level
+        """
+        Get all quests within a level range, in catalog order
+
+        Returns: List of quest dictionaries
+        """
+        start, end = self.bounds("required_level", min_level, max_level)
+        positions = sorted(self.indexes["required_level"][2][start:end])
+        return [self.quests[self.quest_ids[position]] for position in positions]
+
+    def top(self, field, k): # k quests with the highest field value
+        """
+        Get the k quests with the highest value of field
+
+        Returns: List of quest dictionaries, highest first
+        """
+        if k <= 0:
+            return []
+        quest_ids = self.index(field)[1]
+        return [self.quests[quest_id] for quest_id in reversed(quest_ids[-k:])]
+
+    def query(self, min_level=None, max_level=None, min_xp=None, max_xp=None,
+              min_gold=None, max_gold=None, order_by=None, descending=False,
+              limit=None): # combined range filters
+        """
+        Find quests matching every given range
+
+        The range with the fewest matches is looked up with bisect and only
+        those quests are checked against the other ranges.
+
+        Args:
+            min_level, max_level: required_level bounds (inclusive)
+            min_xp, max_xp: reward_xp bounds (inclusive)
+            min_gold, max_gold: reward_gold bounds (inclusive)
+            order_by: Optional field from INDEXED_FIELDS to sort results by
+                      (default and ties: catalog order)
+            descending: Sort order_by from highest to lowest
+            limit: Maximum number of quests to return (None = all)
+
+        Returns: List of quest dictionaries
+        """
+        bounds = {
+            "required_level": (min_level, max_level),
+            "reward_xp": (min_xp, max_xp),
+            "reward_gold": (min_gold, max_gold)
+        }
+        ranges = []
+        for field, (low, high) in bounds.items():
+            if low is not None or high is not None:
+                start, end = self.bounds(field, low, high)
+                ranges.append((end - start, field, start, end, low, high))
+        ranges.sort()
+
+        if ranges:
+            _, field, start, end, _, _ = ranges[0]
+            matches = self.indexes[field][1][start:end]
+            for _, field, _, _, low, high in ranges[1:]:
+                values = self.values[field]
+                if low is None:
+                    low = float("-inf")
+                if high is None:
+                    high = float("inf")
+                matches = [quest_id for quest_id in matches
+                           if quest_id in values and low <= values[quest_id] <= high]
+        else:
+            matches = list(self.quest_ids)
+
+        matches.sort(key=self.order.__getitem__)
+        if order_by is not None: # stable sort, so ties stay in catalog order
+            self.index(order_by) # raises ValueError for unknown fields
+            values = self.values[order_by]
+            matches = [quest_id for quest_id in matches if quest_id in values]
+            matches.sort(key=values.__getitem__, reverse=descending)
+        if limit is not None:
+            matches = matches[:limit]
+        return [self.quests[quest_id] for quest_id in matches]
+
+    # ------------------------------------------------------------------------
+    # Internal helpers
+    # ------------------------------------------------------------------------
+
+    def index(self, field): # sorted (values, quest_ids, positions) for a field
+        """
+        Get the sorted index for field
+
+        Raises: ValueError if field is not indexed
+        """
+        try:
+            return self.indexes[field]
+        except KeyError:
+            raise ValueError(f"Quest field is not indexed: {field}")
+
+    def bounds(self, field, low, high): # index slice for low <= field <= high
+        """
+        Find the slice of field's index with values between low and high
+
+        Returns: Tuple (start, end) into the index lists
+        Raises: ValueError if field is not indexed
+        """
+        keys = self.index(field)[0]
+        start = 0 if low is None else bisect_left(keys, low)
+        end = len(keys) if high is None else bisect_right(keys, high)
+        return start, end
+
+# ============================================================================
+# TESTING
+# ============================================================================
+
+if __name__ == "__main__":
+    print("=== QUEST CATALOG TEST ===")
+
+    import game_data
+
+    catalog = QuestCatalog(game_data.load_quests())
+    print(f"Levels 1-3: {[quest['quest_id'] for quest in catalog.by_level(1, 3)]}")
+    print(f"Top 2 by XP: {[quest['quest_id'] for quest in catalog.top('reward_xp', 2)]}")
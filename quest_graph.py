@@ -0,0 +1,306 @@
+"""
+COMP 163 - Project 3: Quest Chronicles
+Quest Graph Module
+
+This module indexes the quest catalog once (prerequisite links, the
+reverse "unlocks" links and quests grouped by required level) so a
+character's available quests can be kept up to date as they accept and
+complete quests and level up, instead of scanning every quest each time.
+
+The same graph resolves prerequisites: topological order, depth, cycle
+detection and memoized prerequisite chains.
+"""
+
+from bisect import bisect_right
+
+from custom_exceptions import QuestNotFoundError, QuestPrerequisiteCycleError
+
+# Prerequisite value meaning "no prerequisite"
+NO_PREREQUISITE = "NONE"
+
+# ============================================================================
+# QUEST GRAPH
+# ============================================================================
+
+class QuestGraph: # prerequisite and level index over the quest catalog
+    """
+    Read-only index over a quest data dictionary (load_quests output)
+
+    Attributes:
+        quests: The quest data dictionary
+        prerequisite: quest_id -> prerequisite quest_id (or None)
+        unlocks: quest_id -> list of quests that list it as their prerequisite
+        required_level: quest_id -> required level (quests with a level that
+                        isn't a number are left out and never available)
+        roots: Quests with no prerequisite
+        order: quest_id -> position in the catalog (for stable listings)
+        missing: quest_id -> prerequisite that isn't in the catalog
+
+    After resolve():
+        topological_order: Every quest ID, each after its prerequisite
+        depth: quest_id -> number of prerequisites before it
+    """
+
+    def __init__(self, quest_data_dict):
+        """Build the index from a quest data dictionary"""
+        self.quests = quest_data_dict
+        self.prerequisite = {}
+        self.unlocks = {}
+        self.required_level = {}
+        self.roots = []
+        self.order = {}
+        self.missing = {}
+        self.topological_order = None
+        self.depth = {}
+        self.chains = {}
+
+        for position, (quest_id, quest) in enumerate(quest_data_dict.items()):
+            self.order[quest_id] = position
+            try:
+                self.required_level[quest_id] = int(quest.get("required_level", 0))
+            except (ValueError, TypeError):
+                pass
+
+            prerequisite = quest.get("prerequisite", NO_PREREQUISITE)
+            if prerequisite and prerequisite != NO_PREREQUISITE:
+                self.prerequisite[quest_id] = prerequisite
+                self.unlocks.setdefault(prerequisite, []).append(quest_id)
+            else:
+                self.prerequisite[quest_id] = None
+                self.roots.append(quest_id)
+
+        for quest_id, prerequisite in self.prerequisite.items():
+            if prerequisite is not None and prerequisite not in self.order:
+                self.missing[quest_id] = prerequisite
+
+    def __len__(self):
+        return len(self.order)
+
+    def __contains__(self, quest_id):
+        return quest_id in self.order
+
+    def can_accept(self, character, quest_id): # same rules as quest_handler.can_accept_quest
+        """
+        Check if character meets the level and prerequisite requirements
+
+        Returns: True if can accept, False otherwise
+        """
+        if quest_id not in self.required_level:
+            return False
+        if int(character.get("level", 0)) < self.required_level[quest_id]:
+            return False
+        prerequisite = self.prerequisite[quest_id]
+        return prerequisite is None or prerequisite in character.get("completed_quests", [])
+
+    def tracker(self, character): # availability tracker for one character
+        """Create a QuestAvailability for character"""
+        return QuestAvailability(self, character)
+
+    # ------------------------------------------------------------------------
+    # Prerequisite resolution
+    # ------------------------------------------------------------------------
+
+    def resolve(self): # topological order and depth of every quest
+        """
+        Work out topological order and depth for every quest in one pass
+
+        Each quest is visited once: its prerequisite links are followed up to
+        a quest that is already resolved (or has no prerequisite), then the
+        walked path is numbered on the way back down. A quest whose
+        prerequisite is missing from the catalog counts as depth 0.
+
+        Returns: List of quest IDs in topological order
+        Raises: QuestPrerequisiteCycleError if prerequisites loop, with the
+                looping path (e.g. ['a', 'b', 'a'])
+        """
+        if self.topological_order is not None:
+            return self.topological_order
+        order = []
+        depth = {}
+        for start_id in self.order:
+            path = []
+            on_path = {}
+            quest_id = start_id
+            while quest_id not in depth:
+                on_path[quest_id] = len(path)
+                path.append(quest_id)
+                quest_id = self.prerequisite[quest_id]
+                if quest_id is None or quest_id not in self.order:
+                    quest_id = None
+                    break
+                if quest_id in on_path:
+                    raise QuestPrerequisiteCycleError(path[on_path[quest_id]:] + [quest_id])
+
+            current_depth = -1 if quest_id is None else depth[quest_id]
+            for quest_id in reversed(path):
+                current_depth += 1
+                depth[quest_id] = current_depth
+                order.append(quest_id)
+
+        self.depth = depth
+        self.topological_order = order
+        return order
+
+    def prerequisite_chain(self, quest_id): # memoized prerequisite chain
+        """
+        Get the full chain of prerequisites for a quest
+
+        Chains are memoized, so repeated lookups return the same tuple.
+
+        Returns: Tuple of quest IDs in order (earliest_prereq, ..., quest_id)
+        Raises:
+            QuestNotFoundError if the quest or one of its prerequisites doesn't exist
+            QuestPrerequisiteCycleError if prerequisites loop
+        """
+        chain = self.chains.get(quest_id)
+        if chain is not None:
+            return chain
+        if quest_id not in self.order:
+            raise QuestNotFoundError
+        self.resolve()
+
+        walked = []
+        current_id = quest_id
+        while current_id is not None and current_id not in self.chains:
+            if current_id not in self.order:
+                raise QuestNotFoundError
+            walked.append(current_id)
+            current_id = self.prerequisite[current_id]
+        base = self.chains[current_id] if current_id is not None else ()
+        chain = base + tuple(reversed(walked))
+        self.chains[quest_id] = chain
+        return chain
+
+# ============================================================================
+# INCREMENTAL AVAILABILITY
+# ============================================================================
+
+class QuestAvailability: # a character's available quests, kept up to date
+    """
+    Available quests for one character
+
+    Available = meets level req + prerequisite done + not completed + not active
+    (the same rule as quest_handler.get_available_quests).
+
+    Quests whose prerequisite is done but whose level is still too high wait
+    in per-level buckets and move to the available set when the character
+    reaches that level. Call the quest_* methods after the matching
+    quest_handler call, and level_changed() after experience is gained.
+    """
+
+    def __init__(self, graph, character):
+        """Work out the starting available quests for character"""
+        self.graph = graph
+        self.character = character
+        self.level = int(character.get("level", 0))
+        self.completed = set(character.get("completed_quests", []))
+        self.active = set(character.get("active_quests", []))
+        self.available = set()
+        # required level -> quests unlocked by prerequisites but not by level
+        self.waiting = {}
+        self.waiting_levels = [] # sorted keys of waiting
+
+        # Only roots and quests unlocked by a completed quest can be available
+        for quest_id in graph.roots:
+            self.consider(quest_id)
+        for completed_id in self.completed:
+            for quest_id in graph.unlocks.get(completed_id, ()):
+                self.consider(quest_id)
+
+    def __len__(self):
+        return len(self.available)
+
+    def __contains__(self, quest_id):
+        return quest_id in self.available
+
+    def quest_ids(self): # available quest IDs in catalog order
+        """Get available quest IDs in the same order as the quest catalog"""
+        return sorted(self.available, key=self.graph.order.__getitem__)
+
+    def quests(self): # available quest dictionaries in catalog order
+        """
+        Get quests that character can currently accept
+
+        Returns: List of quest dictionaries
+        """
+        quests = self.graph.quests
+        return [quests[quest_id] for quest_id in self.quest_ids()]
+
+    def quest_accepted(self, quest_id): # call after quest_handler.accept_quest
+        """Record that quest_id became active"""
+        self.active.add(quest_id)
+        self.available.discard(quest_id)
+
+    def quest_abandoned(self, quest_id): # call after quest_handler.abandon_quest
+        """Record that quest_id is no longer active"""
+        self.active.discard(quest_id)
+        self.consider(quest_id)
+
+    def quest_completed(self, quest_id): # call after quest_handler.complete_quest
+        """
+        Record that quest_id was completed, unlock the quests that need it
+        and pick up any level gained from its rewards
+        """
+        self.active.discard(quest_id)
+        self.available.discard(quest_id)
+        self.completed.add(quest_id)
+        for unlocked_id in self.graph.unlocks.get(quest_id, ()):
+            self.consider(unlocked_id)
+        self.level_changed()
+
+    def level_changed(self): # call after the character's level may have changed
+        """Move quests up to the character's new level into the available set"""
+        level = int(self.character.get("level", 0))
+        if level <= self.level:
+            self.level = level
+            return
+        self.level = level
+        reached = bisect_right(self.waiting_levels, level)
+        for required_level in self.waiting_levels[:reached]:
+            for quest_id in self.waiting.pop(required_level):
+                if quest_id not in self.active and quest_id not in self.completed:
+                    self.available.add(quest_id)
+        del self.waiting_levels[:reached]
+
+    # ------------------------------------------------------------------------
+    # Internal helpers
+    # ------------------------------------------------------------------------
+
+    def consider(self, quest_id): # places a quest whose prerequisite is done
+        """Add quest_id to the available set or its level bucket"""
+        if quest_id not in self.graph.required_level:
+            return
+        if quest_id in self.completed or quest_id in self.active:
+            return
+        prerequisite = self.graph.prerequisite[quest_id]
+        if prerequisite is not None and prerequisite not in self.completed:
+            return
+        required_level = self.graph.required_level[quest_id]
+        if self.level >= required_level:
+            self.available.add(quest_id)
+            return
+        bucket = self.waiting.get(required_level)
+        if bucket is None:
+            bucket = self.waiting[required_level] = set()
+            self.waiting_levels.insert(bisect_right(self.waiting_levels, required_level),
+                                       required_level)
+        bucket.add(quest_id)
+
+# ============================================================================
+# TESTING
+# ============================================================================
+
+if __name__ == "__main__":
+    print("=== QUEST GRAPH TEST ===")
+
+    import game_data
+
+    graph = QuestGraph(game_data.load_quests())
+    hero = {'level': 1, 'active_quests': [], 'completed_quests': []}
+    availability = graph.tracker(hero)
+    print(f"Available at level 1: {availability.quest_ids()}")
+    hero['completed_quests'].append('first_steps')
+    hero['level'] = 2
+    availability.quest_completed('first_steps')
+    print(f"Available at level 2: {availability.quest_ids()}")
+    print(f"Deepest quest: {max(graph.resolve(), key=graph.depth.get)}")
@@ -14,10 +14,12 @@ from custom_exceptions import (
     QuestRequirementsNotMetError,
     QuestAlreadyCompletedError,
     QuestNotActiveError,
-    InsufficientLevelError
+    InsufficientLevelError,
+    QuestPrerequisiteCycleError
 
 )
 import character_manager
+from quest_graph import QuestGraph
 
 # ============================================================================
 # QUEST MANAGEMENT
@@ -73,7 +75,7 @@ def accept_quest(character, quest_id, quest_data_dict): # accept a new quest
         raise QuestRequirementsNotMetError
 
     if not isinstance(character.get("active_quests"), list):
-        character["active_quests"] = []
+        character["active_quests"] = character_manager.QuestList()
     character["active_quests"].append(quest_id)
 
 
@@ -113,12 +115,12 @@ def complete_quest(character, quest_id, quest_data_dict): # complete an active q
     if not quest:
         raise QuestNotFoundError
     character["active_quests"].remove(quest_id)
-    character.setdefault("completed_quests", []).append(quest_id)
+    character.setdefault("completed_quests", character_manager.QuestList()).append(quest_id)
     reward_xp = quest.get("reward_xp", 0)
     reward_gold = quest.get("reward_gold", 0)
     character_manager.gain_experience(character, reward_xp)
     character_manager.add_gold(character, reward_gold)
-    totals = get_total_quest_rewards_earned(character, quest_data_dict)
+    totals = add_quest_rewards_earned(character, reward_xp, reward_gold, quest_data_dict)
     return totals
 
 
@@ -182,8 +184,8 @@ def get_available_quests(character, quest_data_dict): # get list of quests chara
     # Filter all quests by requirements
     avaliable_quests = []
     level = int(character.get("level", 0))
-    active = set(character.get("active_quests", []))
-    completed = set(character.get("completed_quests", []))
+    active = quest_id_set(character.get("active_quests", []))
+    completed = quest_id_set(character.get("completed_quests", []))
     for quest_id, quest in quest_data_dict.items():
         try:
             required_level = int(quest.get("required_level", 0))
@@ -204,6 +206,12 @@ def get_available_quests(character, quest_data_dict): # get list of quests chara
             continue
     return avaliable_quests
 
+def quest_id_set(quest_ids): # fast membership view of a quest list
+    """Return quest_ids itself if it is a QuestList, otherwise a set copy"""
+    if isinstance(quest_ids, character_manager.QuestList):
+        return quest_ids
+    return set(quest_ids)
+
 # ============================================================================
 # QUEST TRACKING
 # ============================================================================
@@ -258,36 +266,44 @@ def can_accept_quest(character, quest_id, quest_data_dict): # check if character
     return True
 
 
-def get_quest_prerequisite_chain(quest_id, quest_data_dict): # get full chain of prerequisites for a quest
+def get_quest_prerequisite_chain(quest_id, quest_data_dict, graph=None): # get full chain of prerequisites for a quest
     """
     Get the full chain of prerequisites for a quest
     
+    Args:
+        quest_id: Quest to trace
+        quest_data_dict: Dictionary of all quest data
+        graph: Optional QuestGraph built from quest_data_dict; chains looked
+               up through a graph are memoized
+    
     Returns: List of quest IDs in order [earliest_prereq, ..., quest_id]
     Example: If Quest C requires Quest B, which requires Quest A:
              Returns ["quest_a", "quest_b", "quest_c"]
     
-    Raises: QuestNotFoundError if quest doesn't exist
+    Raises:
+        QuestNotFoundError if quest (or one of its prerequisites) doesn't exist
+        QuestPrerequisiteCycleError if prerequisites loop back on themselves
     """
     # TODO: Implement prerequisite chain tracing
     # Follow prerequisite links backwards
     # Build list in reverse order
+    if graph is not None:
+        return list(graph.prerequisite_chain(quest_id))
     if quest_id not in quest_data_dict:
         raise QuestNotFoundError
     chain = []
-    visited = ()
+    visited = set()
     current_id = quest_id
-    while current_id:
+    while current_id and current_id != "NONE":
         if current_id in visited:
-            raise ValueError
+            raise QuestPrerequisiteCycleError(chain[chain.index(current_id):] + [current_id])
         visited.add(current_id)
         quest = quest_data_dict.get(current_id)
         if not quest:
             raise QuestNotFoundError
-        prerequisite = quest_data_dict.get("PREREQUISITE")
-        if prerequisite:
-            chain.insert(0, prerequisite)
-        current_id = prerequisite
-    chain.append(current_id)
+        chain.append(current_id)
+        current_id = quest.get("prerequisite", "NONE")
+    chain.reverse()
     return chain
 
 
@@ -323,23 +339,82 @@ def get_total_quest_rewards_earned(character, quest_data_dict): # calculate tota
     for quest_id in character.get("completed_quests", []):
         quest = quest_data_dict.get(quest_id)
         if quest:
-            total_xp += quest.get("reward_xp")
-            total_gold += quest.get("reward_gold")
+            total_xp += quest.get("reward_xp", 0)
+            total_gold += quest.get("reward_gold", 0)
 
     return {
         "total_xp" : total_xp,
         "total_gold" : total_gold
     }
 
+def add_quest_rewards_earned(character, reward_xp, reward_gold, quest_data_dict): # updates the running reward totals
+    """
+    Add one completed quest's rewards to the character's running totals
+
+    The totals are kept in character['quest_xp_earned'] and
+    character['quest_gold_earned'] and saved with the character.
+    A character without them (an older save) gets them recomputed once
+    from completed_quests, which already includes the quest just completed.
+
+    Returns: Dictionary with 'total_xp' and 'total_gold'
+    """
+    if "quest_xp_earned" in character and "quest_gold_earned" in character:
+        character["quest_xp_earned"] += reward_xp
+        character["quest_gold_earned"] += reward_gold
+    else:
+        totals = get_total_quest_rewards_earned(character, quest_data_dict)
+        character["quest_xp_earned"] = totals["total_xp"]
+        character["quest_gold_earned"] = totals["total_gold"]
+    return {
+        "total_xp" : character["quest_xp_earned"],
+        "total_gold" : character["quest_gold_earned"]
+    }
+
+def audit_quest_rewards(character, quest_data_dict, repair=False): # checks the running totals against a full recount
+    """
+    Check the running reward totals against a recount of completed quests
+
+    Args:
+        character: Character dictionary
+        quest_data_dict: Dictionary of all quest data
+        repair: If True, overwrite the running totals with the recount
+
+    Returns: Dictionary with:
+            {'consistent': bool,
+             'recorded': {'total_xp', 'total_gold'} (None values if missing),
+             'expected': {'total_xp', 'total_gold'}}
+    """
+    expected = get_total_quest_rewards_earned(character, quest_data_dict)
+    recorded = {
+        "total_xp" : character.get("quest_xp_earned"),
+        "total_gold" : character.get("quest_gold_earned")
+    }
+    if repair:
+        character["quest_xp_earned"] = expected["total_xp"]
+        character["quest_gold_earned"] = expected["total_gold"]
+    return {
+        "consistent" : recorded == expected,
+        "recorded" : recorded,
+        "expected" : expected
+    }
+
     
 
-def get_quests_by_level(quest_data_dict, min_level, max_level): # get quests within a level range
+def get_quests_by_level(quest_data_dict, min_level, max_level, catalog=None): # get quests within a level range
     """
     Get all quests within a level range
     
+    Args:
+        quest_data_dict: Dictionary of all quest data
+        min_level, max_level: Level range (inclusive)
+        catalog: Optional QuestCatalog built from quest_data_dict; its
+                 level index is used instead of checking every quest
+    
     Returns: List of quest dictionaries
     """
     # TODO: Implement level filtering
+    if catalog is not None:
+        return catalog.by_level(min_level, max_level)
     return [
         quest for quest in quest_data_dict.values()
         if min_level <= quest.get("required_level", quest.get("REQUIRED_LEVEL", 0)) <= max_level
@@ -421,18 +496,20 @@ def validate_quest_prerequisites(quest_data_dict): # validate that all quest pre
     Validate that all quest prerequisites exist
     
     Checks that every prerequisite (that's not "NONE") refers to a real quest
+    and that no prerequisites loop back on themselves
     
     Returns: True if all valid
-    Raises: QuestNotFoundError if invalid prerequisite found
+    Raises:
+        QuestNotFoundError if invalid prerequisite found
+        QuestPrerequisiteCycleError if prerequisites form a cycle
     """
     # TODO: Implement prerequisite validation
     # Check each quest's prerequisite
     # Ensure prerequisite exists in quest_data_dict
-    for quest_id, quest_data in quest_data_dict.items():
-        prerequisite = quest_data.get("PREREQUISITE")
-        if prerequisite and prerequisite != "None":
-            if prerequisite not in quest_data_dict:
-                raise QuestNotFoundError
+    graph = QuestGraph(quest_data_dict)
+    if graph.missing:
+        raise QuestNotFoundError
+    graph.resolve()
     return True
 
 
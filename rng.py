@@ -0,0 +1,127 @@
+"""
+COMP 163 - Project 3: Quest Chronicles
+Random Numbers Module
+
+This module provides GameRNG, the random number source passed to battles,
+special abilities and enemy selection instead of the global random module.
+Each GameRNG is seeded and remembers its seed, so any battle can be
+replayed exactly by building a new GameRNG from the recorded seed.
+
+Every draw comes from random() (chance, choice and randint are built on
+it), so a seed gives the same sequence whether numbers are drawn one at a
+time or pre-generated in blocks.
+"""
+
+import random
+from itertools import chain, islice, repeat
+
+# ============================================================================
+# GAME RNG
+# ============================================================================
+
+def new_seed(): # fresh seed from the global random module
+    """
+    Make a new seed
+
+    It comes from the global random module, so calling random.seed() first
+    also fixes the seeds of generators created without one.
+    """
+    return random.getrandbits(63)
+
+class GameRNG: # seedable, replayable random number source
+    """
+    Seeded random number source
+
+    Attributes:
+        seed: The seed (an int or a string); GameRNG(rng.seed) replays it
+        block_size: 0 to draw numbers one at a time, or how many numbers to
+                    pre-generate at once (batch mode)
+
+    random is the underlying generator's bound random() method, so a draw
+    is a single C call with no wrapper. In batch mode it is the next number
+    from the current pre-generated block instead (the same numbers in the
+    same order). Batch mode is for handing out numbers in bulk, not for
+    speeding up single draws: benchmarks/bench_rng.py shows one-at-a-time
+    draws are faster in CPython.
+    """
+
+    def __init__(self, seed=None, block_size=0):
+        """Create a generator; seed None picks a new seed (see new_seed)"""
+        if seed is None:
+            seed = new_seed()
+        self.seed = seed
+        self.block_size = block_size
+        self.source = random.Random(seed)
+        if block_size > 0:
+            self.stream = chain.from_iterable(self.blocks())
+            self.random = self.stream.__next__
+        else:
+            self.stream = None
+            self.random = self.source.random
+
+    def blocks(self): # endless pre-generated blocks of random()
+        """Yield lists of block_size numbers from the underlying generator"""
+        draw = self.source.random
+        block_size = self.block_size
+        while True:
+            yield [draw() for _ in repeat(None, block_size)]
+
+    def chance(self, probability): # True with the given probability
+        """Return True with the given probability (0.0 to 1.0)"""
+        return self.random() < probability
+
+    def choice(self, options): # one item of a sequence
+        """Return a random item from a non-empty sequence"""
+        return options[int(self.random() * len(options))]
+
+    def randint(self, low, high): # integer in [low, high]
+        """Return a random integer N with low <= N <= high"""
+        return low + int(self.random() * (high - low + 1))
+
+    def draws(self, count): # many random() values at once
+        """
+        Draw count numbers at once
+
+        Returns: List of floats in [0.0, 1.0), the same numbers count
+                 calls to random() would have given
+        """
+        if self.stream is not None:
+            return list(islice(self.stream, count))
+        draw = self.source.random
+        return [draw() for _ in repeat(None, count)]
+
+    def spawn(self, key): # independent generator for one battle or cell
+        """
+        Make a generator seeded from this seed and key
+
+        The child's seed is the string "{seed}:{key}", so the same parent
+        seed and key give the same numbers in any process.
+        """
+        return GameRNG(f"{self.seed}:{key}", self.block_size)
+
+    def replay(self): # same numbers again, from the start
+        """Return a new generator that repeats this one's numbers from the start"""
+        return GameRNG(self.seed, self.block_size)
+
+    def __repr__(self):
+        return f"GameRNG(seed={self.seed!r}, block_size={self.block_size})"
+
+# Used when no generator is passed in (e.g. by main.py's battles)
+DEFAULT_RNG = GameRNG()
+
+def get_rng(rng=None): # the generator to use
+    """Return rng, or DEFAULT_RNG if rng is None"""
+    return DEFAULT_RNG if rng is None else rng
+
+# ============================================================================
+# TESTING
+# ============================================================================
+
+if __name__ == "__main__":
+    print("=== RNG TEST ===")
+
+    rng = GameRNG(163)
+    first = rng.draws(5)
+    print(f"Seed {rng.seed}: {first}")
+    print(f"Replay matches: {rng.replay().draws(5) == first}")
+    print(f"Batch mode matches: {GameRNG(163, block_size=1024).draws(5) == first}")
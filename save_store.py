@@ -0,0 +1,193 @@
+"""
+COMP 163 - Project 3: Quest Chronicles
+Save Store Module
+
+This module keeps every character save in one SQLite database file
+instead of one {name}_save.txt file per character. Lookups go through the
+primary key index on the character name, and listing can be paginated.
+
+Characters are stored in the binary save format from character_manager.
+"""
+
+import os
+import sqlite3
+
+import character_manager
+from custom_exceptions import (
+    CharacterNotFoundError,
+    SaveFileCorruptedError,
+    InvalidSaveDataError
+)
+
+DEFAULT_STORE_PATH = "data/save_games.db"
+
+# Saves written per transaction when importing a save directory
+IMPORT_BATCH_SIZE = 1000
+
+# ============================================================================
+# SAVE STORE
+# ============================================================================
+
+class SaveStore: # all character saves in a single database file
+    """
+    Single-file character save store
+
+    Offers the same operations as character_manager's file-based saves:
+    save_character, load_character, list_saved_characters, delete_character
+    """
+
+    def __init__(self, path=DEFAULT_STORE_PATH):
+        """Open (or create) the store at path"""
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.path = path
+        try:
+            self.connection = sqlite3.connect(path)
+            self.connection.execute(
+                "CREATE TABLE IF NOT EXISTS characters ("
+                "name TEXT PRIMARY KEY, data BLOB NOT NULL) WITHOUT ROWID"
+            )
+            self.connection.commit()
+        except sqlite3.DatabaseError:
+            raise SaveFileCorruptedError
+
+    def close(self): # closes the database file
+        """Close the store"""
+        self.connection.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def save_character(self, character): # saves or replaces one character
+        """
+        Save character to the store, replacing any older save
+
+        Returns: True if successful
+        """
+        data = character_manager.encode_character_binary(character)
+        with self.connection:
+            self.connection.execute(
+                "INSERT OR REPLACE INTO characters (name, data) VALUES (?, ?)",
+                (str(character['name']), data)
+            )
+        return True
+
+    def save_many(self, characters): # saves many characters in one transaction
+        """
+        Save several characters with a single commit
+
+        Returns: Number of characters saved
+        """
+        rows = [
+            (str(character['name']), character_manager.encode_character_binary(character))
+            for character in characters
+        ]
+        with self.connection:
+            self.connection.executemany(
+                "INSERT OR REPLACE INTO characters (name, data) VALUES (?, ?)", rows
+            )
+        return len(rows)
+
+    def load_character(self, character_name): # loads one character by name
+        """
+        Load character from the store
+
+        Returns: Character dictionary
+        Raises:
+            CharacterNotFoundError if no save exists for that name
+            SaveFileCorruptedError if the stored data can't be read
+        """
+        try:
+            row = self.connection.execute(
+                "SELECT data FROM characters WHERE name = ?", (character_name,)
+            ).fetchone()
+        except sqlite3.DatabaseError:
+            raise SaveFileCorruptedError
+        if row is None:
+            raise CharacterNotFoundError
+        return character_manager.decode_character_binary(row[0])
+
+    def list_saved_characters(self, offset=0, limit=None): # lists names one page at a time
+        """
+        Get saved character names in alphabetical order
+
+        Args:
+            offset: Number of names to skip
+            limit: Maximum number of names to return (None = all)
+
+        Returns: List of character names
+        """
+        if limit is None:
+            limit = -1
+        rows = self.connection.execute(
+            "SELECT name FROM characters ORDER BY name LIMIT ? OFFSET ?",
+            (limit, offset)
+        )
+        return [name for (name,) in rows]
+
+    def count_characters(self): # number of saved characters
+        """Return the number of saved characters"""
+        return self.connection.execute("SELECT COUNT(*) FROM characters").fetchone()[0]
+
+    def delete_character(self, character_name): # deletes one character
+        """
+        Delete a character's save
+
+        Returns: True if deleted successfully
+        Raises: CharacterNotFoundError if character doesn't exist
+        """
+        with self.connection:
+            cursor = self.connection.execute(
+                "DELETE FROM characters WHERE name = ?", (character_name,)
+            )
+        if cursor.rowcount == 0:
+            raise CharacterNotFoundError
+        return True
+
+# ============================================================================
+# MIGRATION
+# ============================================================================
+
+def import_save_directory(store, save_directory="data/save_games"): # copies file saves into the store
+    """
+    Import every {name}_save.txt file from a save directory into a store
+
+    Saves that can't be loaded are skipped and reported.
+
+    Returns: Dictionary {'imported': [names], 'failed': [names]}
+    """
+    imported = []
+    failed = []
+    batch = []
+    for name in character_manager.list_saved_characters(save_directory):
+        try:
+            character = character_manager.load_character(name, save_directory)
+            character_manager.validate_character_data(character)
+        except (CharacterNotFoundError, SaveFileCorruptedError,
+                InvalidSaveDataError, KeyError, ValueError):
+            failed.append(name)
+            continue
+        batch.append(character)
+        imported.append(name)
+        if len(batch) >= IMPORT_BATCH_SIZE:
+            store.save_many(batch)
+            batch = []
+    if batch:
+        store.save_many(batch)
+    return {'imported': imported, 'failed': failed}
+
+# ============================================================================
+# TESTING
+# ============================================================================
+
+if __name__ == "__main__":
+    print("=== SAVE STORE TEST ===")
+
+    with SaveStore() as store:
+        result = import_save_directory(store)
+        print(f"Imported {len(result['imported'])} saves, {len(result['failed'])} failed")
+        print(f"First page: {store.list_saved_characters(0, 10)}")
@@ -0,0 +1,200 @@
+"""
+COMP 163 - Project 3: Quest Chronicles
+Shop Module
+
+This module runs shops on top of inventory_system.purchase_item and
+sell_item. Each shop keeps its items sorted by price (so browsing by type
+and budget is a bisect, not a scan) and can have limited stock.
+
+Purchases and sales are safe to run from several threads: every change to
+a character goes through that character's lock, so two threads buying for
+the same character can't both spend the same gold. Stock has its own
+per-shop lock, so different characters can shop at the same time.
+"""
+
+import threading
+import weakref
+from bisect import bisect_right
+from enum import Enum
+
+import inventory_system
+from custom_exceptions import ItemNotFoundError, OutOfStockError
+
+# Locks shared by every shop, one per character name. Only weak
+# references are kept, so a lock goes away once no purchase or sale is
+# using it and the table doesn't grow with every name ever seen.
+CHARACTER_LOCKS = weakref.WeakValueDictionary()
+CHARACTER_LOCKS_GUARD = threading.Lock()
+
+# ============================================================================
+# CHARACTER LOCKS
+# ============================================================================
+
+def get_character_lock(character): # the lock guarding one character
+    """
+    Get the lock for a character (keyed by name, so every shop and every
+    copy of a character with the same name shares it while it is in use)
+
+    Returns: threading.RLock (hold on to it for as long as it is needed)
+    """
+    key = character.get("name", id(character))
+    with CHARACTER_LOCKS_GUARD:
+        lock = CHARACTER_LOCKS.get(key)
+        if lock is None:
+            lock = threading.RLock()
+            CHARACTER_LOCKS[key] = lock
+    return lock
+
+# ============================================================================
+# SHOP
+# ============================================================================
+
+def type_key(item_type): # plain string for an item type
+    """Return item_type as a plain string (ItemType members give their value)"""
+    if isinstance(item_type, Enum):
+        return item_type.value
+    return item_type
+
+class Shop: # a price-indexed shop with optional stock limits
+    """
+    Shop selling items from an item data dictionary (load_items output
+    or an ItemCatalog)
+
+    Stock: stock[item_id] is how many the shop has left. Items not listed
+    in stock are unlimited. Items sold to the shop are added back to any
+    limited stock.
+    """
+
+    def __init__(self, items, stock=None):
+        """Build the price index for items"""
+        self.items = items
+        self.stock = dict(stock or {})
+        self.lock = threading.Lock()
+        # item type (None = every type) -> (costs, item_ids) sorted by cost
+        self.price_index = {}
+        entries = sorted(
+            (int(item.get("cost", 0)), item_id, type_key(item.get("type", "")))
+            for item_id, item in self.iter_items()
+        )
+        for cost, item_id, item_type in entries:
+            for key in (None, item_type):
+                costs, item_ids = self.price_index.setdefault(key, ([], []))
+                costs.append(cost)
+                item_ids.append(item_id)
+
+    def iter_items(self): # (item_id, item) pairs for dicts and catalogs
+        """Yield (item_id, item data) for every item the shop sells"""
+        if isinstance(self.items, dict):
+            return iter(self.items.items())
+        return ((item.item_id, item) for item in self.items)
+
+    def browse(self, item_type=None, max_cost=None, in_stock_only=True): # items by price
+        """
+        List items from cheapest to most expensive
+
+        Args:
+            item_type: Only this type ("weapon", "armor", "consumable")
+            max_cost: Only items costing at most this much (a budget)
+            in_stock_only: Leave out items that are sold out
+
+        Returns: List of item data, cheapest first
+        """
+        costs, item_ids = self.price_index.get(type_key(item_type), ([], []))
+        end = len(costs) if max_cost is None else bisect_right(costs, max_cost)
+        return [
+            self.items[item_id] for item_id in item_ids[:end]
+            if not in_stock_only or self.stock_left(item_id) != 0
+        ]
+
+    def affordable(self, character, item_type=None): # what the character can pay for
+        """List in-stock items the character has enough gold for, cheapest first"""
+        return self.browse(item_type, int(character.get("gold", 0)))
+
+    def stock_left(self, item_id): # remaining stock (None = unlimited)
+        """Return how many item_id the shop has left, or None if unlimited"""
+        return self.stock.get(item_id)
+
+    def get_item(self, item_id): # item data or ItemNotFoundError
+        """
+        Get the data for an item the shop sells
+
+        Raises: ItemNotFoundError if the shop doesn't sell it
+        """
+        item_data = self.items.get(item_id)
+        if item_data is None:
+            raise ItemNotFoundError
+        return item_data
+
+    def purchase(self, character, item_id): # thread-safe purchase_item
+        """
+        Buy one item for a character
+
+        Returns: True if purchased
+        Raises:
+            ItemNotFoundError if the shop doesn't sell the item
+            OutOfStockError if the shop has none left
+            InsufficientResourcesError, InventoryFullError from purchase_item
+        """
+        item_data = self.get_item(item_id)
+        with get_character_lock(character):
+            self.take_stock(item_id)
+            try:
+                inventory_system.purchase_item(character, item_id, item_data)
+            except Exception:
+                self.return_stock(item_id)
+                raise
+        return True
+
+    def sell(self, character, item_id): # thread-safe sell_item
+        """
+        Sell one item from a character to the shop
+
+        Returns: Amount of gold received
+        Raises: ItemNotFoundError if the shop doesn't deal in the item or
+                the character doesn't have it
+        """
+        item_data = self.get_item(item_id)
+        with get_character_lock(character):
+            gold = inventory_system.sell_item(character, item_id, item_data)
+        self.return_stock(item_id)
+        return gold
+
+    # ------------------------------------------------------------------------
+    # Internal helpers
+    # ------------------------------------------------------------------------
+
+    def take_stock(self, item_id): # reserves one from limited stock
+        """
+        Take one item_id out of the shop's stock (if it is limited)
+
+        Raises: OutOfStockError if none are left
+        """
+        with self.lock:
+            left = self.stock.get(item_id)
+            if left is None:
+                return
+            if left <= 0:
+                raise OutOfStockError
+            self.stock[item_id] = left - 1
+
+    def return_stock(self, item_id): # puts one back into limited stock
+        """Add one item_id back to the shop's stock (if it is limited)"""
+        with self.lock:
+            if item_id in self.stock:
+                self.stock[item_id] += 1
+
+# ============================================================================
+# TESTING
+# ============================================================================
+
+if __name__ == "__main__":
+    print("=== SHOP TEST ===")
+
+    import game_data
+
+    shop = Shop(game_data.load_items(), stock={"health_potion": 3})
+    hero = {'name': "ShopTest", 'gold': 200, 'inventory': []}
+    for item in shop.affordable(hero):
+        print(f"{item['item_id']}: {item['cost']} gold")
+    shop.purchase(hero, "health_potion")
+    print(f"Gold left: {hero['gold']}, potions left in stock: {shop.stock_left('health_potion')}")
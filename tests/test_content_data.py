@@ -0,0 +1,225 @@
+"""
+Test Content Data
+Tests streaming, caching and indexing of quest, item and enemy content files
+"""
+
+import pytest
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import random
+import subprocess
+
+import combat_system
+import game_data
+import rng as rng_module
+from enemy_catalog import EnemyCatalog
+from custom_exceptions import (
+    InvalidDataFormatError,
+    MissingDataFileError,
+    InvalidTargetError
+)
+
+QUEST_TEXT = (
+    "QUEST_ID: first\n"
+    "TITLE: First\n"
+    "DESCRIPTION: The first quest\n"
+    "REWARD_XP: 50\n"
+    "REWARD_GOLD: 25\n"
+    "REQUIRED_LEVEL: 1\n"
+    "PREREQUISITE: NONE\n"
+    "\n"
+    "QUEST_ID: second\n"
+    "TITLE: Second\n"
+    "DESCRIPTION: The second quest\n"
+    "REWARD_XP: 100\n"
+    "REWARD_GOLD: 50\n"
+    "REQUIRED_LEVEL: 2\n"
+    "PREREQUISITE: first\n"
+)
+
+def enemy_block(enemy_id, min_level, max_level, weight=1):
+    """One enemies.txt block"""
+    return (f"ENEMY_ID: {enemy_id}\nNAME: {enemy_id.title()}\nHEALTH: 40\n"
+            f"STRENGTH: 6\nMAGIC: 1\nXP_REWARD: 20\nGOLD_REWARD: 5\n"
+            f"MIN_LEVEL: {min_level}\nMAX_LEVEL: {max_level}\nWEIGHT: {weight}\n\n")
+
+def write_file(tmp_path, name, text):
+    """Write a content file and return its path as a string"""
+    path = tmp_path / name
+    path.write_text(text)
+    return str(path)
+
+# ============================================================================
+# STREAMING PARSER TESTS
+# ============================================================================
+
+def test_iter_quests_streams_in_order(tmp_path):
+    """Test that iter_quests yields quests one at a time"""
+    filename = write_file(tmp_path, "quests.txt", QUEST_TEXT)
+
+    quests = game_data.iter_quests(filename)
+    first = next(quests)
+
+    assert first['quest_id'] == "first"
+    assert first['reward_xp'] == 50
+    assert [quest['quest_id'] for quest in quests] == ["second"]
+
+def test_streaming_matches_load(tmp_path):
+    """Test that load_quests/load_items are built on the streaming parsers"""
+    quests = game_data.load_quests("data/quests.txt")
+    items = game_data.load_items("data/items.txt")
+
+    assert list(quests.values()) == list(game_data.iter_quests("data/quests.txt"))
+    assert list(items.values()) == list(game_data.iter_items("data/items.txt"))
+
+def test_bad_number_reports_line(tmp_path):
+    """Test that InvalidDataFormatError reports the offending line"""
+    filename = write_file(tmp_path, "quests.txt",
+                          QUEST_TEXT.replace("REWARD_GOLD: 50", "REWARD_GOLD: fifty"))
+
+    with pytest.raises(InvalidDataFormatError) as error:
+        game_data.load_quests(filename)
+
+    assert error.value.line_number == 13
+    assert "line 13" in str(error.value)
+
+def test_missing_colon_reports_line(tmp_path):
+    """Test that a line without a colon is reported with its line number"""
+    filename = write_file(tmp_path, "items.txt",
+                          "ITEM_ID: potion\nNAME Potion\nTYPE: consumable\n")
+
+    with pytest.raises(InvalidDataFormatError) as error:
+        game_data.load_items(filename)
+
+    assert error.value.line_number == 2
+
+def test_streaming_missing_file(tmp_path):
+    """Test that a missing file raises MissingDataFileError"""
+    with pytest.raises(MissingDataFileError):
+        list(game_data.iter_items(str(tmp_path / "missing.txt")))
+
+# ============================================================================
+# COMPILED CONTENT CACHE TESTS
+# ============================================================================
+
+def test_content_cache_written_and_used(tmp_path):
+    """Test that a second load reads the compiled cache"""
+    filename = write_file(tmp_path, "quests.txt", QUEST_TEXT)
+
+    parsed = game_data.load_quests(filename)
+    assert os.path.exists(game_data.get_cache_path(filename))
+
+    source_key, cached = game_data.read_content_cache(filename, "quests")
+    assert cached == parsed
+    assert game_data.load_quests(filename) == parsed
+
+def test_content_cache_invalidated_by_change(tmp_path):
+    """Test that editing the source file makes the cache stale"""
+    filename = write_file(tmp_path, "quests.txt", QUEST_TEXT)
+    game_data.load_quests(filename)
+
+    write_file(tmp_path, "quests.txt", QUEST_TEXT.replace("REWARD_XP: 50", "REWARD_XP: 75"))
+
+    assert game_data.load_quests(filename)['first']['reward_xp'] == 75
+
+def test_content_cache_ignores_garbage(tmp_path):
+    """Test that an unreadable cache falls back to parsing"""
+    filename = write_file(tmp_path, "quests.txt", QUEST_TEXT)
+    write_file(tmp_path, "quests.txt.cache", "not a pickle")
+
+    assert len(game_data.load_quests(filename)) == 2
+
+def test_content_cache_kind_checked(tmp_path):
+    """Test that a quest cache is never returned as items"""
+    filename = write_file(tmp_path, "quests.txt", QUEST_TEXT)
+    game_data.load_quests(filename)
+
+    assert game_data.read_content_cache(filename, "items")[1] is None
+
+# ============================================================================
+# ENEMY CONTENT TESTS
+# ============================================================================
+
+def test_default_enemies_match_old_stats():
+    """Test that data/enemies.txt gives the same enemies as before"""
+    assert combat_system.create_enemy("Goblin") == {
+        'name': 'Goblin', 'health': 50, 'max_health': 50, 'strength': 8,
+        'magic': 2, 'xp_reward': 25, 'gold_reward': 10
+    }
+    for level, name in [(0, "Goblin"), (2, "Goblin"), (3, "Orc"), (5, "Orc"), (6, "Dragon"), (99, "Dragon")]:
+        assert combat_system.get_random_enemy_for_level(level)['name'] == name
+    with pytest.raises(InvalidTargetError):
+        combat_system.create_enemy("unicorn")
+
+def test_created_enemies_are_copies():
+    """Test that damaging one enemy doesn't change the template"""
+    goblin = combat_system.create_enemy("goblin")
+    goblin['health'] = 0
+    assert combat_system.create_enemy("goblin")['health'] == 50
+
+def test_load_enemies_parses_levels(tmp_path):
+    """Test that MAX_LEVEL NONE, WEIGHT and max_health are handled"""
+    filename = write_file(tmp_path, "enemies.txt",
+                          enemy_block("Slime", 1, 3) + enemy_block("wyrm", 4, "NONE", 3))
+    enemies = game_data.load_enemies(filename)
+    assert list(enemies) == ["slime", "wyrm"]
+    assert enemies['wyrm']['max_level'] is None
+    assert enemies['wyrm']['weight'] == 3
+    assert enemies['slime']['max_health'] == 40
+
+def test_load_enemies_rejects_bad_band(tmp_path):
+    """Test that MIN_LEVEL above MAX_LEVEL is reported at the block"""
+    filename = write_file(tmp_path, "enemies.txt",
+                          enemy_block("slime", 1, 3) + enemy_block("wyrm", 5, 4))
+    with pytest.raises(InvalidDataFormatError) as error:
+        game_data.load_enemies(filename)
+    assert error.value.line_number == 12
+
+def test_level_bands_with_gaps_and_overlaps(tmp_path):
+    """Test band lookup for overlapping bands and levels no enemy covers"""
+    filename = write_file(tmp_path, "enemies.txt",
+                          enemy_block("rat", 2, 4) + enemy_block("bat", 3, 6)
+                          + enemy_block("ogre", 10, "NONE"))
+    catalog = EnemyCatalog.load(filename)
+    assert catalog.enemy_types_for_level(1) == ["rat"]
+    assert catalog.enemy_types_for_level(4) == ["rat", "bat"]
+    assert catalog.enemy_types_for_level(5) == ["bat"]
+    assert catalog.enemy_types_for_level(8) == ["bat"]
+    assert catalog.enemy_types_for_level(40) == ["ogre"]
+
+def test_weighted_selection(tmp_path):
+    """Test that enemies are picked in proportion to their weights"""
+    filename = write_file(tmp_path, "enemies.txt",
+                          enemy_block("rat", 1, 5, 1) + enemy_block("bat", 1, 5, 3))
+    catalog = EnemyCatalog.load(filename)
+    rng = random.Random(7)
+    picks = [catalog.choose(3, rng) for _ in range(4000)]
+    assert 0.7 < picks.count("bat") / len(picks) < 0.8
+    assert catalog.create_for_level(3, random.Random(7))['name'] in ("Rat", "Bat")
+
+def test_selection_defaults_to_game_rng(tmp_path, monkeypatch):
+    """Test that picks without an rng come from the seedable DEFAULT_RNG"""
+    filename = write_file(tmp_path, "enemies.txt",
+                          enemy_block("rat", 1, 5, 1) + enemy_block("bat", 1, 5, 3))
+    catalog = EnemyCatalog.load(filename)
+    seeded = rng_module.GameRNG(42)
+    expected = [catalog.choose(3, seeded) for _ in range(50)]
+
+    monkeypatch.setattr(rng_module, "DEFAULT_RNG", rng_module.GameRNG(42))
+    random.seed(0)
+    assert [catalog.choose(3) for _ in range(50)] == expected
+
+def test_importing_combat_has_no_side_effects(tmp_path):
+    """Test that importing combat code prints nothing and writes no data files"""
+    repo = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    result = subprocess.run([sys.executable, "-c", "import combat_system, battle_simulator"],
+                            cwd=tmp_path, env={**os.environ, "PYTHONPATH": repo},
+                            capture_output=True, text=True, check=True)
+    assert result.stdout == ""
+    assert os.listdir(tmp_path) == []
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
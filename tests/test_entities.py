@@ -0,0 +1,228 @@
+"""
+Test Entities
+Tests equipment bonuses, slotted Character/Enemy records and the enemy pool
+"""
+
+import pytest
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import character_manager
+import equipment
+import inventory_system
+from battle_simulator import HeadlessBattle
+from combat_system import SimpleBattle, create_enemy
+from entities import Character, Enemy, EnemyPool
+from inventory_system import Inventory
+from custom_exceptions import InventoryFullError, InvalidTargetError
+
+SWORD = {'item_id': "sword", 'name': "Sword", 'type': "weapon",
+         'effect': {"strength": 5}, 'cost': 100, 'description': "Sharp"}
+AXE = {'item_id': "axe", 'name': "Axe", 'type': "weapon",
+       'effect': {"strength": 8}, 'cost': 150, 'description': "Heavy"}
+MAIL = {'item_id': "mail", 'name': "Mail", 'type': "armor",
+        'effect': {"max_health": 10}, 'cost': 80, 'description': "Sturdy"}
+PLATE = {'item_id': "plate", 'name': "Plate", 'type': "armor",
+         'effect': {"max_health": 25}, 'cost': 200, 'description': "Sturdier"}
+
+@pytest.fixture
+def hero():
+    """Warrior carrying two weapons and two armors"""
+    character = character_manager.create_character("Gearhero", "Warrior")
+    character['inventory'] = ["sword", "axe", "mail", "plate"]
+    return character
+
+# ============================================================================
+# EQUIPMENT TESTS
+# ============================================================================
+
+def test_equip_keeps_base_stats_separate(hero):
+    """Test that totals include bonuses while base stats don't"""
+    inventory_system.equip_weapon(hero, "sword", SWORD)
+    inventory_system.equip_armor(hero, "mail", MAIL)
+    assert hero['strength'] == 20
+    assert hero['max_health'] == 130
+    assert equipment.get_equipment_bonuses(hero) == {"strength": 5, "max_health": 10}
+    assert equipment.get_base_stats(hero) == {"strength": 15, "magic": 5, "max_health": 120}
+
+def test_swapping_armor_removes_old_bonus(hero):
+    """Test that replacing armor takes off the old armor's bonus only"""
+    inventory_system.equip_armor(hero, "mail", MAIL)
+    inventory_system.equip_armor(hero, "plate", PLATE)
+    assert hero['max_health'] == 145
+    assert hero['equipped_armor'] == "plate"
+    assert sorted(hero['inventory']) == ["axe", "mail", "sword"]
+
+def test_unequip_armor_returns_item_and_bonus(hero):
+    """Test that unequip_armor reads the right keys and restores base stats"""
+    inventory_system.equip_armor(hero, "plate", PLATE)
+    assert inventory_system.unequip_armor(hero) == "plate"
+    assert hero['max_health'] == 120
+    assert hero['health'] == 120
+    assert hero['equipped_armor'] is None
+    assert "plate" in hero['inventory']
+    assert inventory_system.unequip_armor(hero) is None
+
+def test_unequip_with_full_inventory(hero):
+    """Test that unequipping into a full inventory fails without losing the bonus"""
+    inventory_system.equip_weapon(hero, "sword", SWORD)
+    hero['inventory'] = ["rock"] * inventory_system.MAX_INVENTORY_SIZE
+    with pytest.raises(InventoryFullError):
+        inventory_system.unequip_weapon(hero)
+    assert hero['strength'] == 20
+    assert hero['equipped_weapon'] == "sword"
+
+def test_swap_with_full_inventory(hero):
+    """Test that swapping weapons works even when the inventory is full"""
+    inventory_system.equip_weapon(hero, "sword", SWORD)
+    hero['inventory'] = ["axe"] + ["rock"] * (inventory_system.MAX_INVENTORY_SIZE - 1)
+    inventory_system.equip_weapon(hero, "axe", AXE)
+    assert hero['strength'] == 23
+    assert "sword" in hero['inventory']
+
+def test_swap_into_full_stack_keeps_items(hero):
+    """Test that a swap with no room for the old weapon changes nothing"""
+    inventory_system.equip_weapon(hero, "sword", SWORD)
+    hero['inventory'] = Inventory(["sword"] * 2 + ["axe"] * 2, max_slots=2, stack_limit=2)
+    with pytest.raises(InventoryFullError):
+        inventory_system.equip_weapon(hero, "axe", AXE)
+    assert hero['equipped_weapon'] == "sword"
+    assert hero['strength'] == 20
+    assert hero['inventory'].count("sword") == 2
+    assert hero['inventory'].count("axe") == 2
+
+def test_level_up_keeps_bonuses(hero):
+    """Test that leveling up raises base stats under the equipment bonus"""
+    inventory_system.equip_weapon(hero, "sword", SWORD)
+    character_manager.gain_experience(hero, 100)
+    assert hero['strength'] == 22
+    assert equipment.get_base_stats(hero)['strength'] == 17
+    inventory_system.unequip_weapon(hero)
+    assert hero['strength'] == 17
+
+def test_recompute_stats_rebuilds_totals(hero):
+    """Test that recompute_stats repairs totals from base stats and equipment"""
+    inventory_system.equip_weapon(hero, "sword", SWORD)
+    hero['strength'] = 999
+    totals = equipment.recompute_stats(hero, {"strength": 15, "magic": 5, "max_health": 120})
+    assert totals == {"strength": 20, "magic": 5, "max_health": 120}
+
+def test_battle_damage_follows_equipment(hero):
+    """Test that battle damage uses the strength total after equipping"""
+    goblin = create_enemy("goblin")
+    battle = SimpleBattle(hero, goblin)
+    before = battle.calculate_damage(hero, goblin)
+    inventory_system.equip_weapon(hero, "sword", SWORD)
+    assert battle.calculate_damage(hero, goblin) == before + 5
+
+def test_battle_damage_reads_current_strength(hero):
+    """Test that damage follows direct strength changes and temporary attackers"""
+    goblin = create_enemy("goblin")
+    battle = SimpleBattle(hero, goblin)
+    assert [battle.calculate_damage({'strength': s}, goblin) for s in (10, 20, 30)] == [8, 18, 28]
+    hero['strength'] = 30
+    assert battle.calculate_damage(hero, goblin) == 28
+
+# ============================================================================
+# CHARACTER AND ENEMY RECORD TESTS
+# ============================================================================
+
+def test_enemy_record_matches_dictionary():
+    """Test that an Enemy record reads like the create_enemy dictionary"""
+    orc = Enemy.create("orc")
+    assert orc == create_enemy("orc")
+    assert orc['strength'] == orc.strength == 12
+    assert orc.get('missing', 7) == 7
+    assert 'xp_reward' in orc and 'missing' not in orc
+    assert not hasattr(orc, "__dict__")
+
+def test_record_int_fields_are_converted():
+    """Test that int fields stay ints when set from strings"""
+    goblin = Enemy.from_dict({**create_enemy("goblin"), 'health': "42"})
+    assert goblin.health == 42
+    goblin['strength'] = "9"
+    assert goblin.strength == 9
+    with pytest.raises(ValueError):
+        goblin['magic'] = "lots"
+
+def test_record_extra_keys():
+    """Test that keys that aren't fields are stored and removable"""
+    goblin = Enemy.create("goblin")
+    goblin['loot_table'] = 3
+    assert goblin['loot_table'] == 3
+    assert len(goblin) == 8
+    del goblin['loot_table']
+    assert 'loot_table' not in goblin
+    with pytest.raises(KeyError):
+        del goblin['health']
+
+def test_character_record_round_trip(tmp_path):
+    """Test that a Character record can be equipped, saved and loaded"""
+    hero = Character.create("RecordHero", "Warrior")
+    assert hero['class'] == hero.character_class == "Warrior"
+    hero['inventory'] = ["sword"]
+    inventory_system.equip_weapon(hero, "sword", SWORD)
+    assert hero.strength == 20
+    character_manager.save_character(hero, str(tmp_path))
+    loaded = character_manager.load_character("RecordHero", str(tmp_path))
+    assert Character.from_dict(loaded).to_dict().items() >= {'strength': 20, 'level': 1}.items()
+
+def test_records_in_battle():
+    """Test that records work in a headless battle"""
+    hero = Character.create("RecordHero", "Warrior")
+    battle = HeadlessBattle(hero, Enemy.create("goblin"))
+    assert battle.start_battle()['winner'] == 'player'
+
+# ============================================================================
+# ENEMY POOL TESTS
+# ============================================================================
+
+def test_pool_spawn_and_get():
+    """Test that pooled enemies read back like create_enemy"""
+    pool = EnemyPool()
+    slots = pool.spawn_many("goblin", 3)
+    orc_slot = pool.spawn(create_enemy("orc"))
+    assert slots == [0, 1, 2] and orc_slot == 3
+    assert len(pool) == 4
+    assert pool.get(orc_slot) == create_enemy("orc")
+
+def test_pool_recycles_slots():
+    """Test that released slots are reused instead of growing the pool"""
+    pool = EnemyPool()
+    pool.spawn_many("goblin", 5)
+    pool.release_many([1, 3])
+    assert len(pool) == 3
+    assert sorted(pool.spawn_many("dragon", 3)) == [1, 3, 5]
+    assert pool.capacity() == 6
+    assert pool.get(3)['name'] == "Dragon"
+    with pytest.raises(InvalidTargetError):
+        pool.release(9)
+
+def test_pool_bulk_damage_and_find_dead():
+    """Test bulk damage against the battle damage formula"""
+    pool = EnemyPool()
+    goblin, orc = pool.spawn("goblin"), pool.spawn("orc")
+    pool.attack_all(20)
+    assert pool.health[goblin] == 50 - (20 - 8 // 4)
+    assert pool.health[orc] == 80 - (20 - 12 // 4)
+    pool.damage_many([goblin], 100)
+    pool.damage(orc, 5)
+    assert pool.find_dead() == [goblin]
+    assert pool.health[orc] == 58
+
+def test_pool_reap_skips_free_slots():
+    """Test that reaping totals rewards once and ignores free slots"""
+    pool = EnemyPool()
+    pool.spawn_many("goblin", 4)
+    pool.release(0)
+    pool.damage_all(1000)
+    reaped = pool.reap()
+    assert sorted(reaped['slots']) == [1, 2, 3]
+    assert reaped['xp'] == 75 and reaped['gold'] == 30
+    assert len(pool) == 0 and pool.find_dead() == []
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,344 @@
+"""
+Test Inventory
+Tests the item catalog, counted inventory, batch transactions and shop
+"""
+
+import pytest
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import threading
+
+import inventory_system
+import character_manager
+import shop as shop_module
+from shop import Shop
+from inventory_system import Inventory
+from item_catalog import ItemCatalog, ItemRecord, ItemType, parse_effect
+from custom_exceptions import (
+    InventoryFullError,
+    ItemNotFoundError,
+    InsufficientResourcesError,
+    InvalidItemTypeError,
+    OutOfStockError
+)
+
+ITEMS = {
+    "potion": {'item_id': "potion", 'name': "Potion", 'type': "consumable",
+               'effect': {"health": 20}, 'cost': 25, 'description': "Heals"},
+    "sword": {'item_id': "sword", 'name': "Sword", 'type': "weapon",
+              'effect': {"strength": 5}, 'cost': 100, 'description': "Sharp"},
+    "mail": {'item_id': "mail", 'name': "Mail", 'type': "armor",
+             'effect': {"max_health": 10}, 'cost': 80, 'description': "Heavy"}
+}
+
+# ============================================================================
+# ITEM CATALOG TESTS
+# ============================================================================
+
+def test_parse_effect_formats():
+    """Test that every stored effect format gives the same tuple"""
+    assert parse_effect("health:20") == ("health", 20)
+    assert parse_effect(" strength : 5 ") == ("strength", 5)
+    assert parse_effect({"magic": 3}) == ("magic", 3)
+    assert parse_effect(("magic", "3")) == ("magic", 3)
+    assert parse_effect(None) is None
+    with pytest.raises(ValueError):
+        parse_effect("health")
+
+def test_item_records():
+    """Test that records hold typed, pre-parsed fields"""
+    catalog = ItemCatalog.from_items(ITEMS)
+    sword = catalog["sword"]
+
+    assert isinstance(sword, ItemRecord)
+    assert sword.type is ItemType.WEAPON and sword['type'] == "weapon"
+    assert sword.effect == ("strength", 5)
+    assert sword.get('cost') == 100 and sword.get('color') is None
+    assert sword.to_dict() == ITEMS['sword']
+    assert [record.item_id for record in catalog.of_type("armor")] == ["mail"]
+    with pytest.raises(ItemNotFoundError):
+        catalog["shield"]
+
+def test_item_type_displays_as_text(capsys):
+    """Test that catalog item types print as plain text, not enum names"""
+    catalog = ItemCatalog.from_items(ITEMS)
+    assert f"{catalog['sword']['type']}" == "weapon"
+    assert str(ItemType.ARMOR) == "armor" and f"{ItemType.ARMOR:>6}" == " armor"
+
+    inventory_system.display_inventory({'inventory': ["sword"]}, catalog)
+    assert "Sword (weapon) x1" in capsys.readouterr().out
+
+def test_unknown_item_type():
+    """Test that an unknown item type is rejected"""
+    with pytest.raises(InvalidItemTypeError):
+        ItemRecord.from_dict({'item_id': "rock", 'type': "junk", 'cost': 1})
+
+def test_catalog_loads_item_file():
+    """Test that the shipped items file loads into records"""
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    catalog = ItemCatalog.load(os.path.join(root, "data", "items.txt"))
+
+    assert len(catalog) > 0
+    assert all(isinstance(record.cost, int) for record in catalog)
+
+def test_inventory_functions_accept_records():
+    """Test use, equip, purchase and sell with records and dictionaries"""
+    catalog = ItemCatalog.from_items(ITEMS)
+    char = character_manager.create_character("Hero", "Warrior")
+    char['health'] = 50
+
+    inventory_system.purchase_item(char, "potion", catalog["potion"])
+    inventory_system.use_item(char, "potion", catalog["potion"])
+    assert char['health'] == 70 and char['gold'] == 75
+
+    char['inventory'].append("sword")
+    inventory_system.equip_weapon(char, "sword", catalog["sword"])
+    assert char['strength'] == 20
+
+    char['inventory'].append("mail")
+    inventory_system.equip_armor(char, "mail", catalog["mail"])
+    assert char['max_health'] == 130
+
+    char['inventory'].append("potion")
+    assert inventory_system.sell_item(char, "potion", catalog["potion"]) == 12
+
+    # load_items dictionaries (effect stored as {stat: value}) work too
+    char['inventory'].append("potion")
+    inventory_system.use_item(char, "potion", ITEMS['potion'])
+    assert char['health'] == 90
+
+# ============================================================================
+# COUNTED INVENTORY TESTS
+# ============================================================================
+
+def test_inventory_counts_and_slots():
+    """Test counting, stacking and the slot budget"""
+    inventory = Inventory(max_slots=3, stack_limit=5, stack_limits={"sword": 1})
+    inventory.add("potion", 7)
+    inventory.add("sword")
+
+    assert len(inventory) == 8
+    assert inventory.count("potion") == 7 and inventory.has("sword")
+    assert inventory.slots_used == 3 and inventory.free_slots() == 0
+    assert inventory.can_add("potion", 3) and not inventory.can_add("potion", 4)
+    with pytest.raises(InventoryFullError):
+        inventory.add("sword")
+
+    inventory.remove("potion", 2)
+    assert inventory.slots_used == 2
+    with pytest.raises(ItemNotFoundError):
+        inventory.remove("sword", 2)
+
+def test_default_inventory_matches_list_limit():
+    """Test that the default budget is the same as MAX_INVENTORY_SIZE items"""
+    inventory = Inventory(["potion"] * inventory_system.MAX_INVENTORY_SIZE)
+
+    with pytest.raises(InventoryFullError):
+        inventory.add("potion")
+    assert inventory.free_slots() == 0
+
+def test_inventory_save_line_round_trip(tmp_path):
+    """Test that an Inventory saves the same INVENTORY line as a list"""
+    items = ["potion", "sword", "potion"]
+    inventory = Inventory.from_line(",".join(items))
+    assert sorted(inventory.to_line().split(",")) == sorted(items)
+    assert inventory == items and Inventory.from_line("") == []
+
+    char = character_manager.create_character("Hero", "Mage")
+    inventory_system.use_counted_inventory(char)
+    for item_id in items:
+        inventory_system.add_item_to_inventory(char, item_id)
+    character_manager.save_character(char, str(tmp_path))
+    loaded = character_manager.load_character("Hero", str(tmp_path))
+
+    assert loaded['inventory'] == char['inventory']
+    assert Inventory(loaded['inventory']) == char['inventory']
+
+@pytest.mark.parametrize("save_format", ["text", "binary"])
+def test_counted_inventory_validates_and_saves(tmp_path, save_format):
+    """Test that a character with an Inventory passes validation and round-trips"""
+    char = character_manager.create_character("Hero", "Cleric")
+    inventory_system.use_counted_inventory(char, stack_limit=5)
+    for item_id in ["potion", "potion", "sword"]:
+        inventory_system.add_item_to_inventory(char, item_id)
+
+    assert character_manager.validate_character_data(char)
+    character_manager.save_character(char, str(tmp_path), save_format)
+    loaded = character_manager.load_character("Hero", str(tmp_path))
+    assert character_manager.validate_character_data(loaded)
+    assert Inventory(loaded['inventory']) == char['inventory']
+
+def test_inventory_functions_with_counted_inventory():
+    """Test the inventory_system functions on an Inventory"""
+    catalog = ItemCatalog.from_items(ITEMS)
+    char = character_manager.create_character("Hero", "Warrior")
+    inventory = inventory_system.use_counted_inventory(char, stack_limit=10)
+
+    inventory_system.purchase_item(char, "potion", catalog["potion"])
+    inventory_system.add_item_to_inventory(char, "potion")
+    inventory_system.add_item_to_inventory(char, "sword")
+    assert inventory_system.count_item(char, "potion") == 2
+    assert inventory_system.get_inventory_space_remaining(char) == 18
+
+    inventory_system.equip_weapon(char, "sword", catalog["sword"])
+    assert not inventory_system.has_item(char, "sword")
+    inventory_system.remove_item_from_inventory(char, "potion")
+    assert inventory_system.clear_inventory(char) == ["potion"]
+    assert len(inventory) == 0
+
+# ============================================================================
+# BATCH TRANSACTION TESTS
+# ============================================================================
+
+@pytest.fixture(params=["list", "counted"])
+def shopper(request):
+    """A character with a list inventory or a counted Inventory"""
+    char = character_manager.create_character("Shopper", "Rogue")
+    char['gold'] = 300
+    if request.param == "counted":
+        inventory_system.use_counted_inventory(char, stack_limit=5)
+    return char
+
+def test_purchase_items_batch(shopper):
+    """Test that a batch purchase charges the total cost once"""
+    summary = inventory_system.purchase_items(shopper, ["potion", "potion", "sword"], ITEMS)
+
+    assert summary == {'purchased': 3, 'total_cost': 150, 'gold_remaining': 150}
+    assert inventory_system.count_item(shopper, "potion") == 2
+    assert shopper['gold'] == 150
+
+def test_purchase_items_all_or_nothing(shopper):
+    """Test that a failing batch purchase changes nothing"""
+    catalog = ItemCatalog.from_items(ITEMS)
+    inventory_system.add_item_to_inventory(shopper, "mail")
+
+    with pytest.raises(InsufficientResourcesError):
+        inventory_system.purchase_items(shopper, ["sword"] * 4, catalog)
+    with pytest.raises(ItemNotFoundError):
+        inventory_system.purchase_items(shopper, ["potion", "shield"], catalog)
+    with pytest.raises(InventoryFullError):
+        inventory_system.purchase_items(shopper, ["potion"] * 200, {"potion": {'cost': 0}})
+
+    assert shopper['gold'] == 300
+    assert list(shopper['inventory']) == ["mail"]
+
+def test_add_items_batch(shopper):
+    """Test that add_items adds everything or raises without adding"""
+    summary = inventory_system.add_items(shopper, ["potion", "mail"])
+    assert summary['added'] == 2
+
+    with pytest.raises(InventoryFullError):
+        inventory_system.add_items(shopper, ["sword"] * 200)
+    assert len(shopper['inventory']) == 2
+
+def test_sell_items_batch(shopper):
+    """Test that a batch sale pays half the total cost, or sells nothing"""
+    inventory_system.add_items(shopper, ["potion", "sword", "potion"])
+
+    with pytest.raises(ItemNotFoundError):
+        inventory_system.sell_items(shopper, ["potion", "potion", "potion"], ITEMS)
+    assert shopper['gold'] == 300 and len(shopper['inventory']) == 3
+
+    summary = inventory_system.sell_items(shopper, ["potion", "sword"], ITEMS)
+    assert summary == {'sold': 2, 'gold_received': 62, 'gold': 362}
+    assert list(shopper['inventory']) == ["potion"]
+
+def test_inventory_transaction_rolls_back(shopper):
+    """Test that an error inside a transaction restores inventory and gold"""
+    inventory_system.add_items(shopper, ["potion"])
+    inventory = shopper['inventory']
+
+    with pytest.raises(RuntimeError):
+        with inventory_system.inventory_transaction(shopper):
+            inventory.append("sword")
+            shopper['gold'] = 0
+            raise RuntimeError
+
+    assert shopper['inventory'] is inventory
+    assert list(inventory) == ["potion"] and shopper['gold'] == 300
+    assert len(inventory) == 1
+
+# ============================================================================
+# SHOP TESTS
+# ============================================================================
+
+def test_shop_browse_by_price_type_and_budget():
+    """Test that browsing is sorted by price and filtered by type and budget"""
+    for items in (ITEMS, ItemCatalog.from_items(ITEMS)):
+        shop = Shop(items)
+
+        assert [item['item_id'] for item in shop.browse()] == ["potion", "mail", "sword"]
+        assert [item['item_id'] for item in shop.browse(max_cost=80)] == ["potion", "mail"]
+        assert [item['item_id'] for item in shop.browse("weapon")] == ["sword"]
+        assert [item['item_id'] for item in shop.browse(ItemType.ARMOR, 50)] == []
+        assert shop.affordable({'gold': 30}) == [items["potion"]]
+
+def test_shop_stock():
+    """Test that limited stock runs out and refills when items are sold back"""
+    shop = Shop(ITEMS, stock={"sword": 1})
+    char = character_manager.create_character("StockTest", "Warrior")
+    char['gold'] = 1000
+
+    shop.purchase(char, "sword")
+    assert shop.stock_left("sword") == 0
+    assert "sword" not in [item['item_id'] for item in shop.browse()]
+    with pytest.raises(OutOfStockError):
+        shop.purchase(char, "sword")
+
+    assert shop.sell(char, "sword") == 50
+    assert shop.stock_left("sword") == 1
+    assert shop.stock_left("potion") is None
+
+def test_shop_failed_purchase_keeps_stock():
+    """Test that a purchase the character can't afford doesn't use stock"""
+    shop = Shop(ITEMS, stock={"sword": 1})
+    char = {'name': "PoorTest", 'gold': 10, 'inventory': []}
+
+    with pytest.raises(InsufficientResourcesError):
+        shop.purchase(char, "sword")
+    with pytest.raises(ItemNotFoundError):
+        shop.purchase(char, "shield")
+    assert shop.stock_left("sword") == 1
+
+def test_shop_concurrent_purchases():
+    """Test that threads buying for one character never lose gold or items"""
+    shop = Shop(ITEMS, stock={"potion": 500})
+    char = {'name': "ThreadTest", 'gold': 25 * 300, 'inventory': []}
+    inventory_system.use_counted_inventory(char, stack_limit=1000)
+    bought = []
+
+    def buyer():
+        for _ in range(100):
+            try:
+                shop.purchase(char, "potion")
+                bought.append(1)
+            except InsufficientResourcesError:
+                pass
+
+    threads = [threading.Thread(target=buyer) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(bought) == 300
+    assert char['gold'] == 0
+    assert inventory_system.count_item(char, "potion") == 300
+    assert shop.stock_left("potion") == 200
+
+def test_shop_character_locks_are_released():
+    """Test that per-character locks don't pile up after purchases finish"""
+    shop = Shop(ITEMS)
+    before = len(shop_module.CHARACTER_LOCKS)
+    for i in range(50):
+        shop.purchase({'name': f"Visitor{i}", 'gold': 100, 'inventory': []}, "potion")
+
+    assert len(shop_module.CHARACTER_LOCKS) == before
+    char = {'name': "Holder", 'gold': 100, 'inventory': []}
+    assert shop_module.get_character_lock(char) is shop_module.get_character_lock(dict(char))
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
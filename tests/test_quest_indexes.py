@@ -0,0 +1,348 @@
+"""
+Test Quest Indexes
+Tests the quest graph, prerequisite engine and quest catalog indexes
+"""
+
+import pytest
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import copy
+import pickle
+
+import quest_handler
+import character_manager
+from character_manager import QuestList
+from quest_graph import QuestGraph
+from quest_catalog import QuestCatalog
+from custom_exceptions import QuestNotFoundError, QuestPrerequisiteCycleError
+
+def make_quest(quest_id, level=1, prerequisite="NONE", xp=50, gold=25):
+    """Build a quest dictionary in load_quests format"""
+    return {
+        'quest_id': quest_id,
+        'title': quest_id.title(),
+        'description': f"Quest {quest_id}",
+        'reward_xp': xp,
+        'reward_gold': gold,
+        'required_level': level,
+        'prerequisite': prerequisite
+    }
+
+def make_catalog():
+    """A small catalog with chains, branches and level gates"""
+    quests = [
+        make_quest("a", 1),
+        make_quest("b", 2, "a", xp=250),
+        make_quest("c", 1, "a"),
+        make_quest("d", 3, "b"),
+        make_quest("e", 5),
+        make_quest("f", 1, "missing")
+    ]
+    return {quest['quest_id']: quest for quest in quests}
+
+def available_ids(character, quests):
+    """Quest IDs from the full-scan quest_handler implementation"""
+    return [quest['quest_id'] for quest in quest_handler.get_available_quests(character, quests)]
+
+# ============================================================================
+# QUEST GRAPH TESTS
+# ============================================================================
+
+def test_graph_indexes_links():
+    """Test prerequisite, unlocks and root indexes"""
+    graph = QuestGraph(make_catalog())
+
+    assert graph.prerequisite['d'] == "b"
+    assert graph.unlocks['a'] == ["b", "c"]
+    assert graph.roots == ["a", "e"]
+    assert len(graph) == 6
+
+def test_availability_matches_full_scan():
+    """Test that incremental availability matches get_available_quests"""
+    quests = make_catalog()
+    graph = QuestGraph(quests)
+    hero = character_manager.create_character("Hero", "Warrior")
+    availability = graph.tracker(hero)
+    assert availability.quest_ids() == available_ids(hero, quests) == ["a"]
+
+    for quest_id in ["a", "c", "b"]:
+        quest_handler.accept_quest(hero, quest_id, quests)
+        availability.quest_accepted(quest_id)
+        assert availability.quest_ids() == available_ids(hero, quests)
+
+        quest_handler.complete_quest(hero, quest_id, quests)
+        availability.quest_completed(quest_id)
+        assert availability.quest_ids() == available_ids(hero, quests)
+
+    assert hero['level'] == 3
+    assert availability.quest_ids() == ["d"]
+
+def test_availability_level_up():
+    """Test that quests waiting on a level appear after leveling up"""
+    quests = make_catalog()
+    hero = {'level': 1, 'active_quests': [], 'completed_quests': ['a']}
+    availability = QuestGraph(quests).tracker(hero)
+    assert "b" not in availability
+
+    hero['level'] = 5
+    availability.level_changed()
+    assert availability.quest_ids() == available_ids(hero, quests) == ["b", "c", "e"]
+
+def test_availability_abandon_restores_quest():
+    """Test that an abandoned quest becomes available again"""
+    quests = make_catalog()
+    hero = {'level': 1, 'active_quests': [], 'completed_quests': []}
+    availability = QuestGraph(quests).tracker(hero)
+
+    quest_handler.accept_quest(hero, "a", quests)
+    availability.quest_accepted("a")
+    assert "a" not in availability
+
+    quest_handler.abandon_quest(hero, "a")
+    availability.quest_abandoned("a")
+    assert "a" in availability
+
+# ============================================================================
+# PREREQUISITE ENGINE TESTS
+# ============================================================================
+
+def test_topological_order_and_depth():
+    """Test that every quest comes after its prerequisite"""
+    graph = QuestGraph(make_catalog())
+    order = graph.resolve()
+
+    assert sorted(order) == sorted(graph.order)
+    position = {quest_id: index for index, quest_id in enumerate(order)}
+    assert position['a'] < position['b'] < position['d']
+    assert graph.depth == {'a': 0, 'b': 1, 'c': 1, 'd': 2, 'e': 0, 'f': 0}
+
+def test_prerequisite_chain():
+    """Test chains with and without a graph"""
+    quests = make_catalog()
+    graph = QuestGraph(quests)
+
+    assert quest_handler.get_quest_prerequisite_chain("d", quests) == ["a", "b", "d"]
+    assert quest_handler.get_quest_prerequisite_chain("d", quests, graph) == ["a", "b", "d"]
+    assert quest_handler.get_quest_prerequisite_chain("a", quests) == ["a"]
+    assert graph.prerequisite_chain("d") is graph.prerequisite_chain("d")
+
+def test_prerequisite_chain_missing_quest():
+    """Test that unknown quests and dangling prerequisites raise"""
+    quests = make_catalog()
+    graph = QuestGraph(quests)
+
+    with pytest.raises(QuestNotFoundError):
+        quest_handler.get_quest_prerequisite_chain("nope", quests)
+    with pytest.raises(QuestNotFoundError):
+        quest_handler.get_quest_prerequisite_chain("f", quests)
+    with pytest.raises(QuestNotFoundError):
+        graph.prerequisite_chain("f")
+
+def test_cycle_detection_reports_path():
+    """Test that prerequisite loops are reported with the looping path"""
+    quests = make_catalog()
+    quests['a']['prerequisite'] = "d"
+
+    with pytest.raises(QuestPrerequisiteCycleError) as error:
+        QuestGraph(quests).resolve()
+    assert error.value.path == ["a", "d", "b", "a"]
+
+    with pytest.raises(QuestPrerequisiteCycleError) as error:
+        quest_handler.get_quest_prerequisite_chain("d", quests)
+    assert error.value.path == ["d", "b", "a", "d"]
+
+def test_validate_quest_prerequisites():
+    """Test validation of missing and looping prerequisites"""
+    quests = make_catalog()
+    with pytest.raises(QuestNotFoundError):
+        quest_handler.validate_quest_prerequisites(quests)
+
+    del quests['f']
+    assert quest_handler.validate_quest_prerequisites(quests)
+
+    quests['e']['prerequisite'] = "e"
+    with pytest.raises(QuestPrerequisiteCycleError):
+        quest_handler.validate_quest_prerequisites(quests)
+
+# ============================================================================
+# QUEST STATE TESTS
+# ============================================================================
+
+def test_quest_list_membership_follows_changes():
+    """Test that membership stays right through every list operation"""
+    quests = QuestList(["a", "b", "a"])
+    assert "a" in quests and "c" not in quests
+
+    quests.remove("a")
+    assert "a" in quests
+    quests.remove("a")
+    assert "a" not in quests
+
+    quests.extend(["c", "d"])
+    quests.insert(0, "e")
+    assert quests.pop() == "d"
+    assert "d" not in quests
+    quests[0] = "f"
+    assert "e" not in quests and "f" in quests
+    del quests[:]
+    assert "b" not in quests and quests == []
+
+def test_quest_list_is_a_list():
+    """Test that a QuestList behaves like the list it replaces"""
+    quests = QuestList(["a", "b"])
+
+    assert isinstance(quests, list)
+    assert quests == ["a", "b"]
+    assert ",".join(quests) == "a,b"
+    for duplicate in (quests.copy(), copy.deepcopy(quests), pickle.loads(pickle.dumps(quests))):
+        assert isinstance(duplicate, QuestList)
+        assert duplicate == quests and "b" in duplicate
+
+@pytest.mark.parametrize("save_format", [character_manager.SAVE_FORMAT_TEXT,
+                                         character_manager.SAVE_FORMAT_BINARY])
+def test_quest_lists_survive_save_and_load(tmp_path, save_format):
+    """Test that loaded characters get QuestLists with the same contents"""
+    hero = character_manager.create_character("Hero", "Mage")
+    assert isinstance(hero['active_quests'], QuestList)
+    hero['active_quests'].append("b")
+    hero['completed_quests'].extend(["a", "c"])
+
+    character_manager.save_character(hero, str(tmp_path), save_format)
+    loaded = character_manager.load_character("Hero", str(tmp_path))
+
+    assert isinstance(loaded['completed_quests'], QuestList)
+    assert loaded['active_quests'] == ["b"]
+    assert loaded['completed_quests'] == ["a", "c"]
+    assert character_manager.validate_character_data(loaded)
+
+def test_quest_handler_with_quest_lists():
+    """Test accepting and completing quests with QuestList state"""
+    quests = make_catalog()
+    hero = character_manager.create_character("Hero", "Rogue")
+
+    quest_handler.accept_quest(hero, "a", quests)
+    assert quest_handler.is_quest_active(hero, "a")
+    quest_handler.complete_quest(hero, "a", quests)
+
+    assert quest_handler.is_quest_completed(hero, "a")
+    assert not quest_handler.is_quest_active(hero, "a")
+    assert available_ids(hero, quests) == ["c"]
+
+# ============================================================================
+# QUEST REWARD TOTALS TESTS
+# ============================================================================
+
+def test_reward_totals_update_on_completion():
+    """Test that completing quests adds to the running totals"""
+    quests = make_catalog()
+    hero = character_manager.create_character("Hero", "Warrior")
+
+    for quest_id in ["a", "c"]:
+        quest_handler.accept_quest(hero, quest_id, quests)
+        totals = quest_handler.complete_quest(hero, quest_id, quests)
+
+    assert totals == {'total_xp': 100, 'total_gold': 50}
+    assert hero['quest_xp_earned'] == 100
+    assert quest_handler.audit_quest_rewards(hero, quests)['consistent']
+
+def test_reward_totals_recomputed_when_missing():
+    """Test that a character without totals gets them from completed quests"""
+    quests = make_catalog()
+    hero = {'level': 1, 'health': 100, 'experience': 0, 'gold': 0,
+            'max_health': 100, 'strength': 10, 'magic': 10,
+            'active_quests': ["c"], 'completed_quests': ["a"]}
+
+    totals = quest_handler.complete_quest(hero, "c", quests)
+
+    assert totals == {'total_xp': 100, 'total_gold': 50}
+    assert hero['quest_gold_earned'] == 50
+
+def test_reward_audit_repairs_totals():
+    """Test that the audit reports and repairs drifted totals"""
+    quests = make_catalog()
+    hero = character_manager.create_character("Hero", "Cleric")
+    hero['completed_quests'].append("b")
+
+    audit = quest_handler.audit_quest_rewards(hero, quests, repair=True)
+
+    assert not audit['consistent']
+    assert audit['recorded'] == {'total_xp': 0, 'total_gold': 0}
+    assert audit['expected'] == {'total_xp': 250, 'total_gold': 25}
+    assert hero['quest_xp_earned'] == 250
+    assert quest_handler.audit_quest_rewards(hero, quests)['consistent']
+
+@pytest.mark.parametrize("save_format", [character_manager.SAVE_FORMAT_TEXT,
+                                         character_manager.SAVE_FORMAT_BINARY])
+def test_reward_totals_saved(tmp_path, save_format):
+    """Test that the running totals survive save and load"""
+    hero = character_manager.create_character("Hero", "Rogue")
+    hero['quest_xp_earned'] = 1234
+    hero['quest_gold_earned'] = 567
+
+    character_manager.save_character(hero, str(tmp_path), save_format)
+    loaded = character_manager.load_character("Hero", str(tmp_path))
+
+    assert loaded['quest_xp_earned'] == 1234
+    assert loaded['quest_gold_earned'] == 567
+
+def test_text_save_without_totals_loads(tmp_path):
+    """Test that text saves written before the totals existed still load"""
+    hero = character_manager.create_character("Hero", "Mage")
+    del hero['quest_xp_earned'], hero['quest_gold_earned']
+
+    character_manager.save_character(hero, str(tmp_path))
+    loaded = character_manager.load_character("Hero", str(tmp_path))
+
+    assert loaded == hero
+    assert character_manager.validate_character_data(loaded)
+
+# ============================================================================
+# QUEST CATALOG TESTS
+# ============================================================================
+
+def test_catalog_by_level_matches_handler():
+    """Test that the level index gives the same quests as the full scan"""
+    quests = make_catalog()
+    catalog = QuestCatalog(quests)
+
+    for low, high in [(1, 1), (2, 3), (0, 10), (4, 4), (6, 9)]:
+        expected = quest_handler.get_quests_by_level(quests, low, high)
+        assert catalog.by_level(low, high) == expected
+        assert quest_handler.get_quests_by_level(quests, low, high, catalog) == expected
+
+def test_catalog_uppercase_keys():
+    """Test that quests with uppercase keys are indexed too"""
+    quests = {"old": {'quest_id': "old", 'REQUIRED_LEVEL': 4, 'REWARD_XP': 10}}
+    catalog = QuestCatalog(quests)
+
+    assert catalog.by_level(3, 5) == [quests['old']]
+    assert catalog.range_ids("reward_gold") == []
+
+def test_catalog_ranges_and_top():
+    """Test range lookups and top-k by reward"""
+    catalog = QuestCatalog(make_catalog())
+
+    assert catalog.range_ids("reward_xp", 100) == ["b"]
+    assert [quest['quest_id'] for quest in catalog.in_range("required_level", 2, 5)] == ["b", "d", "e"]
+    assert [quest['quest_id'] for quest in catalog.top("reward_xp", 2)] == ["b", "f"]
+    assert catalog.top("reward_gold", 0) == []
+    with pytest.raises(ValueError):
+        catalog.range_ids("title")
+
+def test_catalog_combined_query():
+    """Test combined filters, ordering and limits"""
+    quests = make_catalog()
+    quests['c']['reward_gold'] = 80
+    catalog = QuestCatalog(quests)
+
+    result = catalog.query(max_level=2, min_gold=25, order_by="reward_gold", descending=True)
+    assert [quest['quest_id'] for quest in result] == ["c", "a", "b", "f"]
+    result = catalog.query(min_level=1, max_level=3, max_xp=50, limit=2)
+    assert [quest['quest_id'] for quest in result] == ["a", "c"]
+    assert len(catalog.query()) == len(quests)
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,323 @@
+"""
+Test Save Formats
+Tests saving and loading characters in every supported save format
+"""
+
+import pytest
+import sys
+import os
+import struct
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import character_manager
+import save_store
+import character_cache
+from custom_exceptions import (
+    SaveFileCorruptedError,
+    CharacterNotFoundError,
+    InvalidSaveDataError
+)
+
+# ============================================================================
+# BINARY FORMAT TESTS
+# ============================================================================
+
+def test_binary_save_round_trip(tmp_path):
+    """Test that binary saves load back with real ints and lists"""
+    char = character_manager.create_character("BinaryTest", "Mage")
+    char['inventory'] = ["health_potion"]
+    char['completed_quests'] = [f"quest_{i}" for i in range(300)]
+
+    result = character_manager.save_character(char, str(tmp_path), "binary")
+    loaded = character_manager.load_character("BinaryTest", str(tmp_path))
+
+    assert result == True
+    assert loaded == char
+    assert character_manager.validate_character_data(loaded) == True
+
+def test_load_detects_format(tmp_path):
+    """Test that load_character reads both text and binary saves"""
+    char = character_manager.create_character("DetectTest", "Rogue")
+
+    character_manager.save_character(char, str(tmp_path), "text")
+    assert character_manager.load_character("DetectTest", str(tmp_path)) == char
+
+    character_manager.save_character(char, str(tmp_path), "binary")
+    assert character_manager.load_character("DetectTest", str(tmp_path)) == char
+    assert character_manager.list_saved_characters(str(tmp_path)) == ["DetectTest"]
+
+def test_truncated_binary_save(tmp_path):
+    """Test that a cut-off binary save raises SaveFileCorruptedError"""
+    char = character_manager.create_character("TruncatedTest", "Cleric")
+    character_manager.save_character(char, str(tmp_path), "binary")
+    path = character_manager.get_save_path("TruncatedTest", str(tmp_path))
+    with open(path, "rb") as file:
+        data = file.read()
+    with open(path, "wb") as file:
+        file.write(data[:20])
+
+    with pytest.raises(SaveFileCorruptedError):
+        character_manager.load_character("TruncatedTest", str(tmp_path))
+
+def fixed_width_save(char, version):
+    """Build a version 1 or 2 (fixed-width) binary save for char"""
+    def table(strings):
+        blob = "\0".join(strings).encode("utf-8")
+        return struct.pack("<II", len(strings), len(blob)) + blob
+    data = struct.pack("<4sB", b"QCSV", version)
+    data += struct.pack("<7q", *[char[field] for field in character_manager.BINARY_STAT_FIELDS])
+    data += table([char['name']]) + table([char['class']])
+    for field in character_manager.BINARY_TABLE_FIELDS:
+        data += table(list(char[field]))
+    if version == 2:
+        data += struct.pack("<2q", 40, -1)
+    return data
+
+def test_version_1_binary_save_still_loads():
+    """Test that binary saves without the optional fields still load"""
+    char = character_manager.create_character("OldBinary", "Mage")
+    char['completed_quests'] = ["quest_1", "quest_2"]
+
+    loaded = character_manager.decode_character_binary(fixed_width_save(char, 1))
+
+    assert 'quest_xp_earned' not in loaded
+    assert loaded['completed_quests'] == ["quest_1", "quest_2"]
+    assert loaded['gold'] == char['gold']
+    assert character_manager.validate_character_data(loaded) == True
+
+def test_version_2_binary_save_still_loads():
+    """Test that fixed-width saves with optional fields still load"""
+    char = character_manager.create_character("OldBinary", "Rogue")
+
+    loaded = character_manager.decode_character_binary(fixed_width_save(char, 2))
+
+    assert loaded['quest_xp_earned'] == 40
+    assert 'quest_gold_earned' not in loaded
+    assert loaded['gold'] == char['gold']
+
+def test_binary_save_is_compact():
+    """Test that binary saves are smaller than text and round-trip big and negative numbers"""
+    char = character_manager.create_character("CompactTest", "Warrior")
+    char['completed_quests'] = [f"completed_quest_{i:05d}" for i in range(500)]
+    char['gold'] = 10 ** 12
+    char['experience'] = -5
+    char['quest_gold_earned'] = 300
+
+    data = character_manager.encode_character_binary(char)
+
+    assert len(data) * 5 < len(character_manager.encode_character_text(char))
+    assert character_manager.decode_character_binary(data) == char
+    with pytest.raises(SaveFileCorruptedError):
+        character_manager.decode_character_binary(data[:-10])
+
+def test_unknown_save_format(tmp_path):
+    """Test that an unknown save format is rejected"""
+    char = character_manager.create_character("FormatTest", "Warrior")
+
+    with pytest.raises(ValueError):
+        character_manager.save_character(char, str(tmp_path), "xml")
+
+# ============================================================================
+# TYPED TEXT LOADING TESTS
+# ============================================================================
+
+def test_text_save_loads_typed_values(tmp_path):
+    """Test that text saves load with ints and lists that pass validation"""
+    char = character_manager.create_character("TypedTest", "Warrior")
+    char['inventory'] = ["health_potion"]
+    character_manager.save_character(char, str(tmp_path))
+
+    loaded = character_manager.load_character("TypedTest", str(tmp_path))
+
+    assert loaded == char
+    assert loaded['inventory'] == ["health_potion"]
+    assert loaded['active_quests'] == []
+    assert character_manager.validate_character_data(loaded) == True
+
+def test_hand_edited_text_save():
+    """Test that saves not in the exact written layout still parse"""
+    text = ("name:Edited\r\nclass: Mage \r\nLEVEL:  3\r\nHEALTH: 80\r\n"
+            "MAX_HEALTH: 80\r\nSTRENGTH: 8\r\nMAGIC: 20\r\nEXPERIENCE: 0\r\n"
+            "GOLD: 5\r\nINVENTORY: a,b\r\nACTIVE_QUESTS:\r\nCOMPLETED_QUESTS: q1\r\n")
+
+    loaded = character_manager.decode_character_text(text)
+
+    assert loaded['name'] == "Edited"
+    assert loaded['level'] == 3
+    assert loaded['inventory'] == ["a", "b"]
+    assert loaded['completed_quests'] == ["q1"]
+    assert character_manager.validate_character_data(loaded) == True
+
+def test_text_save_bad_number():
+    """Test that a non-numeric stat raises InvalidSaveDataError"""
+    text = character_manager.encode_character_text(
+        character_manager.create_character("BadTest", "Rogue")
+    ).replace("GOLD: 100", "GOLD: lots")
+
+    with pytest.raises(InvalidSaveDataError):
+        character_manager.decode_character_text(text)
+
+# ============================================================================
+# ATOMIC AND BATCHED SAVE TESTS
+# ============================================================================
+
+def test_save_leaves_no_temp_files(tmp_path):
+    """Test that atomic saves clean up their temporary files"""
+    char = character_manager.create_character("AtomicTest", "Warrior")
+    character_manager.save_character(char, str(tmp_path))
+    char['gold'] = 500
+    character_manager.save_character(char, str(tmp_path))
+
+    assert os.listdir(tmp_path) == ["AtomicTest_save.txt"]
+    assert character_manager.load_character("AtomicTest", str(tmp_path))['gold'] == 500
+
+def test_failed_save_keeps_old_save(tmp_path):
+    """Test that a save that fails mid-way leaves the previous save intact"""
+    char = character_manager.create_character("SafeTest", "Mage")
+    character_manager.save_character(char, str(tmp_path))
+
+    broken = dict(char)
+    del broken['gold']
+    with pytest.raises(KeyError):
+        character_manager.save_character(broken, str(tmp_path))
+
+    assert character_manager.load_character("SafeTest", str(tmp_path))['gold'] == 100
+
+def test_failed_rename_leaves_no_temp_file(tmp_path):
+    """Test that a save that can't replace its target cleans up its temp file"""
+    char = character_manager.create_character("Blocked", "Mage")
+    os.mkdir(character_manager.get_save_path("Blocked", str(tmp_path)))
+
+    with pytest.raises(OSError):
+        character_manager.save_character(char, str(tmp_path))
+
+    assert os.listdir(tmp_path) == ["Blocked_save.txt"]
+
+def test_save_many(tmp_path):
+    """Test saving a batch of characters at once"""
+    chars = [character_manager.create_character(f"Batch{i}", "Cleric") for i in range(50)]
+
+    assert character_manager.save_many(chars, str(tmp_path), "binary") == 50
+    assert len(character_manager.list_saved_characters(str(tmp_path))) == 50
+    assert character_manager.load_character("Batch7", str(tmp_path)) == chars[7]
+
+def test_save_many_failure_writes_nothing(tmp_path):
+    """Test that a bad character in a batch leaves no partial saves behind"""
+    chars = [character_manager.create_character(f"Batch{i}", "Rogue") for i in range(3)]
+    chars.append({'name': "Broken"})
+
+    with pytest.raises(KeyError):
+        character_manager.save_many(chars, str(tmp_path))
+
+    assert os.listdir(tmp_path) == []
+
+# ============================================================================
+# SAVE STORE TESTS
+# ============================================================================
+
+def test_save_store_round_trip(tmp_path):
+    """Test saving, loading and deleting through the single-file store"""
+    with save_store.SaveStore(str(tmp_path / "saves.db")) as store:
+        char = character_manager.create_character("StoreTest", "Warrior")
+        assert store.save_character(char) == True
+        assert store.load_character("StoreTest") == char
+
+        assert store.delete_character("StoreTest") == True
+        with pytest.raises(CharacterNotFoundError):
+            store.load_character("StoreTest")
+        with pytest.raises(CharacterNotFoundError):
+            store.delete_character("StoreTest")
+
+def test_save_store_pagination(tmp_path):
+    """Test listing saved characters one page at a time"""
+    with save_store.SaveStore(str(tmp_path / "saves.db")) as store:
+        store.save_many([character_manager.create_character(f"Hero{i:02d}", "Mage")
+                         for i in range(25)])
+
+        assert store.count_characters() == 25
+        assert store.list_saved_characters(0, 10)[0] == "Hero00"
+        assert store.list_saved_characters(20, 10) == [f"Hero{i}" for i in range(20, 25)]
+        assert len(store.list_saved_characters()) == 25
+
+def test_import_save_directory(tmp_path):
+    """Test migrating a directory of text saves into the store"""
+    char = character_manager.create_character("MigrateTest", "Rogue")
+    char['inventory'] = ["iron_sword"]
+    character_manager.save_character(char, str(tmp_path))
+
+    with save_store.SaveStore(str(tmp_path / "saves.db")) as store:
+        result = save_store.import_save_directory(store, str(tmp_path))
+        loaded = store.load_character("MigrateTest")
+
+    assert result == {'imported': ["MigrateTest"], 'failed': []}
+    assert loaded['inventory'] == ["iron_sword"]
+    assert loaded['level'] == 1
+
+# ============================================================================
+# CHARACTER CACHE TESTS
+# ============================================================================
+
+def test_cache_hits_and_evictions(tmp_path):
+    """Test LRU hits, misses and evictions"""
+    chars = [character_manager.create_character(f"Cached{i}", "Warrior") for i in range(3)]
+    character_manager.save_many(chars, str(tmp_path))
+    cache = character_cache.CharacterCache(capacity=2, save_directory=str(tmp_path))
+
+    first = cache.load("Cached0")
+    assert cache.load("Cached0") is first
+    cache.load("Cached1")
+    cache.load("Cached2")  # evicts Cached0
+
+    stats = cache.stats()
+    assert stats['hits'] == 1
+    assert stats['misses'] == 3
+    assert stats['evictions'] == 1
+    assert "Cached0" not in cache
+
+def test_cache_invalidates_changed_files(tmp_path):
+    """Test that a save written outside the cache is picked up"""
+    char = character_manager.create_character("Changed", "Mage")
+    character_manager.save_character(char, str(tmp_path))
+    cache = character_cache.CharacterCache(save_directory=str(tmp_path))
+    cache.load("Changed")
+
+    char['gold'] = 999
+    character_manager.save_character(char, str(tmp_path))
+
+    assert cache.load("Changed")['gold'] == 999
+    assert cache.stats()['invalidations'] == 1
+
+def test_cache_write_back(tmp_path):
+    """Test that write-back saves reach disk on flush and eviction"""
+    cache = character_cache.CharacterCache(capacity=1, mode=character_cache.WRITE_BACK,
+                                           save_directory=str(tmp_path))
+    cache.save(character_manager.create_character("Dirty0", "Rogue"))
+    assert character_manager.list_saved_characters(str(tmp_path)) == []
+
+    cache.save(character_manager.create_character("Dirty1", "Rogue"))  # evicts Dirty0
+    assert character_manager.list_saved_characters(str(tmp_path)) == ["Dirty0"]
+
+    assert cache.flush() == 1
+    assert sorted(character_manager.list_saved_characters(str(tmp_path))) == ["Dirty0", "Dirty1"]
+    assert cache.stats()['writes'] == 2
+
+def test_cache_failed_eviction_keeps_dirty_entry(tmp_path, monkeypatch):
+    """Test that a write-back entry whose eviction write fails isn't lost"""
+    cache = character_cache.CharacterCache(capacity=1, mode=character_cache.WRITE_BACK,
+                                           save_directory=str(tmp_path))
+    cache.save(character_manager.create_character("Dirty0", "Rogue"))
+
+    def full_disk(*args):
+        raise OSError("No space left on device")
+    monkeypatch.setattr(character_manager, "save_character", full_disk)
+    with pytest.raises(OSError):
+        cache.save(character_manager.create_character("Dirty1", "Rogue"))
+    assert "Dirty0" in cache and cache.stats()['dirty'] == 2
+
+    monkeypatch.undo()
+    assert cache.flush() == 2
+    assert sorted(character_manager.list_saved_characters(str(tmp_path))) == ["Dirty0", "Dirty1"]
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
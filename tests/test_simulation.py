@@ -0,0 +1,287 @@
+"""
+Test Combat Simulation
+Tests that battles can be simulated without user input
+"""
+
+import pytest
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import character_manager
+import combat_system
+import battle_simulator
+import monte_carlo
+import balance_sweep
+from rng import GameRNG
+from battle_log import (
+    BattleEvent, FanOutSink, JsonLinesSink, NullSink, PrintSink, RingBufferSink, read_events
+)
+from custom_exceptions import CharacterDeadError
+
+# ============================================================================
+# HEADLESS BATTLE TESTS
+# ============================================================================
+
+def test_headless_battle_runs_without_input():
+    """Test that a headless battle finishes and reports a winner"""
+    char = character_manager.create_character("SimTest", "Warrior")
+    enemy = combat_system.create_enemy("goblin")
+
+    battle = battle_simulator.HeadlessBattle(char, enemy)
+    result = battle.run()
+
+    assert result['winner'] == 'player'
+    assert result['turns'] == 4  # 50 HP / (15 - 8 // 4) damage per hit
+    assert result['damage_dealt'] == 50
+    assert enemy['health'] == 0
+
+def test_headless_battle_dead_character():
+    """Test that a dead character cannot start a simulated battle"""
+    char = character_manager.create_character("SimTest", "Warrior")
+    char['health'] = 0
+    battle = battle_simulator.HeadlessBattle(char, combat_system.create_enemy("orc"))
+
+    with pytest.raises(CharacterDeadError):
+        battle.run()
+
+def test_run_battles_does_not_modify_character():
+    """Test that batch simulation works on copies"""
+    char = character_manager.create_character("SimTest", "Mage")
+    battle_simulator.run_battles(char, "orc", 10)
+
+    assert char['health'] == char['max_health']
+
+# ============================================================================
+# AGGREGATION TESTS
+# ============================================================================
+
+def test_run_battles_aggregates_results():
+    """Test that results are aggregated into rates and histograms"""
+    char = character_manager.create_character("SimTest", "Rogue")
+    stats = battle_simulator.run_battles(char, "goblin", 500,
+                                         battle_simulator.special_policy)
+
+    assert stats['battles'] == 500
+    assert stats['wins'] + stats['losses'] + stats['escapes'] + stats['timeouts'] == 500
+    assert sum(stats['turns_histogram'].values()) == 500
+    assert sum(stats['damage_dealt_histogram'].values()) == 500
+    assert 0.0 <= stats['win_rate'] <= 1.0
+
+def test_deterministic_battles_match_full_simulation():
+    """Test that counting a deterministic battle once gives the same totals"""
+    char = character_manager.create_character("SimTest", "Warrior")
+    stats = battle_simulator.run_battles(char, "dragon", 1000)
+
+    assert stats['losses'] == 1000
+    assert stats['turns_histogram'] == {6: 1000}
+    assert stats['simulated'] == 1
+    rogue = character_manager.create_character("SimTest", "Rogue")
+    assert battle_simulator.run_battles(rogue, "orc", 50, battle_simulator.special_policy)['simulated'] == 50
+
+def test_run_roster_covers_all_enemies():
+    """Test that the roster includes goblin, orc and dragon"""
+    char = character_manager.create_character("SimTest", "Cleric")
+    results = battle_simulator.run_roster(char, 5)
+
+    assert set(results) == {"goblin", "orc", "dragon"}
+
+# ============================================================================
+# RNG TESTS
+# ============================================================================
+
+def test_rng_replay_and_batch_mode_match():
+    """Test that replays and batch mode give the same numbers for a seed"""
+    rng = GameRNG(163)
+    numbers = rng.draws(10)
+
+    assert rng.replay().draws(10) == numbers
+    assert GameRNG(163, block_size=4).draws(10) == numbers
+    batched = GameRNG(163, block_size=3)
+    assert [batched.random() for _ in range(10)] == numbers
+    assert GameRNG(163).spawn("cell").draws(3) == GameRNG("163:cell").draws(3)
+
+def test_rng_helpers_use_random():
+    """Test chance, choice and randint ranges"""
+    rng = GameRNG(5)
+    rolls = [rng.randint(1, 6) for _ in range(600)]
+    assert set(rolls) == {1, 2, 3, 4, 5, 6}
+    assert rng.choice(["only"]) == "only"
+    assert rng.chance(1.0) and not rng.chance(0.0)
+
+def test_battle_replays_from_seed():
+    """Test that a random battle can be replayed from its recorded seed"""
+    rogue = character_manager.create_character("SimTest", "Rogue")
+
+    def fight(rng=None):
+        battle = battle_simulator.HeadlessBattle(dict(rogue), combat_system.create_enemy("dragon"),
+                                                 battle_simulator.special_policy, rng)
+        return battle.run()
+
+    first = fight()
+    assert fight(GameRNG(first['seed'])) == first
+
+def test_run_battles_seeded():
+    """Test that run_battles is reproducible from a seed and uses the rng"""
+    rogue = character_manager.create_character("SimTest", "Rogue")
+    policy = battle_simulator.special_policy
+
+    first = battle_simulator.run_battles(rogue, "orc", 200, policy, GameRNG(1))
+    again = battle_simulator.run_battles(rogue, "orc", 200, policy, GameRNG(1, block_size=64))
+    other = battle_simulator.run_battles(rogue, "orc", 200, policy, GameRNG(2))
+
+    assert first['turns_histogram'] == again['turns_histogram']
+    assert first['seed'] == 1
+    assert first['turns_histogram'] != other['turns_histogram']
+
+def test_escape_uses_battle_rng():
+    """Test that attempt_escape draws from the battle's generator"""
+    char = character_manager.create_character("SimTest", "Warrior")
+    battle = combat_system.SimpleBattle(char, combat_system.create_enemy("orc"), GameRNG(3))
+    expected = [value < 0.5 for value in GameRNG(3).draws(20)]
+
+    assert [battle.attempt_escape() for _ in range(20)] == expected
+
+# ============================================================================
+# BATTLE LOG TESTS
+# ============================================================================
+
+def test_headless_battle_events():
+    """Test the structured events of a simple deterministic battle"""
+    char = character_manager.create_character("SimTest", "Warrior")
+    ring = RingBufferSink()
+    battle = battle_simulator.HeadlessBattle(char, combat_system.create_enemy("goblin"), sink=ring)
+    battle.run()
+    events = ring.events()
+
+    assert events[0] == BattleEvent(1, "player", "attack", 13, 37,
+                                    "You attack the Goblin for 13 damage!")
+    assert events[1][:5] == (1, "enemy", "attack", 5, 115)
+    assert [event.hp_after for event in events if event.actor == "player"] == [37, 24, 11, 0]
+    assert len(events) == 7  # the goblin doesn't attack after dying
+
+def test_print_sink_shows_messages(capsys):
+    """Test that PrintSink shows each event's message through its display function"""
+    shown = []
+    sink = PrintSink(shown.append)
+    sink.emit(BattleEvent(1, "player", "attack", 13, 37, "You attack!"))
+    assert shown == ["You attack!"]
+
+    PrintSink().emit(BattleEvent(1, "enemy", "attack", 5, 115, "It bites!"))
+    assert capsys.readouterr().out == "It bites!\n"
+
+def test_ring_buffer_keeps_latest():
+    """Test that the ring buffer drops the oldest events"""
+    ring = RingBufferSink(capacity=3)
+    for turn in range(1, 6):
+        ring.emit(BattleEvent(turn, "player", "attack", 1, 10, ""))
+    assert [event.turn for event in ring.events()] == [3, 4, 5]
+
+def test_json_lines_sink_round_trip(tmp_path):
+    """Test that buffered JSON-lines output reads back as the same events"""
+    filename = str(tmp_path / "battle.jsonl")
+    rogue = character_manager.create_character("SimTest", "Rogue")
+    ring = RingBufferSink(capacity=100000)
+    with JsonLinesSink(filename, buffer_size=7) as writer:
+        battle_simulator.run_battles(rogue, "orc", 20, battle_simulator.special_policy,
+                                     GameRNG(4), FanOutSink(writer, ring, NullSink()))
+    assert read_events(filename) == ring.events()
+    assert {event.action for event in ring.events()} == {"special", "attack"}
+
+def test_simple_battle_prints_through_sink(monkeypatch, capsys):
+    """Test that SimpleBattle shows events with display_battle_log by default"""
+    char = character_manager.create_character("SimTest", "Warrior")
+    monkeypatch.setattr("builtins.input", lambda prompt="": "1")
+    battle = combat_system.SimpleBattle(char, combat_system.create_enemy("goblin"))
+    assert battle.start_battle()['winner'] == 'player'
+    assert ">>> You attack the Goblin for 13 damage!" in capsys.readouterr().out
+
+def test_null_sink_builds_no_events(monkeypatch, capsys):
+    """Test that a NullSink battle logs and prints nothing"""
+    char = character_manager.create_character("SimTest", "Warrior")
+    monkeypatch.setattr("builtins.input", lambda prompt="": "1")
+    battle = combat_system.SimpleBattle(char, combat_system.create_enemy("goblin"),
+                                        sink=NullSink())
+    battle.start_battle()
+    assert battle.emit is None
+    assert ">>>" not in capsys.readouterr().out
+
+# ============================================================================
+# MONTE CARLO TESTS
+# ============================================================================
+
+def test_monte_carlo_matches_headless_battle():
+    """Test that the array engine agrees with the scalar simulator"""
+    pytest.importorskip("numpy")
+    char = character_manager.create_character("SimTest", "Warrior")
+
+    result = monte_carlo.simulate_battles(char, "goblin", 100)
+    assert result['win_probability'] == 1.0
+    assert result['mean_turns'] == 4.0
+
+    result = monte_carlo.simulate_battles(char, "dragon", 100)
+    assert result['loss_probability'] == 1.0
+
+def test_monte_carlo_random_branches():
+    """Test that rogue crits and escapes happen about half the time"""
+    pytest.importorskip("numpy")
+    rogue = character_manager.create_character("SimTest", "Rogue")
+
+    result = monte_carlo.simulate_battles(rogue, "goblin", 20000,
+                                          battle_simulator.SPECIAL, seed=7)
+    distribution = result['turns_distribution']
+    assert distribution.sum() == 20000
+    assert len(distribution) > 3  # crits make the fight length vary
+
+    result = monte_carlo.simulate_battles(rogue, "goblin", 20000,
+                                          battle_simulator.RUN, seed=7)
+    first_turn_escapes = result['turns_distribution'][1] / 20000
+    assert 0.45 < first_turn_escapes < 0.55
+
+def test_monte_carlo_class_matchups():
+    """Test per-class results and seeded reproducibility"""
+    pytest.importorskip("numpy")
+
+    first = monte_carlo.simulate_class_matchups("orc", 1000, seed=42)
+    second = monte_carlo.simulate_class_matchups("orc", 1000, seed=42)
+
+    assert set(first) == {"Warrior", "Mage", "Rogue", "Cleric"}
+    assert first["Rogue"]['mean_turns'] == second["Rogue"]['mean_turns']
+    assert first["Cleric"]['timeout_probability'] == 1.0  # heals forever
+
+# ============================================================================
+# BALANCE SWEEP TESTS
+# ============================================================================
+
+def test_leveled_character_stats():
+    """Test that leveled characters get stats from gain_experience"""
+    char = character_manager.create_character_at_level("SweepTest", "Warrior", 5)
+
+    assert char['level'] == 5
+    assert char['max_health'] == 120 + 4 * 10
+    assert char['strength'] == 15 + 4 * 2
+
+def test_sweep_reproducible_across_workers():
+    """Test that worker count and shard size do not change results"""
+    options = {'battles': 50, 'seed': 9, 'levels': [1, 10],
+               'policy': battle_simulator.special_policy}
+
+    single = balance_sweep.run_sweep(workers=1, shard_size=4, **options)
+    pooled = balance_sweep.run_sweep(workers=2, shard_size=3, **options)
+
+    assert len(single) == 4 * 2 * 3
+    assert single == pooled
+
+def test_sweep_writes_results_table(tmp_path):
+    """Test that sweep results are written as a CSV table"""
+    rows = balance_sweep.run_sweep(battles=5, workers=1, levels=[1], enemies=["goblin"])
+    filename = tmp_path / "sweep.csv"
+
+    assert balance_sweep.write_results(rows, str(filename)) == True
+    lines = filename.read_text().splitlines()
+    assert lines[0] == ",".join(balance_sweep.RESULT_COLUMNS)
+    assert len(lines) == 1 + 4
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])